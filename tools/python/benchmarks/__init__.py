@@ -0,0 +1 @@
+"""Microbenchmarks for Stripe Agent Toolkit's hot paths."""
@@ -0,0 +1,62 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks [--filter NAME] [--output results.json]
+        [--baseline baseline.json] [--threshold 1.25] [--quick]
+
+Exits with status 1 if any benchmark is slower than `threshold` times its
+baseline median.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from . import bench_adapters, bench_client, bench_schema
+from .harness import DEFAULT_THRESHOLD, Suite, compare, load, save
+
+MODULES = (bench_client, bench_schema, bench_adapters)
+
+
+async def run_all(suite: Suite) -> None:
+    for module in MODULES:
+        await module.run(suite)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--filter", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--output", help="write results as JSON here")
+    parser.add_argument("--baseline", help="compare against this report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown ratio counted as a regression",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="fewer iterations, for CI"
+    )
+    args = parser.parse_args(argv)
+
+    suite = Suite(pattern=args.filter, quick=args.quick)
+    asyncio.run(run_all(suite))
+    report = suite.report()
+
+    if args.output:
+        save(args.output, report)
+    if args.baseline:
+        regressions = compare(report, load(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): "
+                  + ", ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
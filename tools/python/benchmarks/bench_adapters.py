@@ -0,0 +1,50 @@
+"""Benchmarks for each framework adapter's tool conversion."""
+
+import importlib
+from typing import Any
+
+from stripe_agent_toolkit.testing import synthetic_tools
+
+from .harness import Suite
+
+# Adapters whose framework is not installed are skipped
+ADAPTERS = ("openai", "langchain", "crewai", "strands")
+
+CATALOG_SIZES = (25, 100)
+
+
+async def run(suite: Suite) -> None:
+    for adapter in ADAPTERS:
+        try:
+            module: Any = importlib.import_module(
+                f"stripe_agent_toolkit.{adapter}.toolkit"
+            )
+        except ImportError:
+            print(f"skipping {adapter}: framework not installed")
+            continue
+
+        toolkit = module.StripeAgentToolkit("rk_test_benchmark")
+        for size in CATALOG_SIZES:
+            tools = synthetic_tools(size)
+
+            def convert() -> None:
+                # Start cold: conversions are otherwise reused
+                toolkit._converted = {}
+                toolkit._convert_tools(tools)
+
+            await suite.measure(
+                f"{adapter}._convert_tools[tools={size}]",
+                convert,
+                ops=1,
+                rounds=5,
+            )
+
+        # What get_tool() pays for one tool, however large the catalog
+        tool = synthetic_tools(1)[0]
+
+        def convert_one() -> None:
+            toolkit._convert_tool(tool)
+
+        await suite.measure(
+            f"{adapter}._convert_tool", convert_one, ops=1, rounds=5
+        )
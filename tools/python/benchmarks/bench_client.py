@@ -0,0 +1,110 @@
+"""Benchmarks for StripeMcpClient and ToolkitCore against the stub server."""
+
+import itertools
+import json
+import tempfile
+from typing import List
+
+from stripe_agent_toolkit.shared.mcp_client import McpTool, StripeMcpClient
+from stripe_agent_toolkit.shared.toolkit_core import ToolkitCore
+from stripe_agent_toolkit.testing import StubMcpServer
+
+from .harness import Suite
+
+SECRET_KEY = "rk_test_benchmark"
+
+
+class _NameToolkit(ToolkitCore[List[str]]):
+    """Toolkit with trivial tool conversion, to time the shared path."""
+
+    def _empty_tools(self) -> List[str]:
+        return []
+
+    def _convert_tools(self, mcp_tools: List[McpTool]) -> List[str]:
+        return [t["name"] for t in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> str:
+        return mcp_tool["name"]
+
+
+async def run(suite: Suite) -> None:
+    stub = StubMcpServer(seed=0, structured_content=True)
+
+    # In-memory sessions: the client's own overhead, without HTTP
+    client = StripeMcpClient(
+        {"secret_key": SECRET_KEY, "transport": stub.transport()}
+    )
+    await client.connect()
+    await _call_tool_benchmarks(suite, "memory", client)
+    await client.disconnect()
+
+    with stub:
+        client = StripeMcpClient(
+            {"secret_key": SECRET_KEY, "server_url": stub.url}
+        )
+        await client.connect()
+        await _call_tool_benchmarks(suite, "http", client)
+        await client.disconnect()
+
+        async def initialize() -> None:
+            toolkit = _NameToolkit(
+                SECRET_KEY, {"mcp_server_url": stub.url}
+            )
+            await toolkit.initialize()
+            await toolkit.close()
+
+        await suite.measure(
+            "toolkit.initialize[http]", initialize, ops=5, rounds=5
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            async def initialize_cached() -> None:
+                toolkit = _NameToolkit(SECRET_KEY, {
+                    "mcp_server_url": stub.url,
+                    "catalog_cache": {"directory": directory},
+                })
+                await toolkit.initialize()
+                await toolkit.close()
+
+            await suite.measure(
+                "toolkit.initialize[http,catalog_cache]",
+                initialize_cached,
+                ops=5,
+                rounds=5,
+            )
+
+
+async def _call_tool_benchmarks(
+    suite: Suite, transport: str, client: StripeMcpClient
+) -> None:
+    async def read() -> None:
+        await client.call_tool("list_customers", {"limit": 3})
+
+    async def write() -> None:
+        await client.call_tool("create_customer", {"name": "Jenny"})
+
+    calls = itertools.count()
+
+    async def distinct_read() -> None:
+        # Distinct arguments, so concurrent reads are not coalesced
+        await client.call_tool(
+            "list_customers", {"email": f"{next(calls)}@example.com"}
+        )
+
+    async def parse_text() -> None:
+        json.loads(await client.call_tool("list_customers", {"limit": 100}))
+
+    async def structured() -> None:
+        result = await client.call_tool_result(
+            "list_customers", {"limit": 100}
+        )
+        result.data
+
+    await suite.measure(f"call_tool.read[{transport}]", read)
+    await suite.measure(f"call_tool.write[{transport}]", write)
+    await suite.measure(f"call_tool.json_loads[{transport}]", parse_text)
+    await suite.measure(f"call_tool_result.data[{transport}]", structured)
+    for concurrency in (8, 64):
+        await suite.measure_concurrent(
+            f"call_tool.read[{transport}]", distinct_read, concurrency
+        )
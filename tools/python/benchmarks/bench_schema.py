@@ -0,0 +1,29 @@
+"""Benchmarks for JSON Schema to Pydantic model conversion."""
+
+from stripe_agent_toolkit.shared.schema_utils import (
+    json_schema_to_pydantic_model,
+)
+from stripe_agent_toolkit.testing import synthetic_tools
+
+from .harness import Suite
+
+CATALOG_SIZES = (10, 50, 100, 500)
+
+
+async def run(suite: Suite) -> None:
+    for size in CATALOG_SIZES:
+        tools = synthetic_tools(size)
+
+        def convert_catalog() -> None:
+            for tool in tools:
+                json_schema_to_pydantic_model(
+                    tool.get("inputSchema"),
+                    model_name=f"{tool['name']}_args",
+                )
+
+        await suite.measure(
+            f"json_schema_to_pydantic_model[tools={size}]",
+            convert_catalog,
+            ops=1,
+            rounds=5,
+        )
@@ -0,0 +1,200 @@
+"""Timing, result storage and baseline comparison for the benchmarks."""
+
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from stripe_agent_toolkit import VERSION
+
+Operation = Callable[[], Union[None, Awaitable[None]]]
+
+DEFAULT_THRESHOLD = 1.25
+
+
+class BenchmarkResult:
+    """Per-operation timings of one benchmark, in seconds."""
+
+    def __init__(self, name: str, samples: List[float], ops: int):
+        self.name = name
+        self.samples = samples
+        self.ops = ops
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "ops_per_round": self.ops,
+            "rounds": len(self.samples),
+            "min": ordered[0],
+            "median": self.median,
+            "mean": statistics.fmean(ordered),
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "stdev": (
+                statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+            ),
+        }
+
+
+class Suite:
+    """
+    Collects benchmark results.
+
+    Each benchmark runs `ops` operations per round, for `rounds` rounds
+    after `warmup` untimed rounds, and records the time per operation.
+    The median across rounds is what gets compared against the baseline.
+    """
+
+    def __init__(self, pattern: Optional[str] = None, quick: bool = False):
+        self._pattern = pattern
+        self._quick = quick
+        self.results: Dict[str, BenchmarkResult] = {}
+
+    def wants(self, name: str) -> bool:
+        return self._pattern is None or self._pattern in name
+
+    async def measure(
+        self,
+        name: str,
+        operation: Operation,
+        ops: int = 100,
+        rounds: int = 10,
+        warmup: int = 1,
+    ) -> None:
+        """Time a sync or async operation, run `ops` times per round."""
+        if not self.wants(name):
+            return
+        ops, rounds, warmup = self._scale(ops, rounds, warmup)
+
+        samples = []
+        for i in range(warmup + rounds):
+            start = time.perf_counter()
+            for _ in range(ops):
+                pending = operation()
+                if pending is not None:
+                    await pending
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                samples.append(elapsed / ops)
+        self._record(name, samples, ops)
+
+    async def measure_concurrent(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[None]],
+        concurrency: int,
+        ops: int = 200,
+        rounds: int = 5,
+        warmup: int = 1,
+    ) -> None:
+        """
+        Time an async operation run `ops` times per round, `concurrency`
+        at a time. The time per operation is the inverse of throughput.
+        """
+        name = f"{name}[concurrency={concurrency}]"
+        if not self.wants(name):
+            return
+        ops, rounds, warmup = self._scale(ops, rounds, warmup)
+
+        async def one(semaphore: asyncio.Semaphore) -> None:
+            async with semaphore:
+                await operation()
+
+        samples = []
+        for i in range(warmup + rounds):
+            semaphore = asyncio.Semaphore(concurrency)
+            start = time.perf_counter()
+            await asyncio.gather(*(one(semaphore) for _ in range(ops)))
+            elapsed = time.perf_counter() - start
+            if i >= warmup:
+                samples.append(elapsed / ops)
+        self._record(name, samples, ops)
+
+    def _scale(
+        self, ops: int, rounds: int, warmup: int
+    ) -> Tuple[int, int, int]:
+        if not self._quick:
+            return ops, rounds, warmup
+        return max(1, ops // 10), min(rounds, 3), min(warmup, 1)
+
+    def _record(self, name: str, samples: List[float], ops: int) -> None:
+        result = BenchmarkResult(name, samples, ops)
+        self.results[name] = result
+        print(f"{name:<60} {_format(result.median):>12}/op", flush=True)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "version": VERSION,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "benchmarks": {
+                name: result.to_dict()
+                for name, result in sorted(self.results.items())
+            },
+        }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Compare median timings against a baseline report.
+
+    Prints a table and returns the names of benchmarks slower than
+    `threshold` times their baseline.
+    """
+    regressions = []
+    base = baseline.get("benchmarks", {})
+    print(
+        f"\n{'benchmark':<60} {'baseline':>12} {'current':>12} "
+        f"{'ratio':>7}"
+    )
+    for name, result in current["benchmarks"].items():
+        if name not in base:
+            continue
+        before, after = base[name]["median"], result["median"]
+        ratio = after / before if before else float("inf")
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(
+            f"{name:<60} {_format(before):>12} {_format(after):>12} "
+            f"{ratio:>6.2f}x{flag}"
+        )
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(path: str, report: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
@@ -1,7 +1,34 @@
 """Stripe Agent Toolkit - MCP-based toolkit for AI agent frameworks."""
 
-from .configuration import Configuration, Context
+from .configuration import (
+    CatalogCacheConfig,
+    CircuitBreakerConfig,
+    Configuration,
+    Context,
+    HedgeConfig,
+    PoolConfig,
+    RateLimitConfig,
+    ResultCacheConfig,
+    RetryConfig,
+    TimeoutConfig,
+    ToolFilterConfig,
+    WarmUpConfig,
+)
 from .shared.constants import VERSION
 
-__all__ = ["Configuration", "Context", "VERSION"]
+__all__ = [
+    "CatalogCacheConfig",
+    "CircuitBreakerConfig",
+    "Configuration",
+    "Context",
+    "HedgeConfig",
+    "PoolConfig",
+    "RateLimitConfig",
+    "ResultCacheConfig",
+    "RetryConfig",
+    "TimeoutConfig",
+    "ToolFilterConfig",
+    "VERSION",
+    "WarmUpConfig",
+]
 __version__ = VERSION
@@ -1,8 +1,13 @@
 """Configuration types for Stripe Agent Toolkit."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 from typing_extensions import TypedDict
 
+if TYPE_CHECKING:
+    from .shared.instrumentation import Instrumentation
+    from .shared.metrics import MetricsRegistry
+    from .shared.transports import Transport
+
 
 class Context(TypedDict, total=False):
     """Context for MCP connection."""
@@ -11,6 +16,106 @@ class Context(TypedDict, total=False):
     mode: Optional[str]
 
 
+class PoolConfig(TypedDict, total=False):
+    """Configuration for the pool of long-lived MCP sessions."""
+    min_size: int
+    max_size: int
+    idle_timeout: float
+    health_check_interval: float
+    max_requests_per_session: int
+
+
+class CatalogCacheConfig(TypedDict, total=False):
+    """Configuration for the on-disk tool catalog cache."""
+    directory: Optional[str]
+    ttl: float
+
+
+class ToolFilterConfig(TypedDict, total=False):
+    """Tool names or glob patterns to expose, or to hide."""
+    allow: List[str]
+    deny: List[str]
+
+
+class ResultCacheConfig(TypedDict, total=False):
+    """Configuration for the read-through tool result cache."""
+    ttl: float
+    max_entries: int
+    max_bytes: int
+    tools: Optional[List[str]]
+
+
+class RetryConfig(TypedDict, total=False):
+    """Configuration for retrying transient tool call failures."""
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    budget_ratio: float
+    # Also retry mutating tools after failures that may have reached the
+    # server (dropped connections, 5xx, attempt timeouts)
+    retry_writes: bool
+
+
+class RateLimitConfig(TypedDict, total=False):
+    """Configuration for client-side rate limiting per Stripe account."""
+    read_rate: float
+    write_rate: float
+    read_burst: float
+    write_burst: float
+
+
+class TimeoutConfig(TypedDict, total=False):
+    """Configuration for tool call timeouts, in seconds."""
+    call_timeout: float
+    attempt_timeout: float
+
+
+class HedgeConfig(TypedDict, total=False):
+    """Configuration for hedging slow read-only tool calls."""
+    delay: float
+    percentile: float
+    min_delay: float
+    budget_ratio: float
+    window_size: int
+    minimum_calls: int
+
+
+class WarmUpConfig(TypedDict, total=False):
+    """Configuration for pre-opening MCP sessions."""
+    on_initialize: bool
+    sessions: int
+    interval: float
+
+
+class CircuitBreakerConfig(TypedDict, total=False):
+    """Configuration for the circuit breaker around the MCP endpoint."""
+    failure_rate_threshold: float
+    slow_call_threshold: float
+    slow_call_rate_threshold: float
+    window_size: int
+    minimum_calls: int
+    probe_interval: float
+
+
 class Configuration(TypedDict, total=False):
     """Configuration for Stripe Agent Toolkit."""
     context: Optional[Context]
+    mcp_server_url: Optional[str]
+    transport: Optional["Transport"]
+    share_client: Optional[bool]
+    tool_filter: Optional[ToolFilterConfig]
+    catalog_refresh_interval: Optional[float]
+    pool: Optional[PoolConfig]
+    max_concurrency: Optional[int]
+    max_account_pools: Optional[int]
+    catalog_cache: Optional[CatalogCacheConfig]
+    result_cache: Optional[ResultCacheConfig]
+    coalesce_reads: Optional[bool]
+    retry: Optional[RetryConfig]
+    rate_limit: Optional[RateLimitConfig]
+    timeouts: Optional[TimeoutConfig]
+    circuit_breaker: Optional[CircuitBreakerConfig]
+    hedging: Optional[HedgeConfig]
+    warm_up: Optional[WarmUpConfig]
+    instrumentation: Optional[List["Instrumentation"]]
+    metrics: Optional["MetricsRegistry"]
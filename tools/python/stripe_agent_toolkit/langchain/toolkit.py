@@ -1,12 +1,13 @@
 """Stripe Agent Toolkit for LangChain."""
 
-import asyncio
 from typing import List, Optional, Any, Type, Callable, Awaitable
 
 from pydantic import BaseModel
 from langchain.tools import BaseTool
 
 from ..shared.toolkit_core import ToolkitCore
+from ..shared.errors import McpTimeoutError
+from ..shared.loop_bridge import run_sync
 from ..shared.mcp_client import McpTool
 from ..shared.schema_utils import json_schema_to_pydantic_model
 from ..configuration import Configuration
@@ -22,25 +23,16 @@ class StripeTool(BaseTool):
     args_schema: Optional[Type[BaseModel]] = None
 
     def _run(self, **kwargs: Any) -> str:
-        """Synchronous execution - wraps async call."""
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, create a new loop
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(
-                    asyncio.run,
-                    self.run_tool(self.method, kwargs)
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(
-                self.run_tool(self.method, kwargs)
-            )
+        """Synchronous execution - runs the async call on the loop bridge."""
+        return run_sync(self._arun(**kwargs))
 
     async def _arun(self, **kwargs: Any) -> str:
         """Async execution via MCP."""
-        return await self.run_tool(self.method, kwargs)
+        try:
+            return await self.run_tool(self.method, kwargs)
+        except McpTimeoutError as e:
+            # Let the agent see the timeout and decide what to do next
+            return f"Error: {e}"
 
 
 class StripeAgentToolkit(ToolkitCore[List[StripeTool]]):
@@ -72,22 +64,23 @@ class StripeAgentToolkit(ToolkitCore[List[StripeTool]]):
         mcp_tools: List[McpTool]
     ) -> List[StripeTool]:
         """Convert MCP tools to LangChain StripeTool instances."""
-        tools = []
-        for mcp_tool in mcp_tools:
-            # Convert JSON Schema to Pydantic model
-            args_schema = json_schema_to_pydantic_model(
-                mcp_tool.get("inputSchema"),
-                model_name=f"{mcp_tool['name']}_args"
-            )
-
-            tools.append(StripeTool(
-                run_tool=self.run_tool,
-                method=mcp_tool["name"],
-                name=mcp_tool["name"],
-                description=mcp_tool.get("description", mcp_tool["name"]),
-                args_schema=args_schema,
-            ))
-        return tools
+        return [self._tool(mcp_tool) for mcp_tool in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> StripeTool:
+        """Convert one MCP tool to a LangChain StripeTool."""
+        # Convert JSON Schema to Pydantic model
+        args_schema = json_schema_to_pydantic_model(
+            mcp_tool.get("inputSchema"),
+            model_name=f"{mcp_tool['name']}_args"
+        )
+
+        return StripeTool(
+            run_tool=self.run_tool,
+            method=mcp_tool["name"],
+            name=mcp_tool["name"],
+            description=mcp_tool.get("description", mcp_tool["name"]),
+            args_schema=args_schema,
+        )
 
     @property
     def tools(self) -> List[StripeTool]:
@@ -7,6 +7,7 @@ from agents import FunctionTool
 from agents.run_context import RunContextWrapper
 
 from ..shared.toolkit_core import ToolkitCore
+from ..shared.errors import McpTimeoutError
 from ..shared.mcp_client import McpTool
 from ..configuration import Configuration
 
@@ -40,10 +41,11 @@ class StripeAgentToolkit(ToolkitCore[List[FunctionTool]]):
         mcp_tools: List[McpTool]
     ) -> List[FunctionTool]:
         """Convert MCP tools to OpenAI FunctionTool instances."""
-        tools = []
-        for mcp_tool in mcp_tools:
-            tools.append(self._create_function_tool(mcp_tool))
-        return tools
+        return [self._tool(mcp_tool) for mcp_tool in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> FunctionTool:
+        """Convert one MCP tool to an OpenAI FunctionTool."""
+        return self._create_function_tool(mcp_tool)
 
     def _create_function_tool(self, mcp_tool: McpTool) -> FunctionTool:
         """Create a FunctionTool from an MCP tool definition."""
@@ -55,7 +57,11 @@ class StripeAgentToolkit(ToolkitCore[List[FunctionTool]]):
             input_str: str
         ) -> str:
             args = json.loads(input_str)
-            return await toolkit.run_tool(tool_name, args)
+            try:
+                return await toolkit.run_tool(tool_name, args)
+            except McpTimeoutError as e:
+                # Let the agent see the timeout and decide what to do next
+                return f"Error: {e}"
 
         # Prepare parameters schema
         parameters = dict(mcp_tool.get("inputSchema", {}))
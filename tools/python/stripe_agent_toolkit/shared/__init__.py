@@ -2,9 +2,57 @@
 
 from .constants import VERSION, MCP_SERVER_URL, TOOLKIT_HEADER, MCP_HEADER
 from .async_initializer import AsyncInitializer
-from .mcp_client import StripeMcpClient, McpTool, McpToolInputSchema
+from .mcp_client import (
+    StripeMcpClient,
+    McpTool,
+    McpToolInputSchema,
+    BatchToolCall,
+    BatchToolResult,
+)
+from .client_registry import ClientRegistry, client_registry
+from .session_pool import SessionPool, WarmUpReport
+from .transports import (
+    Transport,
+    StreamableHttpTransport,
+    StdioTransport,
+    InMemoryTransport,
+)
+from .concurrency import ConcurrencyLimiter
+from .loop_bridge import LoopBridge, default_loop_bridge, run_sync
+from .catalog_cache import CatalogCache
+from .result_cache import ResultCache, ResultCacheStats
+from .tool_result import ToolResult
+from .single_flight import SingleFlight
+from .errors import (
+    StripeMcpError,
+    McpTransportError,
+    McpRateLimitError,
+    McpServerError,
+    McpTimeoutError,
+    McpToolError,
+    CircuitOpenError,
+)
+from .circuit_breaker import CircuitBreaker, CircuitBreakerStats, CircuitState
+from .deadline import current_deadline, deadline_scope
+from .account import account_scope, current_account
+from .instrumentation import (
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    Phase,
+    PhaseEvent,
+)
+from .metrics import (
+    MetricsRegistry,
+    MetricSnapshot,
+    MetricSample,
+    HistogramSample,
+    PROMETHEUS_CONTENT_TYPE,
+)
+from .retry import RetryPolicy
+from .hedging import HedgePolicy, HedgeStats
+from .rate_limit import RateLimiter, RateLimiterStats, TokenBucket
 from .schema_utils import json_schema_to_pydantic_model, json_schema_to_pydantic_fields
-from .toolkit_core import ToolkitCore
+from .toolkit_core import ToolkitCore, CatalogDiff
 
 __all__ = [
     "VERSION",
@@ -15,7 +63,56 @@ __all__ = [
     "StripeMcpClient",
     "McpTool",
     "McpToolInputSchema",
+    "BatchToolCall",
+    "BatchToolResult",
+    "ClientRegistry",
+    "client_registry",
+    "SessionPool",
+    "WarmUpReport",
+    "Transport",
+    "StreamableHttpTransport",
+    "StdioTransport",
+    "InMemoryTransport",
+    "ConcurrencyLimiter",
+    "LoopBridge",
+    "default_loop_bridge",
+    "run_sync",
+    "CatalogCache",
+    "ResultCache",
+    "ResultCacheStats",
+    "ToolResult",
+    "SingleFlight",
+    "StripeMcpError",
+    "McpTransportError",
+    "McpRateLimitError",
+    "McpServerError",
+    "McpTimeoutError",
+    "McpToolError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "current_deadline",
+    "deadline_scope",
+    "account_scope",
+    "current_account",
+    "Instrumentation",
+    "OpenTelemetryInstrumentation",
+    "Phase",
+    "PhaseEvent",
+    "MetricsRegistry",
+    "MetricSnapshot",
+    "MetricSample",
+    "HistogramSample",
+    "PROMETHEUS_CONTENT_TYPE",
+    "RetryPolicy",
+    "HedgePolicy",
+    "HedgeStats",
+    "RateLimiter",
+    "RateLimiterStats",
+    "TokenBucket",
     "json_schema_to_pydantic_model",
     "json_schema_to_pydantic_fields",
     "ToolkitCore",
+    "CatalogDiff",
 ]
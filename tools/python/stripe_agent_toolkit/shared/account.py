@@ -0,0 +1,34 @@
+"""Per-call Stripe account selection for Connect platforms."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Connected account that tool calls in the current context act on
+_account: ContextVar[Optional[str]] = ContextVar(
+    "stripe_agent_toolkit_account", default=None
+)
+
+
+def current_account() -> Optional[str]:
+    """The account set by the innermost enclosing account_scope, if any."""
+    return _account.get()
+
+
+@contextmanager
+def account_scope(account: Optional[str]) -> Iterator[None]:
+    """
+    Make every tool call within the block act on a connected account,
+    sent as the Stripe-Account header. Tasks started within the block
+    inherit it. An account passed to call_tool or run_tool takes
+    precedence.
+
+    Example:
+        with account_scope("acct_123"):
+            invoices = await toolkit.run_tool("list_invoices", {})
+    """
+    token = _account.set(account)
+    try:
+        yield
+    finally:
+        _account.reset(token)
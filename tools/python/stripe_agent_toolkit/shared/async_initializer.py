@@ -1,19 +1,31 @@
 """Async initialization utility for Stripe Agent Toolkit."""
 
 import asyncio
+import concurrent.futures
+import os
+import weakref
 from typing import Callable, Awaitable, Optional
 
+from .locks import fork_safe_lock
+
 
 class AsyncInitializer:
     """
     A reusable utility for async initialization with future locking.
     Ensures initialization runs only once, even if called concurrently.
+
+    Safe to use from several threads and event loops: callers that find
+    an initialization in progress wait for it from their own loop rather
+    than starting another. In a forked child, completed initialization
+    carries over from the parent, and one that was in progress there is
+    forgotten, since it can never finish in the child.
     """
 
     def __init__(self) -> None:
         self._initialized: bool = False
-        self._init_future: Optional[asyncio.Future[None]] = None
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._init_future: Optional[concurrent.futures.Future[None]] = None
+        self._lock = fork_safe_lock()
+        _initializers.add(self)
 
     async def initialize(
         self, do_initialize: Callable[[], Awaitable[None]]
@@ -33,32 +45,56 @@ class AsyncInitializer:
             Exception: Re-raises any exception from do_initialize,
                 allowing retry on next call.
         """
-        if self._initialized:
-            return
+        while not self._initialized:
+            with self._lock:
+                # Double-check after acquiring lock
+                if self._initialized:
+                    return
+                future = self._init_future
+                if future is None:
+                    # Create a new future for this initialization attempt
+                    future = concurrent.futures.Future()
+                    self._init_future = future
+                    owner = True
+                else:
+                    owner = False
 
-        async with self._lock:
-            # Double-check after acquiring lock
-            if self._initialized:
+            if owner:
+                await self._run(do_initialize, future)
                 return
 
-            if self._init_future is not None:
-                # Another coroutine is initializing, wait for it
-                await self._init_future
-                return
+            # Another coroutine is initializing, possibly on another
+            # loop or thread; wait for it. If it was cancelled rather
+            # than failed, loop round and take over.
+            await asyncio.shield(asyncio.wrap_future(future))
 
-            # Create a new future for this initialization attempt
-            loop = asyncio.get_running_loop()
-            self._init_future = loop.create_future()
-
-            try:
-                await do_initialize()
-                self._initialized = True
-                self._init_future.set_result(None)
-            except Exception as e:
-                # Reset future on failure to allow retry
-                self._init_future.set_exception(e)
+    async def _run(
+        self,
+        do_initialize: Callable[[], Awaitable[None]],
+        future: "concurrent.futures.Future[None]",
+    ) -> None:
+        try:
+            await do_initialize()
+        except Exception as e:
+            self._finish(future, initialized=False)
+            future.set_exception(e)
+            raise
+        except BaseException:
+            # Cancelled: release the waiters to retry themselves
+            self._finish(future, initialized=False)
+            future.set_result(None)
+            raise
+        self._finish(future, initialized=True)
+        future.set_result(None)
+
+    def _finish(
+        self, future: "concurrent.futures.Future[None]", initialized: bool
+    ) -> None:
+        with self._lock:
+            # A reset() meanwhile has superseded this attempt
+            if self._init_future is future:
+                self._initialized = initialized
                 self._init_future = None
-                raise
 
     @property
     def is_initialized(self) -> bool:
@@ -67,5 +103,23 @@ class AsyncInitializer:
 
     def reset(self) -> None:
         """Reset the initializer state. Used during close/cleanup."""
-        self._initialized = False
+        with self._lock:
+            self._initialized = False
+            self._init_future = None
+
+    def _after_fork(self) -> None:
+        # An attempt in flight in a parent thread can never finish here;
+        # the lock itself is reinitialized by the locks module
         self._init_future = None
+
+
+_initializers: "weakref.WeakSet[AsyncInitializer]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    for initializer in list(_initializers):
+        initializer._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,129 @@
+"""Persistent tool catalog cache for Stripe Agent Toolkit."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, List, Optional
+
+from .constants import VERSION
+
+DEFAULT_CATALOG_TTL = 24 * 60 * 60.0
+
+
+def default_cache_directory() -> str:
+    """Return the per-user cache directory for the toolkit."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "stripe-agent-toolkit")
+
+
+def key_fingerprint(secret_key: str) -> str:
+    """One-way fingerprint of an API key, safe to persist or log."""
+    return hashlib.sha256(secret_key.encode("utf-8")).hexdigest()[:16]
+
+
+class CatalogCache:
+    """
+    On-disk cache of MCP tool catalogs.
+
+    Entries are keyed by server URL, account, mode, toolkit VERSION and a
+    fingerprint of the API key (restricted keys expose different tools).
+    Each entry is a small JSON file written atomically, so concurrent
+    workers sharing a cache directory never observe partial writes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = DEFAULT_CATALOG_TTL,
+    ):
+        self._directory = directory or default_cache_directory()
+        self._ttl = ttl
+
+    @property
+    def directory(self) -> str:
+        """Directory the catalog files are stored in."""
+        return self._directory
+
+    def key(
+        self,
+        server_url: str,
+        secret_key: str,
+        account: Optional[str] = None,
+        mode: Optional[str] = None,
+    ) -> str:
+        """Build the cache key for a catalog."""
+        parts = [
+            server_url,
+            account or "",
+            mode or "",
+            VERSION,
+            key_fingerprint(secret_key),
+        ]
+        return hashlib.sha256(
+            json.dumps(parts).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"catalog-{key}.json")
+
+    def load(self, key: str) -> Optional[List[Any]]:
+        """
+        Load a cached catalog.
+
+        Returns None if there is no entry, it is older than the TTL, or it
+        cannot be read.
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("version") != VERSION:
+            return None
+
+        fetched_at = entry.get("fetched_at")
+        tools = entry.get("tools")
+        if not isinstance(fetched_at, (int, float)) or not isinstance(
+            tools, list
+        ):
+            return None
+        if time.time() - fetched_at > self._ttl:
+            return None
+
+        return tools
+
+    def store(self, key: str, tools: List[Any]) -> None:
+        """Persist a catalog. Failures are ignored; caching is best-effort."""
+        entry = {
+            "version": VERSION,
+            "fetched_at": time.time(),
+            "tools": tools,
+        }
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._directory, prefix=".catalog-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def clear(self, key: str) -> None:
+        """Remove a cached catalog if present."""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
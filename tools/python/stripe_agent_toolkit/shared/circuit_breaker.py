@@ -0,0 +1,202 @@
+"""Circuit breaker for the Stripe MCP endpoint."""
+
+import enum
+import time
+from collections import deque
+from typing import Deque, Tuple
+from typing_extensions import TypedDict
+
+from .locks import fork_safe_lock
+from .errors import (
+    CircuitOpenError,
+    McpServerError,
+    McpTimeoutError,
+    McpTransportError,
+)
+
+DEFAULT_FAILURE_RATE_THRESHOLD = 0.5
+DEFAULT_SLOW_CALL_THRESHOLD = 10.0
+DEFAULT_SLOW_CALL_RATE_THRESHOLD = 1.0
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_MINIMUM_CALLS = 10
+DEFAULT_PROBE_INTERVAL = 30.0
+
+
+class CircuitState(str, enum.Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerStats(TypedDict):
+    """Snapshot of the circuit breaker's window and history."""
+
+    state: CircuitState
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    times_opened: int
+    rejected: int
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """
+    Check whether an error reflects on the endpoint's health.
+
+    Dropped connections, server errors and timeouts count; errors a tool
+    reports about its arguments, or per-account rate limits, do not.
+    """
+    return isinstance(
+        error, (McpTransportError, McpServerError, McpTimeoutError)
+    )
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker over a sliding window.
+
+    While closed, the outcomes of the last `window_size` calls are kept.
+    Once at least `minimum_calls` are recorded, the breaker opens if the
+    share of failed calls reaches `failure_rate_threshold` or the share of
+    calls slower than `slow_call_threshold` seconds reaches
+    `slow_call_rate_threshold`. While open, calls are rejected. After
+    `probe_interval` seconds a single probe call is let through: if it
+    succeeds the breaker closes, otherwise it opens again.
+
+    All operations are synchronous and thread-safe.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = DEFAULT_FAILURE_RATE_THRESHOLD,
+        slow_call_threshold: float = DEFAULT_SLOW_CALL_THRESHOLD,
+        slow_call_rate_threshold: float = DEFAULT_SLOW_CALL_RATE_THRESHOLD,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+    ):
+        if window_size < 1 or minimum_calls < 1:
+            raise ValueError(
+                "window_size and minimum_calls must be at least 1."
+            )
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_threshold = slow_call_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._minimum_calls = min(minimum_calls, window_size)
+        self._probe_interval = probe_interval
+
+        # (failed, slow) per call
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = fork_safe_lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open when due."""
+        with self._lock:
+            self._check_probe_due(time.monotonic())
+            return self._state
+
+    def acquire(self) -> bool:
+        """
+        Ask to make a call.
+
+        Returns True if the call is a half-open probe, whose outcome
+        decides whether the breaker closes. Raises CircuitOpenError if the
+        call must not be made.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._check_probe_due(now)
+
+            if self._state is CircuitState.CLOSED:
+                return False
+            if self._state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+
+            self._rejected += 1
+            retry_after = max(
+                0.0, self._opened_at + self._probe_interval - now
+            )
+
+        raise CircuitOpenError(
+            "Stripe MCP server is unavailable (circuit breaker open); "
+            f"retry in {retry_after:.3g}s",
+            retry_after=retry_after,
+        )
+
+    def record(self, probe: bool, failed: bool, duration: float) -> None:
+        """Record the outcome of a call admitted by acquire()."""
+        slow = duration >= self._slow_call_threshold
+        with self._lock:
+            if probe:
+                self._probing = False
+                if failed or slow:
+                    self._open(time.monotonic())
+                else:
+                    self._state = CircuitState.CLOSED
+                    self._window.clear()
+                return
+
+            if self._state is not CircuitState.CLOSED:
+                return
+            self._window.append((failed, slow))
+            if self._should_trip():
+                self._open(time.monotonic())
+
+    def release(self, probe: bool) -> None:
+        """Give up a call admitted by acquire() without an outcome."""
+        if probe:
+            with self._lock:
+                self._probing = False
+
+    def stats(self) -> CircuitBreakerStats:
+        """Snapshot of the breaker's state and window."""
+        with self._lock:
+            self._check_probe_due(time.monotonic())
+            failure_rate, slow_rate = self._rates()
+            return CircuitBreakerStats(
+                state=self._state,
+                calls=len(self._window),
+                failure_rate=failure_rate,
+                slow_call_rate=slow_rate,
+                times_opened=self._times_opened,
+                rejected=self._rejected,
+            )
+
+    def _rates(self) -> Tuple[float, float]:
+        calls = len(self._window)
+        if not calls:
+            return 0.0, 0.0
+        failed = sum(1 for f, _ in self._window if f)
+        slow = sum(1 for _, s in self._window if s)
+        return failed / calls, slow / calls
+
+    def _should_trip(self) -> bool:
+        if len(self._window) < self._minimum_calls:
+            return False
+        failure_rate, slow_rate = self._rates()
+        return (
+            failure_rate >= self._failure_rate_threshold
+            or slow_rate >= self._slow_call_rate_threshold
+        )
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._window.clear()
+        self._times_opened += 1
+
+    def _check_probe_due(self, now: float) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and now - self._opened_at >= self._probe_interval
+        ):
+            self._state = CircuitState.HALF_OPEN
@@ -0,0 +1,101 @@
+"""Process-wide sharing of MCP clients between toolkit instances."""
+
+from typing import Dict, Optional, Tuple
+
+from .locks import fork_safe_lock
+from .catalog_cache import key_fingerprint
+from .constants import MCP_SERVER_URL
+from .mcp_client import McpClientConfig, StripeMcpClient
+
+# (key fingerprint, account, customer, mode, endpoint)
+ClientKey = Tuple[str, str, str, str, str]
+
+
+def client_key(config: McpClientConfig) -> ClientKey:
+    """The settings that decide whether two toolkits can share a client."""
+    transport = config.get("transport")
+    endpoint = (
+        transport.endpoint
+        if transport is not None
+        else config.get("server_url") or MCP_SERVER_URL
+    )
+    return (
+        key_fingerprint(config["secret_key"]),
+        config.get("account") or "",
+        config.get("customer") or "",
+        config.get("mode") or "",
+        endpoint,
+    )
+
+
+class _Entry:
+    __slots__ = ("client", "refs")
+
+    def __init__(self, client: StripeMcpClient):
+        self.client = client
+        self.refs = 0
+
+
+class ClientRegistry:
+    """
+    Reference-counted StripeMcpClients, shared by toolkits in one process.
+
+    Toolkits created with the same API key, account, customer, mode and
+    endpoint get the same client, and so one session pool and one tool
+    catalog. The first toolkit's configuration decides the client's other
+    settings (pool, retries, caches, ...). The client is disconnected when
+    the last toolkit using it releases it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[ClientKey, _Entry] = {}
+        self._lock = fork_safe_lock()
+
+    def acquire(self, config: McpClientConfig) -> StripeMcpClient:
+        """Get the shared client for `config`, creating it if needed."""
+        key = client_key(config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(StripeMcpClient(config))
+                self._entries[key] = entry
+            entry.refs += 1
+            return entry.client
+
+    async def release(self, client: StripeMcpClient) -> None:
+        """
+        Drop a reference to a shared client, disconnecting it once no
+        toolkit uses it.
+        """
+        with self._lock:
+            key = self._key_of(client)
+            if key is None:
+                return
+            entry = self._entries[key]
+            entry.refs -= 1
+            if entry.refs > 0:
+                return
+            # Unregister before disconnecting, so toolkits created
+            # meanwhile get a fresh client instead of a closing one
+            del self._entries[key]
+        await client.disconnect()
+
+    def refs(self, client: StripeMcpClient) -> int:
+        """Number of toolkits holding a client."""
+        with self._lock:
+            key = self._key_of(client)
+            return self._entries[key].refs if key is not None else 0
+
+    def _key_of(self, client: StripeMcpClient) -> Optional[ClientKey]:
+        for key, entry in self._entries.items():
+            if entry.client is client:
+                return key
+        return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Registry used by toolkits configured with share_client
+client_registry = ClientRegistry()
@@ -0,0 +1,103 @@
+"""Concurrency limiting for Stripe Agent Toolkit."""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Deque
+
+from .locks import fork_safe_lock
+
+DEFAULT_MAX_CONCURRENCY = 64
+
+
+def _grant(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """
+    Caps the number of concurrent operations, queueing the excess.
+
+    Unlike asyncio.Semaphore, queued callers are admitted strictly in
+    arrival order: a released slot is handed directly to the oldest waiter
+    rather than being up for grabs. The limiter is thread-safe and may be
+    shared by coroutines running on different event loops.
+    """
+
+    def __init__(self, limit: int = DEFAULT_MAX_CONCURRENCY):
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1.")
+        self._limit = limit
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._lock = fork_safe_lock()
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of concurrent operations."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of operations currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of callers waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a slot. Callers are admitted in FIFO order."""
+        with self._lock:
+            if self._in_flight < self._limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter: "asyncio.Future[None]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed to us just as we were cancelled
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiter if any."""
+        with self._lock:
+            if not self._waiters:
+                self._in_flight -= 1
+                return
+            waiter = self._waiters.popleft()
+
+        loop = waiter.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if loop is running:
+            _grant(waiter)
+            return
+        try:
+            loop.call_soon_threadsafe(_grant, waiter)
+        except RuntimeError:
+            # The waiter's loop has shut down; pass the slot on
+            self.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
@@ -4,3 +4,9 @@ VERSION = "0.7.0"  # Bump version for MCP migration
 MCP_SERVER_URL = "https://mcp.stripe.com"
 TOOLKIT_HEADER = "stripe-agent-toolkit-python"
 MCP_HEADER = "stripe-mcp-python"
+
+# Request metadata key carrying the idempotency key of mutating tool calls.
+# Not part of a documented server contract: deduplication of retried writes
+# relies on the server honouring it, so writes are not retried after
+# ambiguous failures unless the retry config sets retry_writes.
+IDEMPOTENCY_META_KEY = "stripe.com/idempotency_key"
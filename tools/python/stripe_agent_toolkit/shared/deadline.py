@@ -0,0 +1,66 @@
+"""Deadline propagation for Stripe Agent Toolkit tool calls."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Absolute deadline on the time.monotonic() clock
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    "stripe_agent_toolkit_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """The deadline set by the innermost enclosing deadline_scope, if any."""
+    return _deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[float]:
+    """
+    Bound every tool call made within the block by an overall deadline.
+
+    Scopes nest: an inner scope can only shorten the deadline. Tasks
+    started within the block (e.g. by run_tools_batch) inherit it.
+
+    Example:
+        with deadline_scope(30):
+            customer = await toolkit.run_tool("retrieve_customer", args)
+            invoices = await toolkit.run_tool("list_invoices", args)
+    """
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def earliest(*deadlines: Optional[float]) -> Optional[float]:
+    """The earliest of the given deadlines, ignoring unset ones."""
+    return min((d for d in deadlines if d is not None), default=None)
+
+
+def resolve_deadline(
+    timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Optional[float]:
+    """
+    Combine a relative timeout, an explicit deadline and the enclosing
+    deadline_scope into a single absolute deadline.
+    """
+    return earliest(
+        time.monotonic() + timeout if timeout is not None else None,
+        deadline,
+        _deadline.get(),
+    )
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until the deadline, or None without one."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -0,0 +1,179 @@
+"""Error types for Stripe Agent Toolkit MCP calls."""
+
+import email.utils
+import time
+from typing import Iterator, Optional
+
+import anyio
+import httpx
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INTERNAL_ERROR
+
+RATE_LIMIT_MARKERS = ("rate limit", "rate_limit", "too many requests")
+
+
+class StripeMcpError(RuntimeError):
+    """
+    Base class for errors raised by StripeMcpClient tool calls.
+
+    Subclasses RuntimeError so existing `except RuntimeError` handlers keep
+    working.
+    """
+
+    retryable = False
+
+
+class McpTransportError(StripeMcpError):
+    """The request could not be delivered or the connection dropped."""
+
+    retryable = True
+
+
+class McpRateLimitError(StripeMcpError):
+    """The server asked the client to slow down."""
+
+    retryable = True
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class McpServerError(StripeMcpError):
+    """The MCP server failed while handling the request."""
+
+    retryable = True
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class McpTimeoutError(StripeMcpError, TimeoutError):
+    """
+    A tool call did not finish in time.
+
+    Timeouts of a single attempt are retried within the call's remaining
+    time; running out of the call's overall time is final.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        timeout: Optional[float] = None,
+        retryable: bool = False,
+    ):
+        super().__init__(message)
+        self.timeout = timeout
+        self.retryable = retryable
+
+
+class CircuitOpenError(StripeMcpError):
+    """The circuit breaker is open, so the call was not attempted."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class McpToolError(StripeMcpError):
+    """The tool ran and reported an error (e.g. invalid arguments)."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, parsed.timestamp() - time.time())
+
+
+def _leaves(error: BaseException) -> Iterator[BaseException]:
+    """Yield the leaf exceptions of (possibly nested) exception groups."""
+    if isinstance(error, BaseExceptionGroup):
+        for inner in error.exceptions:
+            yield from _leaves(inner)
+    else:
+        yield error
+
+
+def _classify_leaf(
+    error: BaseException, message: str
+) -> Optional[StripeMcpError]:
+    if isinstance(error, StripeMcpError):
+        return error
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status == 429:
+            return McpRateLimitError(
+                message,
+                retry_after=parse_retry_after(
+                    error.response.headers.get("Retry-After")
+                ),
+            )
+        if status >= 500:
+            return McpServerError(message, status_code=status)
+        return StripeMcpError(message)
+
+    if isinstance(
+        error,
+        (
+            httpx.TransportError,
+            OSError,
+            anyio.ClosedResourceError,
+            anyio.BrokenResourceError,
+            anyio.EndOfStream,
+        ),
+    ):
+        return McpTransportError(message)
+
+    if isinstance(error, McpError):
+        code = error.error.code
+        if code in (CONNECTION_CLOSED, httpx.codes.REQUEST_TIMEOUT):
+            return McpTransportError(message)
+        if code == INTERNAL_ERROR:
+            return McpServerError(message)
+        return StripeMcpError(message)
+
+    return None
+
+
+def classify_error(error: BaseException, tool_name: str) -> StripeMcpError:
+    """
+    Map an exception from an MCP call onto the toolkit's error types.
+
+    Exception groups (raised by the transport's task groups) are searched
+    for the most specific cause.
+    """
+    if isinstance(error, StripeMcpError):
+        return error
+
+    message = f"Failed to execute tool '{tool_name}': {error}"
+    classified = [
+        c
+        for c in (_classify_leaf(leaf, message) for leaf in _leaves(error))
+        if c is not None
+    ]
+    for kind in (McpRateLimitError, McpServerError, McpTransportError):
+        for candidate in classified:
+            if isinstance(candidate, kind):
+                return candidate
+    if classified:
+        return classified[0]
+    return StripeMcpError(message)
+
+
+def tool_error(text: str, tool_name: str) -> StripeMcpError:
+    """Build the error for a tool result flagged with isError."""
+    message = f"Failed to execute tool '{tool_name}': {text}"
+    if any(marker in text.lower() for marker in RATE_LIMIT_MARKERS):
+        return McpRateLimitError(message)
+    return McpToolError(message)
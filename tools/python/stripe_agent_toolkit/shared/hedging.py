@@ -0,0 +1,125 @@
+"""Request hedging for read-only Stripe MCP tool calls."""
+
+import math
+from collections import deque
+from typing import Deque, Optional
+from typing_extensions import TypedDict
+
+from .locks import fork_safe_lock
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_MIN_DELAY = 0.01
+DEFAULT_BUDGET_RATIO = 0.05
+DEFAULT_MIN_HEDGE_TOKENS = 10.0
+DEFAULT_WINDOW_SIZE = 200
+DEFAULT_MINIMUM_CALLS = 20
+
+
+class HedgeStats(TypedDict):
+    """Snapshot of hedging activity."""
+
+    calls: int
+    hedged: int
+    hedge_wins: int
+    budget_exhausted: int
+    delay: Optional[float]
+
+
+class HedgePolicy:
+    """
+    When to send a second copy of a slow read, and how many to allow.
+
+    The hedge delay is either fixed (`delay`) or the `percentile` of the
+    latencies of the last `window_size` calls, no lower than `min_delay`;
+    an adaptive policy does not hedge until `minimum_calls` latencies are
+    known. The budget bounds the extra load the same way the retry budget
+    does: every call earns `budget_ratio` hedge tokens (up to a cap) and
+    every hedge spends one, so hedges stay near `budget_ratio` of reads
+    even when everything is slow.
+
+    All operations are synchronous and thread-safe.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = DEFAULT_PERCENTILE,
+        min_delay: float = DEFAULT_MIN_DELAY,
+        budget_ratio: float = DEFAULT_BUDGET_RATIO,
+        min_hedge_tokens: float = DEFAULT_MIN_HEDGE_TOKENS,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+    ):
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative.")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1.")
+        if window_size < 1 or minimum_calls < 1:
+            raise ValueError("window_size and minimum_calls must be >= 1.")
+        self._fixed_delay = delay
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._budget_ratio = budget_ratio
+        self._max_tokens = min_hedge_tokens
+        self._tokens = min_hedge_tokens
+        self._minimum_calls = min(minimum_calls, window_size)
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._delay: Optional[float] = delay
+        self._stale = False
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+        self._lock = fork_safe_lock()
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging a call, or None not to hedge."""
+        with self._lock:
+            self._calls += 1
+            self._tokens = min(
+                self._max_tokens, self._tokens + self._budget_ratio
+            )
+            if self._stale:
+                self._delay = self._learned_delay()
+                self._stale = False
+            return self._delay
+
+    def _learned_delay(self) -> Optional[float]:
+        if len(self._latencies) < self._minimum_calls:
+            return None
+        ordered = sorted(self._latencies)
+        index = math.ceil(self._percentile * len(ordered)) - 1
+        return max(self._min_delay, ordered[index])
+
+    def try_hedge(self) -> bool:
+        """Spend budget on a hedge, if any is left."""
+        with self._lock:
+            if self._tokens < 1:
+                self._budget_exhausted += 1
+                return False
+            self._tokens -= 1
+            self._hedged += 1
+            return True
+
+    def record(self, latency: float, hedge_won: bool = False) -> None:
+        """Record how long a call took to get its first response."""
+        with self._lock:
+            if hedge_won:
+                self._hedge_wins += 1
+            if self._fixed_delay is None:
+                self._latencies.append(latency)
+                self._stale = True
+
+    def stats(self) -> HedgeStats:
+        """Counters and the current hedge delay."""
+        with self._lock:
+            if self._stale:
+                self._delay = self._learned_delay()
+                self._stale = False
+            return HedgeStats(
+                calls=self._calls,
+                hedged=self._hedged,
+                hedge_wins=self._hedge_wins,
+                budget_exhausted=self._budget_exhausted,
+                delay=self._delay,
+            )
@@ -0,0 +1,256 @@
+"""Timing instrumentation for the phases of a tool call."""
+
+import time
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+
+class Phase:
+    """Names of the instrumented phases of a tool call."""
+
+    # The whole call_tool, including cache lookups and retries
+    CALL = "call"
+    # Waiting for a concurrency slot
+    QUEUE = "queue"
+    # Waiting for the client-side rate limiter
+    RATE_LIMIT = "rate_limit"
+    # Opening a session: transport setup plus the MCP handshake
+    CONNECT = "connect"
+    # The MCP initialize handshake
+    INITIALIZE = "initialize"
+    # One call_tool round trip on a session
+    REQUEST = "request"
+    # Turning the MCP result into the returned text
+    EXTRACT = "extract"
+    # Sleeping before a retry
+    BACKOFF = "backoff"
+    # A hedged copy of a slow read, from sending it until it is answered
+    # or cancelled
+    HEDGE = "hedge"
+
+
+class PhaseEvent:
+    """
+    Start or end of one phase.
+
+    `duration`, `result_size` and `error` are only set on end events.
+    `data` is scratch space for hooks, e.g. to carry a span from start to
+    end.
+    """
+
+    __slots__ = (
+        "phase",
+        "tool",
+        "account",
+        "started_at",
+        "duration",
+        "result_size",
+        "error",
+        "data",
+    )
+
+    def __init__(
+        self, phase: str, tool: Optional[str], account: Optional[str]
+    ):
+        self.phase = phase
+        self.tool = tool
+        self.account = account
+        self.started_at = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.result_size: Optional[int] = None
+        self.error: Optional[str] = None
+        self.data: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"PhaseEvent(phase={self.phase!r}, tool={self.tool!r}, "
+            f"duration={self.duration!r}, error={self.error!r})"
+        )
+
+
+class Instrumentation:
+    """
+    Base class for instrumentation hooks. Override either method.
+
+    Hooks run inline on the calling task, so they should be quick and
+    must not raise.
+    """
+
+    def on_start(self, event: PhaseEvent) -> None:
+        """Called when a phase starts."""
+
+    def on_end(self, event: PhaseEvent) -> None:
+        """Called when a phase ends, successfully or not."""
+
+
+# (tool, account) of the tool call being made by the current task
+_current_call: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+    "stripe_agent_toolkit_call", default=(None, None)
+)
+
+
+class _NoopPhase:
+    """Stand-in phase used when no hooks are registered."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_PHASE = _NoopPhase()
+
+
+class _Phase:
+    __slots__ = ("_instrumenter", "_event")
+
+    def __init__(self, instrumenter: "Instrumenter", event: PhaseEvent):
+        self._instrumenter = instrumenter
+        self._event = event
+
+    def __enter__(self) -> PhaseEvent:
+        self._instrumenter.emit_start(self._event)
+        return self._event
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        event = self._event
+        event.duration = time.perf_counter() - event.started_at
+        if exc_type is not None:
+            event.error = exc_type.__name__
+        self._instrumenter.emit_end(event)
+
+
+class Instrumenter:
+    """
+    Dispatches phase events to registered hooks.
+
+    With no hooks registered, phase() returns a shared no-op context
+    manager and no events are created.
+    """
+
+    def __init__(self, hooks: Optional[List[Instrumentation]] = None):
+        self._hooks: List[Instrumentation] = list(hooks or [])
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any hook is registered."""
+        return bool(self._hooks)
+
+    def add(self, hook: Instrumentation) -> None:
+        """Register a hook."""
+        self._hooks = [*self._hooks, hook]
+
+    def remove(self, hook: Instrumentation) -> None:
+        """Unregister a hook."""
+        self._hooks = [h for h in self._hooks if h is not hook]
+
+    def phase(self, phase: str) -> Any:
+        """
+        Context manager timing a phase of the current tool call.
+
+        Yields the PhaseEvent (None when disabled), on which the caller may
+        set result_size before the phase ends.
+        """
+        if not self._hooks:
+            return _NOOP_PHASE
+        tool, account = _current_call.get()
+        return _Phase(self, PhaseEvent(phase, tool, account))
+
+    def call(self, tool: str, account: Optional[str]) -> Any:
+        """
+        Context manager for a whole tool call. Phases started within it
+        are attributed to the tool and account.
+        """
+        if not self._hooks:
+            return _NOOP_PHASE
+        return _CallPhase(self, PhaseEvent(Phase.CALL, tool, account))
+
+    def emit_start(self, event: PhaseEvent) -> None:
+        for hook in self._hooks:
+            hook.on_start(event)
+
+    def emit_end(self, event: PhaseEvent) -> None:
+        for hook in reversed(self._hooks):
+            hook.on_end(event)
+
+
+class _CallPhase(_Phase):
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> PhaseEvent:
+        self._token = _current_call.set(
+            (self._event.tool, self._event.account)
+        )
+        return super().__enter__()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            super().__exit__(exc_type, exc, tb)
+        finally:
+            _current_call.reset(self._token)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Reports each phase as an OpenTelemetry span.
+
+    Spans are named `stripe_mcp.<phase>` and nest under the span current
+    when the phase started, so a call's phases appear as children of its
+    `stripe_mcp.call` span. Requires the `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import context, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api. "
+                "Install it with: pip install opentelemetry-api"
+            ) from e
+        self._context = context
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("stripe_agent_toolkit")
+
+    def on_start(self, event: PhaseEvent) -> None:
+        attributes: Dict[str, Any] = {"stripe_mcp.phase": event.phase}
+        if event.tool is not None:
+            attributes["stripe_mcp.tool"] = event.tool
+        if event.account is not None:
+            attributes["stripe_mcp.account"] = event.account
+        span = self._tracer.start_span(
+            f"stripe_mcp.{event.phase}", attributes=attributes
+        )
+        event.data["otel_span"] = span
+        event.data["otel_token"] = self._context.attach(
+            self._trace.set_span_in_context(span)
+        )
+
+    def on_end(self, event: PhaseEvent) -> None:
+        span = event.data.pop("otel_span", None)
+        token = event.data.pop("otel_token", None)
+        if span is None:
+            return
+        if event.result_size is not None:
+            span.set_attribute("stripe_mcp.result_size", event.result_size)
+        if event.error is not None:
+            span.set_attribute("error.type", event.error)
+            span.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, event.error)
+            )
+        span.end()
+        if token is not None:
+            self._context.detach(token)
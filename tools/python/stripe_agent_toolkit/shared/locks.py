@@ -0,0 +1,30 @@
+"""Thread locks that stay usable in a forked child."""
+
+import os
+import threading
+import weakref
+
+_locks: "weakref.WeakSet[threading.Lock]" = weakref.WeakSet()
+
+
+def fork_safe_lock() -> threading.Lock:
+    """
+    A threading.Lock released in the child after os.fork().
+
+    A fork copies a lock in whatever state it is in, and the thread that
+    held it (e.g. the loop bridge thread) does not exist in the child, so
+    a lock held at fork time would never be released there. Like the
+    standard library's own locks, these are reinitialized in the child.
+    """
+    lock = threading.Lock()
+    _locks.add(lock)
+    return lock
+
+
+def _reinit_locks() -> None:
+    for lock in list(_locks):
+        lock._at_fork_reinit()  # type: ignore[attr-defined]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_locks)
@@ -0,0 +1,160 @@
+"""A long-lived event loop thread for running coroutines from sync code."""
+
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Optional, TypeVar
+
+from .locks import fork_safe_lock
+
+R = TypeVar("R")
+
+# How long interpreter exit waits for the bridge loop to wind down
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class LoopBridge:
+    """
+    An event loop running forever on a daemon thread, for synchronous
+    callers of async code.
+
+    Every coroutine submitted with run() executes on the same loop, so
+    the session pools, caches and coalesced requests it touches live on
+    between calls instead of being rebuilt on a new loop each time. The
+    thread starts on first use; after a fork, the child starts its own.
+    """
+
+    def __init__(self, name: str = "stripe-agent-toolkit-loop"):
+        self._name = name
+        self._lock = fork_safe_lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        _bridges.add(self)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The bridge's event loop, starting its thread if needed."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop,),
+                    name=self._name,
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the bridge thread has been started and not closed."""
+        return self._loop is not None
+
+    def in_bridge_thread(self) -> bool:
+        """Check if the caller is running on the bridge's own thread."""
+        return (
+            self._thread is not None
+            and threading.current_thread() is self._thread
+        )
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, R],
+        timeout: Optional[float] = None,
+    ) -> R:
+        """
+        Run a coroutine on the bridge loop and block until it finishes.
+
+        Safe to call from any thread, including one whose own event loop
+        is running. Raises TimeoutError after `timeout` seconds, cancelling
+        the coroutine. Calling it from the bridge thread would wait on
+        itself forever, so that raises RuntimeError instead.
+        """
+        if self.in_bridge_thread():
+            coro.close()
+            raise RuntimeError(
+                "LoopBridge.run() called from the bridge loop; "
+                "await the coroutine instead."
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timed out or interrupted: don't leave the call running
+            future.cancel()
+            raise
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the loop, cancelling what is still running on it, and wait
+        up to `timeout` seconds for the thread to exit. The next run()
+        starts a new thread.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if threading.current_thread() is not thread:
+            thread.join(timeout)
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True)
+            )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _after_fork(self) -> None:
+        # The thread did not survive the fork; start afresh on next use
+        self._loop = None
+        self._thread = None
+
+
+_bridges: "weakref.WeakSet[LoopBridge]" = weakref.WeakSet()
+_default_bridge: Optional[LoopBridge] = None
+_default_lock = fork_safe_lock()
+
+
+def default_loop_bridge() -> LoopBridge:
+    """The process-wide bridge used by the sync tool adapters."""
+    global _default_bridge
+    with _default_lock:
+        if _default_bridge is None:
+            _default_bridge = LoopBridge()
+        return _default_bridge
+
+
+def run_sync(
+    coro: Coroutine[Any, Any, R], timeout: Optional[float] = None
+) -> R:
+    """Run a coroutine from synchronous code on the shared bridge loop."""
+    return default_loop_bridge().run(coro, timeout)
+
+
+def _reset_after_fork() -> None:
+    for bridge in list(_bridges):
+        bridge._after_fork()
+
+
+def _shutdown() -> None:
+    for bridge in list(_bridges):
+        bridge.close(SHUTDOWN_TIMEOUT)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(_shutdown)
@@ -1,16 +1,113 @@
 """Client for connecting to Stripe MCP server at mcp.stripe.com."""
 
-import json
+import asyncio
+import concurrent.futures
+import functools
+import os
+import time
+import uuid
 import warnings
-from contextlib import asynccontextmanager
-from typing import Optional, List, Dict, Any, AsyncGenerator, Tuple
+import weakref
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from typing_extensions import TypedDict
 
 from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import CallToolResult
 
+from .account import current_account
 from .async_initializer import AsyncInitializer
-from .constants import VERSION, MCP_SERVER_URL, TOOLKIT_HEADER, MCP_HEADER
+from .catalog_cache import CatalogCache
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    CircuitState,
+    is_endpoint_failure,
+)
+from .constants import (
+    VERSION,
+    MCP_SERVER_URL,
+    TOOLKIT_HEADER,
+    MCP_HEADER,
+    IDEMPOTENCY_META_KEY,
+)
+from .deadline import remaining, resolve_deadline
+from .errors import (
+    McpRateLimitError,
+    McpTimeoutError,
+    StripeMcpError,
+    classify_error,
+    tool_error,
+)
+from .rate_limit import (
+    DEFAULT_LIVE_RATE,
+    DEFAULT_TEST_RATE,
+    RateLimiter,
+    RateLimiterStats,
+)
+from .hedging import HedgePolicy, HedgeStats
+from .instrumentation import Instrumentation, Instrumenter, Phase
+from .metrics import MetricsInstrumentation, MetricsRegistry
+from .retry import RetryPolicy
+from .concurrency import ConcurrencyLimiter, DEFAULT_MAX_CONCURRENCY
+from .session_pool import (
+    PooledSession,
+    SessionFactory,
+    SessionPool,
+    WarmUpReport,
+    is_session_failure,
+)
+from .result_cache import ResultCache, ResultCacheStats
+from .single_flight import SingleFlight
+from .tool_result import ToolResult
+from .tool_rules import call_key, is_read_only_tool
+from .transports import StreamableHttpTransport, Transport
+from ..configuration import (
+    CatalogCacheConfig,
+    CircuitBreakerConfig,
+    HedgeConfig,
+    PoolConfig,
+    RateLimitConfig,
+    ResultCacheConfig,
+    RetryConfig,
+    TimeoutConfig,
+    WarmUpConfig,
+)
+
+R = TypeVar("R")
+
+ToolsChangedCallback = Callable[[List["McpTool"]], None]
+
+DEFAULT_BATCH_CONCURRENCY = 16
+DEFAULT_MAX_ACCOUNT_POOLS = 100
+
+# (method, args), (method, args, customer) or
+# (method, args, customer, account)
+BatchToolCall = Union[
+    Tuple[str, Dict[str, Any]],
+    Tuple[str, Dict[str, Any], Optional[str]],
+    Tuple[str, Dict[str, Any], Optional[str], Optional[str]],
+]
+
+_NormalizedCall = Tuple[str, Dict[str, Any], Optional[str], Optional[str]]
+
+# (event loop, connected account)
+_AccountPoolKey = Tuple[asyncio.AbstractEventLoop, str]
 
 
 class McpToolInputSchema(TypedDict, total=False):
@@ -27,6 +124,16 @@ class McpTool(TypedDict, total=False):
     name: str
     description: str
     inputSchema: McpToolInputSchema
+    annotations: Dict[str, Any]
+
+
+class BatchToolResult(TypedDict):
+    """Outcome of a single call in a tool batch."""
+
+    index: int
+    method: str
+    result: Optional[str]
+    error: Optional[Exception]
 
 
 class McpClientConfig(TypedDict, total=False):
@@ -36,20 +143,160 @@ class McpClientConfig(TypedDict, total=False):
     account: Optional[str]
     customer: Optional[str]
     mode: Optional[str]  # 'modelcontextprotocol' | 'toolkit'
+    pool: Optional[PoolConfig]
+    max_concurrency: Optional[int]
+    max_account_pools: Optional[int]
+    catalog_cache: Optional[CatalogCacheConfig]
+    result_cache: Optional[ResultCacheConfig]
+    coalesce_reads: Optional[bool]
+    retry: Optional[RetryConfig]
+    rate_limit: Optional[RateLimitConfig]
+    timeouts: Optional[TimeoutConfig]
+    circuit_breaker: Optional[CircuitBreakerConfig]
+    hedging: Optional[HedgeConfig]
+    warm_up: Optional[WarmUpConfig]
+    catalog_refresh_interval: Optional[float]
+    server_url: Optional[str]
+    transport: Optional[Transport]
+    instrumentation: Optional[List[Instrumentation]]
+    metrics: Optional[MetricsRegistry]
+
+
+def _attempt_timed_out(timeout: Optional[float]) -> McpTimeoutError:
+    """The error for an operation that ran out of its attempt timeout."""
+    return McpTimeoutError(
+        f"Attempt timed out after {timeout:.3g}s",
+        timeout=timeout,
+        retryable=True,
+    )
+
+
+async def _close_pool(pool: SessionPool) -> None:
+    """Close a pool on the loop it was started on."""
+    if pool.is_bound_to_running_loop():
+        await pool.close()
+        return
+    loop = pool.loop
+    if loop is not None and loop.is_running():
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(pool.close(), loop)
+        )
+    # A pool whose loop has finished closed its sessions with it
 
 
 class StripeMcpClient:
     """
     Client for connecting to Stripe MCP server at mcp.stripe.com.
     Fetches tool definitions and executes tool calls via MCP protocol.
+
+    Tool calls run over a pool of long-lived MCP sessions, so the
+    connection and MCP handshake are paid once per session rather than
+    once per call. Concurrent calls are multiplexed over the pooled
+    sessions, with at most max_concurrency requests in flight and the
+    excess queued in arrival order.
+
+    One client can act on many connected accounts: calls for an account
+    other than the configured one run on that account's own pool, which
+    shrinks to nothing when idle. The tool catalog is shared.
+
+    The client can be used from several event loops, e.g. an application
+    loop and the loop bridge behind the sync tool adapters; each loop
+    gets its own pool of sessions.
     """
 
     def __init__(self, config: McpClientConfig):
         self._config = config
+        self._transport: Transport = (
+            config.get("transport")
+            or StreamableHttpTransport(
+                config.get("server_url") or MCP_SERVER_URL
+            )
+        )
+        self._server_url = self._transport.endpoint
         self._tools: List[McpTool] = []
+        self._tools_by_name: Dict[str, McpTool] = {}
         self._initializer = AsyncInitializer()
+        self._pool: Optional[SessionPool] = None
+        # Default-account pools of event loops other than the one that
+        # started _pool, e.g. the loop bridge serving sync adapters
+        self._loop_pools: Dict[asyncio.AbstractEventLoop, SessionPool] = {}
+        # Pools of connected accounts other than the configured one, per
+        # event loop, in least recently used order
+        self._account_pools: "OrderedDict[_AccountPoolKey, SessionPool]" = (
+            OrderedDict()
+        )
+        self._max_account_pools = (
+            config.get("max_account_pools") or DEFAULT_MAX_ACCOUNT_POOLS
+        )
+        # Evicted pools closing on their own loops
+        self._closing_pools: Set["concurrent.futures.Future[None]"] = set()
+        self._limiter = ConcurrencyLimiter(
+            config.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY
+        )
+        self._retry = RetryPolicy(**(config.get("retry") or {}))
+        self._timeouts: TimeoutConfig = config.get("timeouts") or {}
+        breaker_config = config.get("circuit_breaker")
+        self._circuit_breaker: Optional[CircuitBreaker] = (
+            CircuitBreaker(**breaker_config)
+            if breaker_config is not None
+            else None
+        )
+        hedge_config = config.get("hedging")
+        self._hedging: Optional[HedgePolicy] = (
+            HedgePolicy(**hedge_config) if hedge_config is not None else None
+        )
+        self._instrumenter = Instrumenter(config.get("instrumentation"))
+        metrics = config.get("metrics")
+        if metrics is not None:
+            self._instrumenter.add(MetricsInstrumentation(metrics))
+        self._tools_listeners: List[ToolsChangedCallback] = []
+        self._revalidate_task: Optional[asyncio.Task[None]] = None
+        self._warm_up: WarmUpConfig = config.get("warm_up") or {}
+        self._rewarm_task: Optional[asyncio.Task[None]] = None
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self._last_warm_up: Optional[WarmUpReport] = None
 
         self._validate_key(config["secret_key"])
+        _clients.add(self)
+
+        self._single_flight: Optional[SingleFlight[ToolResult]] = (
+            SingleFlight()
+            if config.get("coalesce_reads", True) is not False
+            else None
+        )
+
+        result_cache_config = config.get("result_cache")
+        self._result_cache: Optional[ResultCache] = (
+            ResultCache(**result_cache_config)
+            if result_cache_config is not None
+            else None
+        )
+
+        self._rate_limiter: Optional[RateLimiter] = None
+        rate_limit_config = config.get("rate_limit")
+        if rate_limit_config is not None:
+            default_rate = (
+                DEFAULT_TEST_RATE
+                if "_test_" in config["secret_key"]
+                else DEFAULT_LIVE_RATE
+            )
+            self._rate_limiter = RateLimiter(**{
+                "read_rate": default_rate,
+                "write_rate": default_rate,
+                **rate_limit_config,
+            })
+
+        cache_config = config.get("catalog_cache")
+        self._catalog_cache: Optional[CatalogCache] = None
+        self._catalog_key = ""
+        if cache_config is not None:
+            self._catalog_cache = CatalogCache(**cache_config)
+            self._catalog_key = self._catalog_cache.key(
+                self._server_url,
+                config["secret_key"],
+                account=config.get("account"),
+                mode=config.get("mode"),
+            )
 
     def _validate_key(self, key: str) -> None:
         """Validate API key format and emit warnings."""
@@ -71,8 +318,8 @@ class StripeMcpClient:
                 stacklevel=3
             )
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Build headers for MCP requests."""
+    def _get_headers(self, account: Optional[str] = None) -> Dict[str, str]:
+        """Build headers for MCP requests on behalf of an account."""
         user_agent = (
             f"{MCP_HEADER}/{VERSION}"
             if self._config.get("mode") == "modelcontextprotocol"
@@ -84,58 +331,417 @@ class StripeMcpClient:
             "User-Agent": user_agent,
         }
 
-        if self._config.get("account"):
-            headers["Stripe-Account"] = self._config["account"]
+        account = account or self._config.get("account")
+        if account:
+            headers["Stripe-Account"] = account
 
         return headers
 
     @asynccontextmanager
-    async def _create_session(self) -> AsyncGenerator[ClientSession, None]:
+    async def _create_session(
+        self, account: Optional[str] = None
+    ) -> AsyncGenerator[ClientSession, None]:
         """Create an MCP session within a proper async context.
 
         This ensures the connection lifecycle is managed correctly by
         using async with blocks, avoiding task group context issues.
         """
-        headers = self._get_headers()
+        headers = self._get_headers(account)
+        instrumenter = self._instrumenter
+
+        async with AsyncExitStack() as stack:
+            with instrumenter.phase(Phase.CONNECT):
+                read_stream, write_stream = await stack.enter_async_context(
+                    self._transport.connect(headers)
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                with instrumenter.phase(Phase.INITIALIZE):
+                    await session.initialize()
+            yield session
+
+    def resolve_account(self, account: Optional[str] = None) -> Optional[str]:
+        """
+        The account a call acts on: the per-call account, else the one
+        set by account_scope(), else the configured one.
+        """
+        return account or current_account() or self._config.get("account")
+
+    def _is_default_account(self, account: Optional[str]) -> bool:
+        return account is None or account == self._config.get("account")
+
+    def _session_factory(self, account: Optional[str]) -> SessionFactory:
+        """The session factory for an account's sessions."""
+        if self._is_default_account(account):
+            # Default-account sessions are opened with no arguments, so
+            # single-account factories can replace _create_session
+            return self._create_session
+        return functools.partial(self._create_session, account)
+
+    def _new_pool(self, account: Optional[str] = None) -> SessionPool:
+        """Create a session pool from the configured pool options."""
+        pool_config: Dict[str, Any] = {**(self._config.get("pool") or {})}
+        if not self._is_default_account(account):
+            # Connected accounts are many and mostly idle; keep no warm
+            # sessions for them
+            pool_config["min_size"] = 0
+        return SessionPool(self._session_factory(account), **pool_config)
+
+    async def _get_pool(
+        self, account: Optional[str] = None
+    ) -> Optional[SessionPool]:
+        """
+        Get the session pool of an account for the running event loop.
+
+        Every event loop gets its own pool of sessions for each account,
+        so sync callers on the loop bridge keep their connections between
+        calls too. Returns None if the pool is not usable from the running
+        loop, and the call falls back to a one-off session.
+        """
+        if self._is_default_account(account):
+            pool = self._pool
+            if pool is None or pool.is_closed:
+                pool = self._pool = self._new_pool()
+                await pool.start()
+            elif not pool.is_bound_to_running_loop():
+                pool = await self._get_loop_pool()
+        else:
+            pool = await self._get_account_pool(account)
 
-        async with streamablehttp_client(
-            MCP_SERVER_URL,
-            headers=headers,
-            terminate_on_close=False
-        ) as (read_stream, write_stream, _):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                yield session
+        if not pool.is_bound_to_running_loop():
+            return None
+        return pool
+
+    async def _get_loop_pool(self) -> SessionPool:
+        """The default-account pool of a loop other than _pool's."""
+        # Pools of finished loops died with them
+        for loop in [loop for loop in self._loop_pools if loop.is_closed()]:
+            del self._loop_pools[loop]
+
+        loop = asyncio.get_running_loop()
+        pool = self._loop_pools.get(loop)
+        if pool is None or pool.is_closed:
+            pool = self._loop_pools[loop] = self._new_pool()
+            await pool.start()
+        return pool
+
+    async def _get_account_pool(self, account: str) -> SessionPool:
+        key = (asyncio.get_running_loop(), account)
+        pool = self._account_pools.get(key)
+        if pool is not None and not pool.is_closed:
+            self._account_pools.move_to_end(key)
+            return pool
+
+        # Pools of finished loops died with them
+        for dead in [k for k in self._account_pools if k[0].is_closed()]:
+            del self._account_pools[dead]
+        pool = self._new_pool(account)
+        self._account_pools[key] = pool
+        self._evict_account_pools()
+        await pool.start()
+        return pool
+
+    def _evict_account_pools(self) -> None:
+        """Close the least recently used idle pools beyond the limit."""
+        excess = len(self._account_pools) - self._max_account_pools
+        if excess <= 0:
+            return
+        for key, pool in list(self._account_pools.items())[:-1]:
+            if excess <= 0:
+                break
+            if pool.in_flight or pool.loop is None:
+                # Busy, or still starting
+                continue
+            del self._account_pools[key]
+            excess -= 1
+            # The pool may belong to another loop; close it on that one
+            loop = pool.loop
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(pool.close(), loop)
+                self._closing_pools.add(future)
+                future.add_done_callback(self._closing_pools.discard)
+
+    async def _with_session(
+        self,
+        operation: Callable[[ClientSession], Awaitable[R]],
+        timeout: Optional[float] = None,
+        account: Optional[str] = None,
+        siblings: Optional[Set[PooledSession]] = None,
+        resend: bool = True,
+    ) -> R:
+        """
+        Run an operation on a pooled session, within the concurrency limit.
+
+        If a reused session turns out to be broken (e.g. the server dropped
+        the connection while it sat idle), it is replaced and, unless
+        `resend` is False, the operation is retried once on a fresh session.
+
+        The operation is given `timeout` seconds once it has a session,
+        raising McpTimeoutError after that. A request abandoned mid-flight,
+        by timeout or cancellation, drains its session out of the pool.
+
+        `siblings` collects the sessions used by copies of one request;
+        each copy is sent on a session the others are not using, if the
+        pool has one.
+        """
+        with self._instrumenter.phase(Phase.QUEUE):
+            await self._limiter.acquire()
+        try:
+            return await self._run_on_pool(
+                operation, timeout, account, siblings, resend
+            )
+        finally:
+            self._limiter.release()
+
+    async def _run_on_pool(
+        self,
+        operation: Callable[[ClientSession], Awaitable[R]],
+        timeout: Optional[float] = None,
+        account: Optional[str] = None,
+        siblings: Optional[Set[PooledSession]] = None,
+        resend: bool = True,
+    ) -> R:
+        pool = await self._get_pool(account)
+        if pool is None:
+            async with self._session_factory(account)() as session:
+                scope = asyncio.timeout(timeout)
+                try:
+                    async with scope:
+                        return await operation(session)
+                except TimeoutError:
+                    if scope.expired():
+                        raise _attempt_timed_out(timeout) from None
+                    raise
+
+        reconnected = False
+        while True:
+            async with pool.session(siblings or ()) as pooled:
+                if siblings is not None:
+                    siblings.add(pooled)
+                scope = asyncio.timeout(timeout)
+                try:
+                    async with scope:
+                        try:
+                            return await pooled.run(operation)
+                        except asyncio.CancelledError:
+                            pooled.mark_draining()
+                            raise
+                except Exception as e:
+                    # Only our own timeout; the transport's (e.g. a
+                    # socket's ETIMEDOUT) is a failure like any other
+                    if isinstance(e, TimeoutError) and scope.expired():
+                        raise _attempt_timed_out(timeout) from None
+                    if not is_session_failure(e):
+                        raise
+                    pooled.mark_broken()
+                    if reconnected or not resend or pooled.use_count <= 1:
+                        # Surface why the session died (e.g. an HTTP 429
+                        # that tore down the transport) if we know
+                        cause = await pooled.failure_cause()
+                        if cause is not None and cause is not e:
+                            raise cause from e
+                        raise
+            reconnected = True
 
     async def connect(self) -> None:
-        """Connect to MCP server and fetch available tools."""
+        """Connect to MCP server, warm the session pool, fetch tools."""
         await self._initializer.initialize(self._do_connect)
 
     async def _do_connect(self) -> None:
         """Internal connection logic."""
+        await self._load_catalog()
+
+        if self._warm_up.get("on_initialize"):
+            try:
+                await self.warm_up()
+            except Exception:
+                # Only reachable with a cached catalog, before any session
+                # opened; calls connect on demand as they would unwarmed
+                pass
+
+        interval = self._warm_up.get("interval")
+        if interval:
+            self._rewarm_task = asyncio.create_task(self._rewarm(interval))
+
+        refresh_interval = self._config.get("catalog_refresh_interval")
+        if refresh_interval:
+            self._refresh_task = asyncio.create_task(
+                self._refresh_periodically(refresh_interval)
+            )
+
+    async def _load_catalog(self) -> None:
+        """Serve the cached catalog, or fetch it from the server."""
+        if self._catalog_cache is not None:
+            cached = self._catalog_cache.load(self._catalog_key)
+            if cached is not None:
+                # Serve the cached catalog now; check it against the
+                # server without holding up startup.
+                self._set_tools(cached)
+                self._revalidate_task = asyncio.create_task(
+                    self._revalidate_catalog()
+                )
+                return
+
         try:
-            async with self._create_session() as session:
-                result = await session.list_tools()
-                self._tools = [
-                    McpTool(
-                        name=t.name,
-                        description=t.description or t.name,
-                        inputSchema=t.inputSchema,
-                    )
-                    for t in result.tools
-                ]
+            self._set_tools(await self._list_tools())
         except Exception as e:
+            await self._close_pools()
             raise RuntimeError(
-                f"Failed to connect to Stripe MCP server at {MCP_SERVER_URL}. "
+                "Failed to connect to Stripe MCP server at "
+                f"{self._server_url}. "
                 f"No fallback to direct SDK is available. "
                 f"Error: {str(e)}"
             ) from e
 
+        if self._catalog_cache is not None:
+            self._catalog_cache.store(self._catalog_key, self._tools)
+
+    def _set_tools(self, tools: List[McpTool]) -> None:
+        self._tools = tools
+        self._tools_by_name = {t["name"]: t for t in tools if "name" in t}
+
+    async def _list_tools(self) -> List[McpTool]:
+        """Fetch the tool catalog from the MCP server."""
+        result = await self._with_session(
+            lambda session: session.list_tools()
+        )
+        tools: List[McpTool] = []
+        for t in result.tools:
+            tool = McpTool(
+                name=t.name,
+                description=t.description or t.name,
+                inputSchema=t.inputSchema,
+            )
+            annotations = getattr(t, "annotations", None)
+            if annotations is not None:
+                tool["annotations"] = annotations.model_dump(
+                    exclude_none=True
+                )
+            tools.append(tool)
+        return tools
+
+    async def warm_up(self, sessions: Optional[int] = None) -> WarmUpReport:
+        """
+        Open pooled sessions ahead of the first tool calls.
+
+        Brings the pool up to `sessions` open sessions (by default the
+        warm_up config's `sessions`, else the pool's min_size), paying for
+        connection setup and the MCP handshake now rather than on a
+        request's critical path. Sessions that are already open are pinged
+        so their connections stay warm. Returns the outcome and timing,
+        also kept as last_warm_up. Warms the pool of the running loop.
+        """
+        pool = await self._get_pool()
+        assert pool is not None  # default-account pools exist per loop
+        report = await pool.warm(
+            sessions
+            or self._warm_up.get("sessions")
+            or max(pool.min_size, 1)
+        )
+        self._last_warm_up = report
+        return report
+
+    @property
+    def last_warm_up(self) -> Optional[WarmUpReport]:
+        """Report of the most recent warm-up, or None before the first."""
+        return self._last_warm_up
+
+    async def _rewarm(self, interval: float) -> None:
+        """Keep idle sessions warm between bursts of calls."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.warm_up()
+            except Exception:
+                # A failed warm-up costs nothing; calls connect on demand
+                pass
+
+    async def _revalidate_catalog(self) -> None:
+        """Refresh a cached catalog, notifying listeners if it changed."""
+        try:
+            await self.refresh_catalog()
+        except Exception:
+            # Keep serving the cached catalog; the next start retries
+            pass
+
+    async def _refresh_periodically(self, interval: float) -> None:
+        """
+        Pick up catalog changes without a restart. One task per client,
+        however many toolkits share it; they hear of changes as listeners.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_catalog()
+            except Exception:
+                # Keep the current tools; the next refresh tries again
+                pass
+
+    async def refresh_catalog(self) -> bool:
+        """
+        List the server's tools again, notifying listeners if the
+        catalog changed. Returns whether it did.
+        """
+        tools = await self._list_tools()
+
+        if self._catalog_cache is not None:
+            self._catalog_cache.store(self._catalog_key, tools)
+
+        if tools == self._tools:
+            return False
+        self._set_tools(tools)
+        for listener in list(self._tools_listeners):
+            listener(tools)
+        return True
+
+    def add_tools_listener(self, listener: ToolsChangedCallback) -> None:
+        """
+        Register a callback invoked with the new catalog whenever the
+        tool list changes after connect().
+        """
+        self._tools_listeners.append(listener)
+
+    def remove_tools_listener(self, listener: ToolsChangedCallback) -> None:
+        """Unregister a callback added with add_tools_listener()."""
+        if listener in self._tools_listeners:
+            self._tools_listeners.remove(listener)
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to MCP server."""
         return self._initializer.is_initialized
 
+    @property
+    def in_flight(self) -> int:
+        """Number of MCP requests currently in flight."""
+        return self._limiter.in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of MCP requests waiting for a concurrency slot."""
+        return self._limiter.queued
+
+    @property
+    def result_cache_stats(self) -> Optional[ResultCacheStats]:
+        """Hit/miss counters of the result cache, if enabled."""
+        if self._result_cache is None:
+            return None
+        return self._result_cache.stats()
+
+    @property
+    def coalesced_calls(self) -> int:
+        """Number of read calls that shared an identical in-flight call."""
+        if self._single_flight is None:
+            return 0
+        return self._single_flight.coalesced
+
+    def is_read_only(self, name: str) -> bool:
+        """Check whether a tool only reads data."""
+        tool = self._tools_by_name.get(name)
+        annotations = tool.get("annotations") if tool else None
+        return is_read_only_tool(name, annotations)
+
     def get_tools(self) -> List[McpTool]:
         """Get available tools. Must call connect() first."""
         if not self._initializer.is_initialized:
@@ -149,7 +755,10 @@ class StripeMcpClient:
         self,
         name: str,
         args: Dict[str, Any],
-        customer: Optional[str] = None
+        customer: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        account: Optional[str] = None,
     ) -> str:
         """
         Execute a tool via MCP.
@@ -158,9 +767,46 @@ class StripeMcpClient:
             name: Tool method name (e.g., 'create_customer')
             args: Tool arguments
             customer: Optional per-call customer override
+            timeout: Seconds the whole call, including queueing and
+                retries, may take. Defaults to the configured call_timeout.
+            deadline: Absolute time.monotonic() by which the call must
+                finish, e.g. to share one budget across several calls.
+                The enclosing deadline_scope() also applies.
+            account: Connected account to act on, overriding the
+                enclosing account_scope() and the configured account.
 
         Returns:
             JSON string result
+
+        Raises:
+            McpTimeoutError: If the call did not finish in time. The
+                in-flight request is abandoned and its session retired.
+        """
+        result = await self.call_tool_result(
+            name,
+            args,
+            customer,
+            timeout=timeout,
+            deadline=deadline,
+            account=account,
+        )
+        return result.text
+
+    async def call_tool_result(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        customer: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        account: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        Execute a tool via MCP, returning the result unparsed.
+
+        Takes the same arguments as call_tool(). The returned ToolResult
+        parses the payload, or takes the server's structured content, on
+        first access to `data`, and only builds text when `text` is read.
         """
         if not self._initializer.is_initialized:
             raise RuntimeError(
@@ -168,6 +814,58 @@ class StripeMcpClient:
                 "Call connect() before calling tools."
             )
 
+        account = self.resolve_account(account)
+        with self._instrumenter.call(name, account) as event:
+            result = await self._call_within_deadline(
+                name, args, customer, account, timeout, deadline
+            )
+            if event is not None:
+                event.result_size = result.size
+            return result
+
+    async def _call_within_deadline(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        customer: Optional[str],
+        account: Optional[str],
+        timeout: Optional[float],
+        deadline: Optional[float],
+    ) -> ToolResult:
+        """Run the call under its timeout and deadline, if any."""
+        if timeout is None:
+            timeout = self._timeouts.get("call_timeout")
+        deadline = resolve_deadline(timeout, deadline)
+        if deadline is None:
+            return await self._call_tool(name, args, customer, account, None)
+
+        left = remaining(deadline)
+        if left is None or left <= 0:
+            raise McpTimeoutError(
+                f"Tool '{name}' was not called: its deadline has passed"
+            )
+        scope = asyncio.timeout(left)
+        try:
+            async with scope:
+                return await self._call_tool(
+                    name, args, customer, account, deadline
+                )
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            raise McpTimeoutError(
+                f"Tool '{name}' timed out after {left:.3g}s", timeout=left
+            ) from None
+
+    async def _call_tool(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        customer: Optional[str],
+        account: Optional[str],
+        deadline: Optional[float],
+    ) -> ToolResult:
+        """Resolve the customer, then serve the call from cache or MCP."""
         # Customer priority: per-call override > connection-time context > none
         final_customer = customer or self._config.get("customer")
 
@@ -190,49 +888,484 @@ class StripeMcpClient:
         if final_customer:
             final_args["customer"] = final_customer
 
+        cache = self._result_cache
+
+        if not self.is_read_only(name):
+            try:
+                return await self._execute(
+                    name, final_args, account, deadline
+                )
+            finally:
+                if cache is not None:
+                    cache.invalidate_for_write(name, account)
+
+        key = call_key(name, final_args, account, final_customer)
+        cacheable = cache is not None and cache.is_cacheable(name)
+        if cache is not None and cacheable:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def fetch() -> ToolResult:
+            generation = cache.generation(account) if cache else 0
+            result = await self._execute(
+                name, final_args, account, deadline
+            )
+            if cache is not None and cacheable:
+                cache.put(key, result, generation)
+            return result
+
+        if self._single_flight is None:
+            return await fetch()
+        return await self._single_flight.do(key, fetch)
+
+    async def _execute(
+        self,
+        name: str,
+        final_args: Dict[str, Any],
+        account: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> ToolResult:
+        """
+        Send a tool call, retrying transient failures.
+
+        Mutating tools carry an idempotency key in the request metadata,
+        reused across retries. This assumes a server that deduplicates on
+        it; the Stripe MCP server does not document one, which is why
+        writes are only retried after ambiguous failures with
+        retry_writes. No retry is started that could not finish before
+        the deadline.
+        """
+        read_only = self.is_read_only(name)
+        meta: Optional[Dict[str, Any]] = None
+        if not read_only:
+            meta = {IDEMPOTENCY_META_KEY: uuid.uuid4().hex}
+
+        self._retry.record_call()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._execute_once(
+                    name, final_args, meta, account
+                )
+            except StripeMcpError as e:
+                if (
+                    isinstance(e, McpRateLimitError)
+                    and self._rate_limiter is not None
+                ):
+                    self._rate_limiter.penalize(account, e.retry_after)
+                if not self._retry.should_retry(
+                    e, attempt, name, read_only
+                ):
+                    raise
+                delay = self._retry.backoff(attempt, e)
+                left = remaining(deadline)
+                if left is not None and delay >= left:
+                    raise
+                with self._instrumenter.phase(Phase.BACKOFF):
+                    await asyncio.sleep(delay)
+
+    async def _execute_once(
+        self,
+        name: str,
+        final_args: Dict[str, Any],
+        meta: Optional[Dict[str, Any]],
+        account: Optional[str] = None,
+    ) -> ToolResult:
+        """Send a tool call to the MCP server and extract its result."""
+        # Fail fast while the endpoint is down, before queueing anywhere
+        breaker = self._circuit_breaker
+        probe = breaker.acquire() if breaker is not None else False
+        # When requests went out on a session; waiting for a
+        # concurrency slot or a session is not the endpoint's latency
+        sent_at: List[float] = []
         try:
-            async with self._create_session() as session:
-                result = await session.call_tool(name, final_args)
-
-                if result.isError:
-                    error_text = next(
-                        (
-                            getattr(c, "text", None)
-                            for c in result.content
-                            if hasattr(c, "text")
-                        ),
-                        "Tool execution failed"
+            if self._rate_limiter is not None:
+                with self._instrumenter.phase(Phase.RATE_LIMIT):
+                    await self._rate_limiter.acquire(
+                        account, write=not self.is_read_only(name)
                     )
-                    raise RuntimeError(str(error_text))
-
-                # Extract text content
-                text_content = next(
-                    (
-                        getattr(c, "text", None)
-                        for c in result.content
-                        if hasattr(c, "text")
-                    ),
-                    None
+            result = await self._send(
+                name, final_args, meta, account, sent_at
+            )
+        except StripeMcpError as e:
+            if breaker is not None:
+                breaker.record(
+                    probe,
+                    failed=is_endpoint_failure(e),
+                    duration=self._since_sent(sent_at),
                 )
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release(probe)
+            raise
+        if breaker is not None:
+            breaker.record(
+                probe, failed=False, duration=self._since_sent(sent_at)
+            )
 
-                if text_content:
-                    return text_content
+        with self._instrumenter.phase(Phase.EXTRACT) as event:
+            tool_result = self._extract_result(result, name)
+            if event is not None:
+                event.result_size = tool_result.size
+            return tool_result
+
+    @staticmethod
+    def _extract_result(result: CallToolResult, name: str) -> ToolResult:
+        """Wrap a tool's result, raising if the tool failed."""
+        if result.isError:
+            error_text = next(
+                (
+                    getattr(c, "text", None)
+                    for c in result.content
+                    if hasattr(c, "text")
+                ),
+                "Tool execution failed"
+            )
+            raise tool_error(str(error_text), name)
+
+        return ToolResult.from_mcp(result)
+
+    @staticmethod
+    def _since_sent(sent_at: List[float]) -> float:
+        """Seconds since the first request was sent, 0 if none was."""
+        return time.monotonic() - sent_at[0] if sent_at else 0.0
+
+    async def _send(
+        self,
+        name: str,
+        final_args: Dict[str, Any],
+        meta: Optional[Dict[str, Any]],
+        account: Optional[str] = None,
+        sent_at: Optional[List[float]] = None,
+    ) -> CallToolResult:
+        """Send a tool call request, hedging reads if configured."""
+        if self._hedging is None or not self.is_read_only(name):
+            return await self._send_once(
+                name, final_args, meta, account, sent_at=sent_at
+            )
+        return await self._send_hedged(
+            self._hedging, name, final_args, meta, account, sent_at
+        )
+
+    async def _send_hedged(
+        self,
+        hedging: HedgePolicy,
+        name: str,
+        final_args: Dict[str, Any],
+        meta: Optional[Dict[str, Any]],
+        account: Optional[str],
+        sent_at: Optional[List[float]] = None,
+    ) -> CallToolResult:
+        """
+        Send a read, and a second copy on another session if it is slow.
+
+        The first successful response wins and the other request is
+        cancelled. If one copy fails while the other is still in flight,
+        the other decides the outcome.
+        """
+        siblings: Set[PooledSession] = set()
+
+        async def hedge() -> CallToolResult:
+            with self._instrumenter.phase(Phase.HEDGE):
+                return await self._send_once(
+                    name, final_args, meta, account, siblings, sent_at
+                )
+
+        started = time.monotonic()
+        primary = asyncio.create_task(
+            self._send_once(
+                name, final_args, meta, account, siblings, sent_at
+            )
+        )
+        pending: Set["asyncio.Task[CallToolResult]"] = {primary}
+        try:
+            delay = hedging.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and hedging.try_hedge():
+                    pending.add(asyncio.create_task(hedge()))
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    if task.exception() is None:
+                        hedging.record(
+                            time.monotonic() - started,
+                            hedge_won=task is not primary,
+                        )
+                        return task.result()
+                    if error is None or task is primary:
+                        error = task.exception()
+            raise error or asyncio.CancelledError()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _send_once(
+        self,
+        name: str,
+        final_args: Dict[str, Any],
+        meta: Optional[Dict[str, Any]],
+        account: Optional[str] = None,
+        siblings: Optional[Set[PooledSession]] = None,
+        sent_at: Optional[List[float]] = None,
+    ) -> CallToolResult:
+        """
+        Send a single tool call request, classifying failures.
+
+        The time each request goes out on a session is appended to
+        `sent_at`.
+        """
+        attempt_timeout = self._timeouts.get("attempt_timeout")
+        instrumenter = self._instrumenter
 
-                return json.dumps(result.model_dump())
+        async def request(session: ClientSession) -> CallToolResult:
+            if sent_at is not None:
+                sent_at.append(time.monotonic())
+            with instrumenter.phase(Phase.REQUEST):
+                return await session.call_tool(name, final_args, meta=meta)
 
+        try:
+            return await self._with_session(
+                request,
+                timeout=attempt_timeout,
+                account=account,
+                siblings=siblings,
+                # A write that may have been sent is only resent if
+                # the retry policy allows it
+                resend=self.is_read_only(name) or self._retry.retry_writes,
+            )
+        except McpTimeoutError as e:
+            raise McpTimeoutError(
+                f"Tool '{name}' attempt timed out after {e.timeout:.3g}s",
+                timeout=e.timeout,
+                retryable=True,
+            ) from e
         except Exception as e:
+            raise classify_error(e, name) from e
+
+    def add_instrumentation(self, hook: Instrumentation) -> None:
+        """Register a hook receiving the timing of each tool call phase."""
+        self._instrumenter.add(hook)
+
+    def remove_instrumentation(self, hook: Instrumentation) -> None:
+        """Unregister an instrumentation hook."""
+        self._instrumenter.remove(hook)
+
+    @property
+    def circuit_state(self) -> Optional[CircuitState]:
+        """Circuit breaker state, or None when the breaker is off."""
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.state
+
+    @property
+    def circuit_stats(self) -> Optional[CircuitBreakerStats]:
+        """Circuit breaker window and history, or None when it is off."""
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.stats()
+
+    @property
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Hedging counters and delay, or None when hedging is off."""
+        if self._hedging is None:
+            return None
+        return self._hedging.stats()
+
+    @property
+    def rate_limit_stats(self) -> Optional[RateLimiterStats]:
+        """Rate limiter counters, or None when rate limiting is off."""
+        if self._rate_limiter is None:
+            return None
+        return self._rate_limiter.stats()
+
+    @property
+    def retry_counts(self) -> Dict[str, int]:
+        """Number of retries performed, per tool name."""
+        return self._retry.retry_counts()
+
+    async def call_tools_batch(
+        self,
+        calls: Iterable[BatchToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchToolResult]:
+        """
+        Execute many independent tool calls concurrently.
+
+        Args:
+            calls: (method, args), (method, args, customer) or
+                (method, args, customer, account) tuples
+            max_concurrency: Maximum number of calls from this batch
+                running at once
+
+        Returns:
+            One result per call, in input order. A failed call sets
+            `error` on its own result instead of aborting the batch.
+        """
+        normalized = self._normalize_batch(calls)
+        results: List[Optional[BatchToolResult]] = [None] * len(normalized)
+        async for item in self._iter_batch(normalized, max_concurrency):
+            results[item["index"]] = item
+        return [r for r in results if r is not None]
+
+    async def iter_tools_batch(
+        self,
+        calls: Iterable[BatchToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncGenerator[BatchToolResult, None]:
+        """
+        Execute many independent tool calls concurrently, yielding each
+        result as soon as it completes.
+
+        Results carry their input `index` since they arrive out of order.
+        Closing the iterator early cancels the calls still running.
+        """
+        normalized = self._normalize_batch(calls)
+        async for item in self._iter_batch(normalized, max_concurrency):
+            yield item
+
+    def _normalize_batch(
+        self, calls: Iterable[BatchToolCall]
+    ) -> List[_NormalizedCall]:
+        if not self._initializer.is_initialized:
             raise RuntimeError(
-                f"Failed to execute tool '{name}': {str(e)}"
-            ) from e
+                "MCP client not connected. "
+                "Call connect() before calling tools."
+            )
 
-    async def disconnect(self) -> None:
-        """Disconnect from MCP server. Safe to call multiple times.
+        normalized: List[_NormalizedCall] = []
+        for call in calls:
+            if not 2 <= len(call) <= 4:
+                raise ValueError(
+                    "Batch calls must be (method, args), "
+                    "(method, args, customer) or "
+                    "(method, args, customer, account) tuples."
+                )
+            padding = (None,) * (4 - len(call))
+            normalized.append((*call, *padding))  # type: ignore[arg-type]
+        return normalized
 
-        Note: With the new architecture, connections are opened and closed
-        per-operation, so this just resets the initialized state.
+    async def _iter_batch(
+        self,
+        calls: Sequence[_NormalizedCall],
+        max_concurrency: int,
+    ) -> AsyncGenerator[BatchToolResult, None]:
+        if not calls:
+            return
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        completed: "asyncio.Queue[BatchToolResult]" = asyncio.Queue()
+        pending = iter(enumerate(calls))
+
+        async def worker() -> None:
+            # Workers share one iterator, so each call is taken exactly once
+            for index, (method, args, customer, account) in pending:
+                result: Optional[str] = None
+                error: Optional[Exception] = None
+                try:
+                    result = await self.call_tool(
+                        method, args, customer, account=account
+                    )
+                except Exception as e:
+                    error = e
+                completed.put_nowait(BatchToolResult(
+                    index=index, method=method, result=result, error=error
+                ))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrency, len(calls)))
+        ]
+        try:
+            for _ in range(len(calls)):
+                yield await completed.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _close_pools(self) -> None:
+        pools = [
+            self._pool,
+            *self._loop_pools.values(),
+            *self._account_pools.values(),
+        ]
+        self._pool = None
+        self._loop_pools.clear()
+        self._account_pools.clear()
+        await asyncio.gather(*(
+            _close_pool(pool) for pool in pools if pool is not None
+        ))
+        if self._closing_pools:
+            await asyncio.gather(
+                *(asyncio.wrap_future(f) for f in list(self._closing_pools)),
+                return_exceptions=True,
+            )
+
+    def _after_fork(self) -> None:
+        """
+        Forget the parent's sessions in a forked child. Their connections
+        are shared with the parent, so they are dropped without closing;
+        the catalog is kept, and sessions reopen on first use.
+        """
+        self._pool = None
+        self._loop_pools.clear()
+        self._account_pools.clear()
+        self._closing_pools.clear()
+        # Slots held by the parent's requests would never be released
+        self._limiter = ConcurrencyLimiter(self._limiter.limit)
+        # So would fetches the parent was coalescing
+        if self._single_flight is not None:
+            self._single_flight = SingleFlight()
+        self._revalidate_task = None
+        self._rewarm_task = None
+        self._refresh_task = None
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from MCP server and close all pooled sessions.
+        Safe to call multiple times.
         """
         if not self._initializer.is_initialized:
             return
 
-        self._tools = []
+        for task in (
+            self._revalidate_task, self._rewarm_task, self._refresh_task
+        ):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._revalidate_task = None
+        self._rewarm_task = None
+        self._refresh_task = None
+
+        await self._close_pools()
+        self._set_tools([])
         self._initializer.reset()
+
+
+_clients: "weakref.WeakSet[StripeMcpClient]" = weakref.WeakSet()
+
+
+def _forget_sessions_after_fork() -> None:
+    for client in list(_clients):
+        client._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_sessions_after_fork)
@@ -0,0 +1,392 @@
+"""In-process metrics: counters, gauges and latency histograms."""
+
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+from typing_extensions import TypedDict
+
+from .locks import fork_safe_lock
+from .instrumentation import Instrumentation, Phase, PhaseEvent
+
+# Latency buckets in seconds, from a cache hit to a slow Stripe API call
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+class MetricSample(TypedDict):
+    """Value of one labelled counter or gauge series."""
+
+    labels: Dict[str, str]
+    value: float
+
+
+class HistogramSample(TypedDict):
+    """
+    State of one labelled histogram series. `buckets` holds cumulative
+    counts of observations at or below each upper bound, ending with inf.
+    """
+
+    labels: Dict[str, str]
+    buckets: List[Tuple[float, int]]
+    sum: float
+    count: int
+
+
+class MetricSnapshot(TypedDict):
+    """Point-in-time copy of one metric and all its series."""
+
+    type: str  # 'counter' | 'gauge' | 'histogram'
+    help: str
+    samples: List[Union[MetricSample, HistogramSample]]
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = fork_safe_lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = fork_safe_lock()
+        self._bounds = bounds
+        # Per-bucket (non-cumulative) counts; the last bucket is +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric:
+    """A named metric with one series per combination of label values."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[LabelValues, Any] = {}
+        self._lock = fork_safe_lock()
+
+    def labels(self, *values: Optional[str]) -> Any:
+        """The series for the given label values, created on first use."""
+        key = tuple("" if v is None else str(v) for v in values)
+        series = self._series.get(key)
+        if series is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"Metric {self.name} expects labels "
+                    f"{self.labelnames}, got {len(key)} values."
+                )
+            # Only creating a series takes the metric-wide lock
+            with self._lock:
+                series = self._series.get(key)
+                if series is None:
+                    series = self._series[key] = self._new_series()
+        return series
+
+    def _new_series(self) -> Any:
+        return _Value()
+
+    def _items(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = list(self._series.items())
+        return [(dict(zip(self.labelnames, k)), v) for k, v in items]
+
+    def snapshot(self) -> MetricSnapshot:
+        samples: List[Union[MetricSample, HistogramSample]] = [
+            MetricSample(labels=labels, value=series.value)
+            for labels, series in self._items()
+        ]
+        return MetricSnapshot(type=self.type, help=self.help, samples=samples)
+
+
+class Counter(_Metric):
+    """Monotonic count, e.g. of calls. Use labels(...).inc()."""
+
+    type = "counter"
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. calls in flight."""
+
+    type = "gauge"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, e.g. latencies, in buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def _new_series(self) -> Any:
+        return _HistogramValue(self.buckets)
+
+    def snapshot(self) -> MetricSnapshot:
+        samples: List[Union[MetricSample, HistogramSample]] = []
+        for labels, series in self._items():
+            with series._lock:
+                counts = list(series.counts)
+                total, count = series.sum, series.count
+            cumulative, buckets = 0, []
+            for bound, n in zip((*self.buckets, math.inf), counts):
+                cumulative += n
+                buckets.append((bound, cumulative))
+            samples.append(HistogramSample(
+                labels=labels, buckets=buckets, sum=total, count=count
+            ))
+        return MetricSnapshot(type=self.type, help=self.help, samples=samples)
+
+
+class MetricsRegistry:
+    """
+    A set of named metrics, with a snapshot API and a Prometheus text
+    exporter.
+
+    Every series has its own lock, so concurrent updates only contend when
+    they touch the same tool and account. One registry can be shared by
+    many clients and toolkits.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = fork_safe_lock()
+
+    def counter(
+        self, name: str, help: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._get(Counter, name, help, labelnames)
+
+    def gauge(
+        self, name: str, help: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._get(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get(Histogram, name, help, labelnames, buckets)
+
+    def _get(self, cls: Any, name: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args)
+        if type(metric) is not cls:
+            raise ValueError(
+                f"Metric {name} is already registered as a {metric.type}."
+            )
+        return metric
+
+    def snapshot(self) -> Dict[str, MetricSnapshot]:
+        """Copy the current value of every metric, keyed by name."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        return {name: metric.snapshot() for name, metric in metrics}
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format,
+        served with PROMETHEUS_CONTENT_TYPE.
+        """
+        lines: List[str] = []
+        for name, snapshot in self.snapshot().items():
+            lines.append(f"# HELP {name} {_escape_help(snapshot['help'])}")
+            lines.append(f"# TYPE {name} {snapshot['type']}")
+            for sample in snapshot["samples"]:
+                labels = _format_labels(sample["labels"])
+                if snapshot["type"] != "histogram":
+                    value = cast(MetricSample, sample)["value"]
+                    lines.append(f"{name}{labels} {_format_value(value)}")
+                    continue
+                histogram = cast(HistogramSample, sample)
+                for bound, count in histogram["buckets"]:
+                    le = _format_labels(
+                        {**sample["labels"], "le": _format_value(bound)}
+                    )
+                    lines.append(f"{name}_bucket{le} {count}")
+                lines.append(
+                    f"{name}_sum{labels} {_format_value(histogram['sum'])}"
+                )
+                lines.append(f"{name}_count{labels} {histogram['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            k,
+            v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for k, v in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class MetricsInstrumentation(Instrumentation):
+    """
+    Feeds tool call phase events from a StripeMcpClient into a registry.
+
+    Records, per tool and account, calls, errors by exception class,
+    calls in flight, call latency and the number of MCP requests sent
+    (retries included), plus the latency of each phase.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        labels = ("tool", "account")
+        self._calls = registry.counter(
+            "stripe_mcp_calls_total", "Tool calls made.", labels
+        )
+        self._errors = registry.counter(
+            "stripe_mcp_call_errors_total",
+            "Tool calls that failed, by exception class.",
+            (*labels, "error"),
+        )
+        self._in_flight = registry.gauge(
+            "stripe_mcp_calls_in_flight", "Tool calls in progress.", labels
+        )
+        self._duration = registry.histogram(
+            "stripe_mcp_call_duration_seconds",
+            "Tool call latency, including queueing and retries.",
+            labels,
+        )
+        self._requests = registry.counter(
+            "stripe_mcp_requests_total",
+            "MCP tool call requests sent, including retries.",
+            labels,
+        )
+        self._phases = registry.histogram(
+            "stripe_mcp_phase_duration_seconds",
+            "Latency of each phase of a tool call.",
+            ("phase",),
+        )
+
+    def on_start(self, event: PhaseEvent) -> None:
+        if event.phase == Phase.CALL:
+            self._in_flight.labels(event.tool, event.account).inc()
+
+    def on_end(self, event: PhaseEvent) -> None:
+        duration = event.duration or 0.0
+        if event.phase != Phase.CALL:
+            self._phases.labels(event.phase).observe(duration)
+            if event.phase == Phase.REQUEST:
+                self._requests.labels(event.tool, event.account).inc()
+            return
+
+        self._in_flight.labels(event.tool, event.account).dec()
+        self._calls.labels(event.tool, event.account).inc()
+        self._duration.labels(event.tool, event.account).observe(duration)
+        if event.error is not None:
+            self._errors.labels(
+                event.tool, event.account, event.error
+            ).inc()
+
+
+class ToolRunMetrics:
+    """
+    Records ToolkitCore.run_tool calls, the entry point used by agent
+    framework adapters, per tool and account.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        labels = ("tool", "account")
+        self._runs = registry.counter(
+            "stripe_toolkit_tool_runs_total", "Toolkit tool runs.", labels
+        )
+        self._errors = registry.counter(
+            "stripe_toolkit_tool_run_errors_total",
+            "Toolkit tool runs that failed, by exception class.",
+            (*labels, "error"),
+        )
+        self._duration = registry.histogram(
+            "stripe_toolkit_tool_run_duration_seconds",
+            "Toolkit tool run latency.",
+            labels,
+        )
+
+    @contextmanager
+    def track(self, tool: str, account: Optional[str]) -> Iterator[None]:
+        """Time a tool run, counting it and any error it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._errors.labels(tool, account, type(e).__name__).inc()
+            raise
+        finally:
+            self._runs.labels(tool, account).inc()
+            self._duration.labels(tool, account).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,58 @@
+"""Cursor handling for Stripe list and search responses."""
+
+from typing import Any, Collection, Dict, List, Optional
+
+# Stripe caps list and search pages at 100 objects
+MAX_PAGE_SIZE = 100
+
+
+def is_page(payload: Any) -> bool:
+    """Whether a tool result is a page of a Stripe list or search."""
+    return (
+        isinstance(payload, dict)
+        and payload.get("object") in ("list", "search_result")
+        and isinstance(payload.get("data"), list)
+    )
+
+
+def page_items(payload: Any) -> List[Any]:
+    """The objects on a page; a result that is not a page is one item."""
+    if is_page(payload):
+        return payload["data"]
+    return [payload]
+
+
+def has_more(payload: Any) -> bool:
+    """Whether the server has more objects after this page."""
+    return is_page(payload) and bool(payload.get("has_more"))
+
+
+def next_page_args(
+    args: Dict[str, Any], payload: Any, arguments: Collection[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Arguments fetching the page after `payload`, or None on the last page.
+
+    Lists continue with `starting_after` set to the last object's ID;
+    searches continue with `page` set to the response's `next_page`.
+    `arguments` are the ones the tool declares: a tool without the cursor
+    argument cannot be paged, and a cursor that does not move means the
+    server ignored it, so both end the iteration.
+    """
+    if not has_more(payload):
+        return None
+
+    if payload["object"] == "search_result":
+        cursor, value = "page", payload.get("next_page")
+    else:
+        data = payload["data"]
+        cursor = "starting_after"
+        value = (
+            data[-1].get("id")
+            if data and isinstance(data[-1], dict)
+            else None
+        )
+
+    if not value or cursor not in arguments or args.get(cursor) == value:
+        return None
+    return {**args, cursor: value}
@@ -0,0 +1,192 @@
+"""Client-side request rate limiting for Stripe Agent Toolkit."""
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+from typing_extensions import TypedDict
+
+from .locks import fork_safe_lock
+
+# Stripe's default per-account limits, in requests per second
+DEFAULT_LIVE_RATE = 100.0
+DEFAULT_TEST_RATE = 25.0
+
+# Buckets kept before idle ones are dropped; grows with the live ones
+BUCKET_PRUNE_THRESHOLD = 1024
+
+
+class RateLimiterStats(TypedDict):
+    """Counters for tuning the rate limiter."""
+
+    queued: int
+    delayed: int
+    total_wait: float
+    max_wait: float
+    penalties: int
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at `rate` tokens per second up to `burst`.
+
+    Callers reserve a token and are told how long to wait for it. Tokens
+    may go negative, so reservations are served in the order they were
+    made. Thread-safe.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        self._rate = rate
+        self._burst = max(1.0, burst)
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = fork_safe_lock()
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(
+                self._burst, self._tokens + (now - start) * self._rate
+            )
+        self._updated = max(now, self._updated)
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self._rate
+            return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that was never used."""
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + 1)
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for `seconds` and drain the bucket.
+
+        Used when the server reports a rate limit despite our budget.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def is_idle(self) -> bool:
+        """Check if the bucket is full and unblocked, like a new one."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._tokens >= self._burst and self._blocked_until <= now
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limits keyed by Stripe account.
+
+    Each connected account gets its own read and write buckets, matching
+    how Stripe enforces its limits. Calls over budget wait for a token
+    instead of failing, so bursts are smoothed out rather than turned into
+    429 responses. Buckets that have refilled are dropped as more accounts
+    come along, so memory follows the accounts in use, not all ever seen.
+    """
+
+    def __init__(
+        self,
+        read_rate: float = DEFAULT_LIVE_RATE,
+        write_rate: float = DEFAULT_LIVE_RATE,
+        read_burst: Optional[float] = None,
+        write_burst: Optional[float] = None,
+    ):
+        self._limits = {
+            False: (read_rate, read_burst or read_rate),
+            True: (write_rate, write_burst or write_rate),
+        }
+        self._buckets: Dict[Tuple[str, bool], TokenBucket] = {}
+        self._prune_at = BUCKET_PRUNE_THRESHOLD
+        self._lock = fork_safe_lock()
+
+        self._queued = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._penalties = 0
+
+    def _bucket(self, account: Optional[str], write: bool) -> TokenBucket:
+        key = (account or "", write)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._prune_at:
+                    self._prune()
+                rate, burst = self._limits[write]
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def _prune(self) -> None:
+        # An idle bucket is the same as a new one, so nothing is lost
+        idle = [k for k, b in self._buckets.items() if b.is_idle()]
+        for key in idle:
+            del self._buckets[key]
+        self._prune_at = max(BUCKET_PRUNE_THRESHOLD, 2 * len(self._buckets))
+
+    async def acquire(self, account: Optional[str], write: bool) -> float:
+        """
+        Wait until a request for `account` is within budget.
+
+        Returns the time spent waiting.
+        """
+        bucket = self._bucket(account, write)
+        wait = bucket.reserve()
+        if wait <= 0:
+            return 0.0
+
+        with self._lock:
+            self._queued += 1
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+        with self._lock:
+            self._delayed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        return wait
+
+    def penalize(
+        self, account: Optional[str], retry_after: Optional[float]
+    ) -> None:
+        """
+        Back off an account after the server rate limited it.
+
+        Both of the account's buckets are drained and, if the server said
+        how long to wait, paused for that long.
+        """
+        with self._lock:
+            self._penalties += 1
+        for write in (False, True):
+            self._bucket(account, write).penalize(retry_after or 0.0)
+
+    def stats(self) -> RateLimiterStats:
+        """Snapshot of the limiter counters."""
+        with self._lock:
+            return RateLimiterStats(
+                queued=self._queued,
+                delayed=self._delayed,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+                penalties=self._penalties,
+            )
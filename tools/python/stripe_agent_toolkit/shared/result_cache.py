@@ -0,0 +1,221 @@
+"""Read-through cache for idempotent tool results."""
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from typing_extensions import TypedDict
+
+from .locks import fork_safe_lock
+from .tool_result import ToolResult
+
+from .tool_rules import (
+    CallKey,
+    is_generic_read_tool,
+    resources_related,
+    tool_resource,
+)
+
+DEFAULT_RESULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+# Accounts whose write generation is tracked before all are forgotten
+MAX_TRACKED_ACCOUNTS = 1024
+
+CacheKey = CallKey
+CachedValue = ToolResult
+
+
+class ResultCacheStats(TypedDict):
+    """Counters for tuning the result cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "resource", "generic")
+
+    def __init__(
+        self,
+        value: CachedValue,
+        expires_at: float,
+        resource: str,
+        generic: bool,
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = value.size
+        self.resource = resource
+        self.generic = generic
+
+
+class ResultCache:
+    """
+    TTL + LRU cache of tool results.
+
+    Entries expire after `ttl` seconds and the least recently used entries
+    are evicted once `max_entries` or `max_bytes` is exceeded. Writes
+    invalidate cached reads of related resources for the same account, and
+    a per-account generation counter stops a read that raced with a write
+    from caching a stale result. Generations are drawn from one counter of
+    writes, so past MAX_TRACKED_ACCOUNTS accounts they can all be reset to
+    it without letting a stale read through.
+
+    All operations are synchronous and thread-safe.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        tools: Optional[List[str]] = None,
+    ):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._patterns = tools
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        # Writes so far, and the generation of accounts not in _generations
+        self._writes = 0
+        self._base_generation = 0
+        self._bytes = 0
+        self._lock = fork_safe_lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def is_cacheable(self, name: str) -> bool:
+        """
+        Check whether results of a read-only tool may be cached.
+
+        With explicit `tools` patterns only matching tools are cached;
+        otherwise every read-only tool is.
+        """
+        if self._patterns is None:
+            return True
+        return any(fnmatch.fnmatchcase(name, p) for p in self._patterns)
+
+    def generation(self, account: Optional[str]) -> int:
+        """Current write generation for an account."""
+        with self._lock:
+            return self._generations.get(
+                account or "", self._base_generation
+            )
+
+    def get(self, key: CacheKey) -> Optional[CachedValue]:
+        """Look up a cached result, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self, key: CacheKey, value: CachedValue, generation: int
+    ) -> None:
+        """
+        Cache a result fetched at `generation`.
+
+        Results fetched before a write to the same account are dropped.
+        """
+        name, _, account, _ = key
+        with self._lock:
+            if self._generations.get(
+                account, self._base_generation
+            ) != generation:
+                return
+            if value.size > self._max_bytes:
+                return
+
+            if key in self._entries:
+                self._remove(key)
+            entry = _Entry(
+                value,
+                time.monotonic() + self._ttl,
+                tool_resource(name),
+                is_generic_read_tool(name),
+            )
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+            while self._entries and (
+                len(self._entries) > self._max_entries
+                or self._bytes > self._max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate_for_write(
+        self, name: str, account: Optional[str]
+    ) -> int:
+        """
+        Drop cached reads a write tool may have changed.
+
+        Returns the number of entries removed.
+        """
+        written = tool_resource(name)
+        account_key = account or ""
+        with self._lock:
+            self._writes += 1
+            if (
+                account_key not in self._generations
+                and len(self._generations) >= MAX_TRACKED_ACCOUNTS
+            ):
+                # Reads in flight for any account started before this
+                # write, so moving every account past it is safe
+                self._generations.clear()
+                self._base_generation = self._writes
+            self._generations[account_key] = self._writes
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[2] == account_key
+                and (
+                    entry.generic
+                    or resources_related(entry.resource, written)
+                )
+            ]
+            for key in stale:
+                self._remove(key)
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> ResultCacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
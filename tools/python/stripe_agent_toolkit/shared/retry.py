@@ -0,0 +1,117 @@
+"""Retry policy for transient Stripe MCP failures."""
+
+import random
+from typing import Dict, Optional
+
+from .locks import fork_safe_lock
+from .errors import McpRateLimitError, StripeMcpError
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 0.2
+DEFAULT_MAX_DELAY = 5.0
+DEFAULT_BUDGET_RATIO = 0.2
+DEFAULT_MIN_RETRY_TOKENS = 10.0
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter and a retry budget.
+
+    Only retryable errors (transport, rate-limit and server errors) are
+    retried, up to max_attempts in total. Calls to mutating tools are only
+    retried after a rate-limit rejection, which the server refused
+    before acting on; after a dropped connection, 5xx or attempt timeout
+    the write may already have been applied, so it is retried only with
+    `retry_writes`. The budget bounds retries
+    fleet-wide: every call earns `budget_ratio` retry tokens (up to a cap)
+    and every retry spends one, so during an outage retries settle at
+    roughly `budget_ratio` of traffic instead of multiplying it.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        budget_ratio: float = DEFAULT_BUDGET_RATIO,
+        min_retry_tokens: float = DEFAULT_MIN_RETRY_TOKENS,
+        retry_writes: bool = False,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget_ratio = budget_ratio
+        self._max_tokens = min_retry_tokens
+        self._tokens = min_retry_tokens
+        self._retry_writes = retry_writes
+        self._retries: Dict[str, int] = {}
+        self._lock = fork_safe_lock()
+
+    @property
+    def max_attempts(self) -> int:
+        """Maximum attempts per call, including the first."""
+        return self._max_attempts
+
+    @property
+    def retry_writes(self) -> bool:
+        """Whether writes are retried after ambiguous failures."""
+        return self._retry_writes
+
+    def record_call(self) -> None:
+        """Earn retry budget for a new call."""
+        with self._lock:
+            self._tokens = min(
+                self._max_tokens, self._tokens + self._budget_ratio
+            )
+
+    def should_retry(
+        self,
+        error: BaseException,
+        attempt: int,
+        tool_name: str,
+        read_only: bool = True,
+    ) -> bool:
+        """
+        Decide whether to retry after `attempt` failed, spending budget
+        and counting the retry against the tool if so.
+        """
+        if attempt >= self._max_attempts:
+            return False
+        if not isinstance(error, StripeMcpError) or not error.retryable:
+            return False
+        if (
+            not read_only
+            and not self._retry_writes
+            and not isinstance(error, McpRateLimitError)
+        ):
+            # The write may have reached the server
+            return False
+
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._retries[tool_name] = self._retries.get(tool_name, 0) + 1
+        return True
+
+    def backoff(
+        self, attempt: int, error: Optional[BaseException] = None
+    ) -> float:
+        """
+        Delay before the next attempt.
+
+        Uses full jitter over an exponentially growing window, but never
+        less than a server-provided Retry-After.
+        """
+        window = min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        delay = random.uniform(0, window)
+        if isinstance(error, McpRateLimitError) and error.retry_after:
+            delay = max(delay, error.retry_after)
+        return delay
+
+    def retry_counts(self) -> Dict[str, int]:
+        """Number of retries performed, per tool name."""
+        with self._lock:
+            return dict(self._retries)
@@ -0,0 +1,601 @@
+"""Pool of long-lived MCP sessions for Stripe Agent Toolkit."""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Collection,
+    Coroutine,
+    Deque,
+    Optional,
+    Set,
+    TypeVar,
+)
+from typing_extensions import TypedDict
+
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+SessionFactory = Callable[[], AsyncContextManager[ClientSession]]
+R = TypeVar("R")
+
+# Cancellation message used to abort requests on a session that died
+_SESSION_LOST = "stripe_agent_toolkit: MCP session lost"
+
+DEFAULT_MIN_SIZE = 1
+DEFAULT_MAX_SIZE = 10
+DEFAULT_MAX_REQUESTS_PER_SESSION = 8
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 60.0
+DEFAULT_HEALTH_CHECK_TIMEOUT = 5.0
+DEFAULT_CLOSE_TIMEOUT = 5.0
+
+
+class WarmUpReport(TypedDict):
+    """Outcome and timing of warming a session pool."""
+
+    sessions: int  # open sessions afterwards
+    opened: int  # sessions opened by the warm-up
+    pinged: int  # already open sessions that answered a ping
+    failed: int  # sessions that failed to open or answer
+    duration: float  # seconds the warm-up took
+    slowest_open: Optional[float]  # seconds, connection plus handshake
+
+
+class SessionClosedError(ConnectionError):
+    """The MCP session closed before answering a request."""
+
+
+def is_session_failure(error: BaseException) -> bool:
+    """
+    Check whether an error means the session itself is no longer usable.
+
+    JSON-RPC errors returned by the server leave the session intact; anything
+    else (closed streams, HTTP failures, dropped connections) does not.
+    """
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return True
+
+
+class PooledSession:
+    """
+    An MCP session kept open by a dedicated owner task.
+
+    The transport and ClientSession contexts are entered and exited by the
+    same task, which keeps anyio cancel scopes happy while the session is
+    used from other tasks.
+    """
+
+    def __init__(self, factory: SessionFactory):
+        self._factory = factory
+        self._session: Optional[ClientSession] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.last_checked = self.created_at
+        self.use_count = 0
+        self.in_flight = 0
+        self.broken = False
+        self.draining = False
+        self._waiting: Set["asyncio.Task[Any]"] = set()
+
+    async def open(self) -> None:
+        """Open the session and complete the MCP handshake."""
+        self._task = asyncio.create_task(self._run())
+        try:
+            await self._ready.wait()
+        except asyncio.CancelledError:
+            self._closing.set()
+            raise
+
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        """Hold the session contexts open until close() is requested."""
+        try:
+            async with self._factory() as session:
+                self._session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._session = None
+            self._ready.set()
+            # Requests still waiting on the session would never be answered
+            for task in self._waiting:
+                task.cancel(_SESSION_LOST)
+
+    async def run(self, operation: Callable[[ClientSession], Awaitable[R]]) -> R:
+        """
+        Run an operation on the session.
+
+        If the session dies while the operation is waiting on it (e.g. the
+        transport failed on an HTTP error), the operation is abandoned and
+        the error that ended the session is raised instead.
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        self._waiting.add(task)
+        try:
+            return await operation(self.session)
+        except asyncio.CancelledError as e:
+            if e.args != (_SESSION_LOST,):
+                raise
+            task.uncancel()
+            raise self._error or SessionClosedError(
+                "MCP session closed while a request was in flight."
+            ) from None
+        finally:
+            self._waiting.discard(task)
+
+    @property
+    def session(self) -> ClientSession:
+        """The underlying ClientSession."""
+        if self._session is None:
+            raise RuntimeError("MCP session is not open.")
+        return self._session
+
+    @property
+    def is_usable(self) -> bool:
+        """Check if the session is open and may take new requests."""
+        return (
+            not self.broken
+            and not self.draining
+            and self._session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def failure_cause(
+        self, timeout: float = 0.1
+    ) -> Optional[BaseException]:
+        """
+        The error that tore the session down, if any.
+
+        Waits briefly for the owner task to finish, since the transport
+        error is recorded just after pending requests are failed.
+        """
+        if self._task is not None and not self._task.done():
+            await asyncio.wait({self._task}, timeout=timeout)
+        return self._error
+
+    @property
+    def is_retirable(self) -> bool:
+        """
+        Check if the session should be closed.
+
+        Draining sessions are kept open until their in-flight requests
+        finish, so other callers multiplexed on them are not cut off.
+        """
+        if self.is_usable:
+            return False
+        return not self.draining or self.broken or self.in_flight == 0
+
+    def mark_broken(self) -> None:
+        """Mark the session as broken so the pool replaces it."""
+        self.broken = True
+
+    def mark_draining(self) -> None:
+        """
+        Stop routing requests to the session and retire it once idle.
+
+        Used after a request was abandoned mid-flight, so a late response
+        or lingering server-side work cannot leak into later calls.
+        """
+        self.draining = True
+
+    async def ping(self, timeout: float) -> bool:
+        """Send an MCP ping, returning False if the session is unhealthy."""
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+        except Exception:
+            self.mark_broken()
+            return False
+        self.last_checked = time.monotonic()
+        return True
+
+    async def close(self, timeout: float = DEFAULT_CLOSE_TIMEOUT) -> None:
+        """Close the session. Safe to call multiple times."""
+        self._closing.set()
+        if self._task is None or self._task.done():
+            return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception:
+            pass
+
+
+class SessionPool:
+    """
+    Pool of long-lived MCP sessions.
+
+    MCP is a multiplexed JSON-RPC protocol, so each session carries up to
+    max_requests_per_session concurrent requests. New sessions are opened
+    only when every open session is saturated, up to max_size; beyond that,
+    callers wait in FIFO order for a free slot.
+
+    A background task closes sessions that have been idle longer than
+    idle_timeout (down to min_size), pings idle sessions every
+    health_check_interval, and replaces sessions that have broken.
+
+    The pool is bound to the event loop it was started on.
+    """
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        min_size: int = DEFAULT_MIN_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        health_check_timeout: float = DEFAULT_HEALTH_CHECK_TIMEOUT,
+        max_requests_per_session: int = DEFAULT_MAX_REQUESTS_PER_SESSION,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("min_size must be between 0 and max_size.")
+        if max_requests_per_session < 1:
+            raise ValueError("max_requests_per_session must be at least 1.")
+
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._max_requests_per_session = max_requests_per_session
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: Set[PooledSession] = set()
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._opening = 0
+        self._opening_claims = 0
+        self._closed = False
+        self._maintenance_task: Optional[asyncio.Task[None]] = None
+        self._background: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def min_size(self) -> int:
+        """Number of sessions the pool keeps open when idle."""
+        return self._min_size
+
+    @property
+    def size(self) -> int:
+        """Number of open sessions, idle or in use."""
+        return len(self._sessions)
+
+    @property
+    def idle_count(self) -> int:
+        """Number of open sessions with no request in flight."""
+        return sum(1 for p in self._sessions if p.in_flight == 0)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently running on pooled sessions."""
+        return sum(p.in_flight for p in self._sessions)
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if the pool has been closed."""
+        return self._closed
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The event loop the pool was started on, if started."""
+        return self._loop
+
+    def is_bound_to_running_loop(self) -> bool:
+        """Check if the pool belongs to the currently running event loop."""
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    async def start(self) -> None:
+        """Bind the pool to the running loop and warm min_size sessions."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._maintenance_task = asyncio.create_task(
+                self._maintain()
+            )
+        await self.fill()
+
+    async def fill(self) -> None:
+        """Open sessions until the pool holds at least min_size."""
+        missing = self._min_size - len(self._sessions) - self._opening
+        if missing <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self._open_session() for _ in range(missing)),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors and len(errors) == len(results) and not self._sessions:
+            raise errors[0]
+
+    async def warm(self, count: int) -> WarmUpReport:
+        """
+        Make `count` sessions (at most max_size) ready for requests.
+
+        Opens sessions, paying connection setup and the MCP handshake now,
+        until the pool holds `count`. Idle sessions that were already open
+        are pinged, keeping their connections alive; those that fail are
+        replaced.
+        """
+        self._check_open()
+        started = time.monotonic()
+        count = min(count, self._max_size)
+
+        idle = [
+            p for p in self._sessions if p.in_flight == 0 and p.is_usable
+        ]
+        pings = await asyncio.gather(
+            *(p.ping(self._health_check_timeout) for p in idle)
+        )
+        for pooled, healthy in zip(idle, pings):
+            if not healthy:
+                self._retire(pooled)
+
+        async def timed_open() -> float:
+            opened_at = time.monotonic()
+            await self._open_session()
+            return time.monotonic() - opened_at
+
+        missing = count - len(self._sessions) - self._opening
+        opens = await asyncio.gather(
+            *(timed_open() for _ in range(max(0, missing))),
+            return_exceptions=True,
+        )
+        open_times = [t for t in opens if isinstance(t, float)]
+
+        return WarmUpReport(
+            sessions=len(self._sessions),
+            opened=len(open_times),
+            pinged=sum(pings),
+            failed=pings.count(False) + len(opens) - len(open_times),
+            duration=time.monotonic() - started,
+            slowest_open=max(open_times, default=None),
+        )
+
+    @asynccontextmanager
+    async def session(
+        self, avoid: Collection[PooledSession] = ()
+    ) -> AsyncGenerator[PooledSession, None]:
+        """
+        Borrow a request slot on a session for the duration of the block.
+
+        Sessions in `avoid` are only used if no other session has a free
+        slot and the pool cannot grow.
+        """
+        pooled = await self._acquire(avoid)
+        try:
+            yield pooled
+        finally:
+            self._release(pooled)
+
+    async def _acquire(
+        self, avoid: Collection[PooledSession] = ()
+    ) -> PooledSession:
+        """Pick the least-loaded session, open a new one, or wait."""
+        while True:
+            self._check_open()
+
+            pooled = self._pick(avoid)
+            if pooled is not None:
+                return self._checkout(pooled)
+
+            # Sessions that are still opening will have room for more than
+            # just their opener; wait for one of those before opening more.
+            claim = self._opening_capacity() > 0
+            if (
+                not claim
+                and len(self._sessions) + self._opening < self._max_size
+            ):
+                pooled = await self._open_session()
+                self._check_open()
+                return self._checkout(pooled)
+
+            if avoid:
+                pooled = self._pick()
+                if pooled is not None:
+                    return self._checkout(pooled)
+
+            loop = asyncio.get_running_loop()
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            self._waiters.append(waiter)
+            if claim:
+                self._opening_claims += 1
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # We were woken just as we were cancelled; pass the
+                    # freed slot on to the next waiter
+                    self._wake_waiter()
+                raise
+            finally:
+                if claim:
+                    self._opening_claims -= 1
+
+    def _opening_capacity(self) -> int:
+        """Request slots on opening sessions not yet claimed by a waiter."""
+        return (
+            self._opening * (self._max_requests_per_session - 1)
+            - self._opening_claims
+        )
+
+    def _pick(
+        self, avoid: Collection[PooledSession] = ()
+    ) -> Optional[PooledSession]:
+        """
+        Choose a session with a free request slot.
+
+        Prefers the least-loaded session, then the most recently used, so
+        light traffic concentrates on few sessions and the rest go idle.
+        """
+        best: Optional[PooledSession] = None
+        for pooled in list(self._sessions):
+            if not pooled.is_usable:
+                if pooled.is_retirable:
+                    self._retire(pooled)
+                continue
+            if (
+                pooled.in_flight >= self._max_requests_per_session
+                or pooled in avoid
+            ):
+                continue
+            if best is None or (pooled.in_flight, -pooled.last_used) < (
+                best.in_flight,
+                -best.last_used,
+            ):
+                best = pooled
+        return best
+
+    def _checkout(self, pooled: PooledSession) -> PooledSession:
+        pooled.use_count += 1
+        pooled.in_flight += 1
+        pooled.last_used = time.monotonic()
+        return pooled
+
+    def _release(self, pooled: PooledSession) -> None:
+        """Return a request slot, replacing the session if broken."""
+        pooled.in_flight -= 1
+        pooled.last_used = time.monotonic()
+
+        if self._closed or pooled.is_retirable:
+            self._retire(pooled)
+        self._wake_waiter()
+
+    def _wake_waiter(self) -> bool:
+        """Tell the oldest waiter that a slot or session may be free."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
+
+    async def _open_session(self) -> PooledSession:
+        self._opening += 1
+        try:
+            pooled = PooledSession(self._factory)
+            await pooled.open()
+        except BaseException:
+            self._wake_waiter()
+            raise
+        finally:
+            self._opening -= 1
+
+        if self._closed:
+            self._spawn(pooled.close())
+        else:
+            self._sessions.add(pooled)
+            for _ in range(self._max_requests_per_session - 1):
+                if not self._wake_waiter():
+                    break
+        return pooled
+
+    def _retire(self, pooled: PooledSession) -> None:
+        """Drop a session from the pool and close it in the background."""
+        if pooled not in self._sessions:
+            return
+        self._sessions.discard(pooled)
+        self._spawn(pooled.close())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("MCP session pool is closed.")
+
+    async def _maintain(self) -> None:
+        """Periodically evict idle sessions, ping, and refill."""
+        interval = max(
+            0.05,
+            min(self._idle_timeout, self._health_check_interval) / 2,
+        )
+        while not self._closed:
+            await asyncio.sleep(interval)
+            try:
+                await self._run_maintenance()
+            except Exception:
+                # Maintenance is best-effort; the next pass will retry
+                pass
+
+    async def _run_maintenance(self) -> None:
+        now = time.monotonic()
+        idle = sorted(
+            (p for p in self._sessions if p.in_flight == 0),
+            key=lambda p: p.last_used,
+        )
+
+        for pooled in idle:
+            if len(self._sessions) <= self._min_size:
+                break
+            if now - pooled.last_used >= self._idle_timeout:
+                self._retire(pooled)
+
+        stale = [
+            p
+            for p in idle
+            if p in self._sessions
+            and now - max(p.last_used, p.last_checked)
+            >= self._health_check_interval
+        ]
+        for pooled in stale:
+            if not await pooled.ping(self._health_check_timeout):
+                self._retire(pooled)
+
+        for pooled in list(self._sessions):
+            if pooled.is_retirable:
+                self._retire(pooled)
+
+        if not self._closed:
+            await self.fill()
+
+    async def close(self) -> None:
+        """Close all sessions and stop maintenance. Safe to call repeatedly."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+        while self._wake_waiter():
+            pass
+
+        sessions = list(self._sessions)
+        self._sessions.clear()
+        await asyncio.gather(
+            *(p.close() for p in sessions), return_exceptions=True
+        )
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
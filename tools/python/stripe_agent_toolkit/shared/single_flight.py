@@ -0,0 +1,102 @@
+"""Coalescing of identical concurrent calls for Stripe Agent Toolkit."""
+
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Tuple,
+    TypeVar,
+)
+
+from .locks import fork_safe_lock
+
+R = TypeVar("R")
+
+
+class _Flight(Generic[R]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[R]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[R]):
+    """
+    Runs at most one call per key at a time; concurrent callers with the
+    same key share its result.
+
+    Callers await the shared call through asyncio.shield, so one caller
+    being cancelled does not affect the others. The shared call is only
+    cancelled once every caller waiting on it has gone away.
+
+    Calls are only shared between callers on the same event loop; each
+    loop has its own flights, and the table is safe to use from several
+    threads.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[
+            Tuple[asyncio.AbstractEventLoop, Hashable], _Flight[R]
+        ] = {}
+        self._coalesced = 0
+        self._lock = fork_safe_lock()
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that joined an in-flight call."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        """Run fn, or join the in-flight call with the same key."""
+        flight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            if flight is None:
+                flight = self._start(flight_key, fn)
+            else:
+                self._coalesced += 1
+            # Only callers on this loop touch the flight from here on
+            flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(flight_key, flight)
+
+    def _start(
+        self,
+        flight_key: Tuple[asyncio.AbstractEventLoop, Hashable],
+        fn: Callable[[], Awaitable[R]],
+    ) -> _Flight[R]:
+        flight: _Flight[R] = _Flight(asyncio.ensure_future(fn()))
+        self._flights[flight_key] = flight
+
+        def on_done(task: "asyncio.Task[R]") -> None:
+            self._forget(flight_key, flight)
+            # Mark the outcome as retrieved even if every waiter left
+            if not task.cancelled():
+                task.exception()
+
+        flight.task.add_done_callback(on_done)
+        return flight
+
+    def _forget(
+        self,
+        flight_key: Tuple[asyncio.AbstractEventLoop, Hashable],
+        flight: _Flight[R],
+    ) -> None:
+        with self._lock:
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
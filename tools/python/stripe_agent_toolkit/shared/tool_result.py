@@ -0,0 +1,136 @@
+"""Tool call results with lazily parsed payloads."""
+
+import json
+from typing import Any, Optional
+
+from mcp.types import CallToolResult
+
+_UNSET: Any = object()
+
+# Items of a list measured when estimating its size; the rest are assumed
+# to be alike
+_SIZE_SAMPLE = 16
+
+
+class ToolResult:
+    """
+    Result of a successful tool call.
+
+    `data` is the payload: the MCP `structuredContent` when the server
+    provides it, otherwise the text content parsed as JSON on first
+    access (or the text itself if it is not JSON). `text` is the text
+    content, serialized from the result only if the server sent none.
+    Neither is computed until asked for, and both are kept once computed.
+
+    Results may be shared between callers through the result cache and
+    read coalescing, so treat `data` as read-only.
+    """
+
+    __slots__ = ("_text", "_structured", "_data", "_result", "_size")
+
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        structured: Optional[Any] = None,
+        result: Optional[CallToolResult] = None,
+    ):
+        if text is None and structured is None and result is None:
+            raise ValueError("A ToolResult needs text or structured content.")
+        self._text = text
+        self._structured = structured
+        self._data: Any = _UNSET
+        self._result = result
+        self._size: Optional[int] = None
+
+    @classmethod
+    def from_mcp(cls, result: CallToolResult) -> "ToolResult":
+        """Wrap an MCP call_tool result, without parsing it."""
+        text = next(
+            (
+                getattr(c, "text", None)
+                for c in result.content
+                if hasattr(c, "text")
+            ),
+            None
+        )
+        return cls(
+            text=text or None,
+            structured=getattr(result, "structuredContent", None),
+            # Only needed to serialize a result without text content
+            result=None if text else result,
+        )
+
+    @property
+    def text(self) -> str:
+        """The result as text, as returned by call_tool()."""
+        if self._text is None:
+            if self._result is not None:
+                self._text = json.dumps(self._result.model_dump())
+            else:
+                self._text = json.dumps(self._structured)
+            self._result = None
+        return self._text
+
+    @property
+    def data(self) -> Any:
+        """The parsed payload, preferring structured content."""
+        if self._data is _UNSET:
+            if self._structured is not None:
+                self._data = self._structured
+            else:
+                try:
+                    self._data = json.loads(self.text)
+                except ValueError:
+                    self._data = self.text
+        return self._data
+
+    @property
+    def is_structured(self) -> bool:
+        """Whether the server sent structured content."""
+        return self._structured is not None
+
+    @property
+    def size(self) -> int:
+        """
+        Length of the text form, used to bound caches and in metrics.
+
+        For results without text content this is an estimate from the
+        structured content, so measuring never serializes a result.
+        """
+        if self._text is not None:
+            return len(self._text)
+        if self._size is None:
+            self._size = _estimate_size(
+                self._structured
+                if self._structured is not None
+                else self._result.model_dump()  # type: ignore[union-attr]
+            )
+        return self._size
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolResult(size={self.size}, "
+            f"is_structured={self.is_structured})"
+        )
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate length of a JSON-like value serialized with json.dumps."""
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        return 2 + sum(
+            len(str(k)) + 4 + _estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        sample = value[:_SIZE_SAMPLE]
+        measured = sum(_estimate_size(v) + 2 for v in sample)
+        return measured * len(value) // len(sample)
+    if value is None or isinstance(value, bool):
+        return 5
+    return len(repr(value))
@@ -0,0 +1,110 @@
+"""Tool classification helpers for Stripe Agent Toolkit."""
+
+import fnmatch
+import hashlib
+import json
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+# (tool name, normalized args, account, customer)
+CallKey = Tuple[str, str, str, str]
+
+# Stripe MCP tool names follow a `<verb>_<resource>` convention.
+READ_ONLY_PREFIXES = ("list_", "retrieve_", "search_", "fetch_", "get_")
+
+# Read tools that span many resource types and so are affected by any write.
+GENERIC_READ_PREFIXES = ("search_", "fetch_")
+
+
+def is_read_only_tool(
+    name: str, annotations: Optional[Mapping[str, Any]] = None
+) -> bool:
+    """
+    Check whether a tool only reads data.
+
+    The server's `readOnlyHint` annotation wins when present; otherwise the
+    tool name's verb prefix decides.
+    """
+    if annotations is not None:
+        hint = annotations.get("readOnlyHint")
+        if hint is not None:
+            return bool(hint)
+    return name.startswith(READ_ONLY_PREFIXES)
+
+
+def tool_allowed(
+    name: str,
+    allow: Optional[Sequence[str]] = None,
+    deny: Optional[Sequence[str]] = None,
+) -> bool:
+    """
+    Check a tool name against allow and deny lists of names or glob
+    patterns. Deny wins; without an allow list every tool is allowed.
+    """
+    if deny and any(fnmatch.fnmatchcase(name, p) for p in deny):
+        return False
+    return not allow or any(fnmatch.fnmatchcase(name, p) for p in allow)
+
+
+def is_generic_read_tool(name: str) -> bool:
+    """Check whether a read tool spans many resource types."""
+    return name.startswith(GENERIC_READ_PREFIXES)
+
+
+def tool_resource(name: str) -> str:
+    """
+    Derive the singular resource a tool acts on.
+
+    e.g. 'list_invoices' -> 'invoice', 'create_invoice_item' ->
+    'invoice_item', 'retrieve_balance' -> 'balance'.
+    """
+    _, _, resource = name.partition("_")
+    resource = resource or name
+    if resource.endswith("ies"):
+        return resource[:-3] + "y"
+    if resource.endswith("s") and not resource.endswith("ss"):
+        return resource[:-1]
+    return resource
+
+
+def resources_related(a: str, b: str) -> bool:
+    """
+    Check whether a write to one resource may change reads of the other.
+
+    Resources are related when one is a prefix of the other, e.g. writing an
+    'invoice_item' changes 'invoice' totals.
+    """
+    return a.startswith(b) or b.startswith(a)
+
+
+def normalize_args(args: Dict[str, Any]) -> str:
+    """
+    Canonical string form of tool arguments.
+
+    Keys are sorted and None values dropped, so argument order and explicit
+    nulls do not produce distinct keys.
+    """
+    return json.dumps(
+        {k: v for k, v in args.items() if v is not None},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def tool_digest(tool: Mapping[str, Any]) -> str:
+    """Content hash of a tool definition, to tell changed tools apart."""
+    return hashlib.sha256(
+        json.dumps(
+            tool, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def call_key(
+    name: str,
+    args: Dict[str, Any],
+    account: Optional[str],
+    customer: Optional[str],
+) -> CallKey:
+    """Identity of a tool call, for caching and coalescing."""
+    return (name, normalize_args(args), account or "", customer or "")
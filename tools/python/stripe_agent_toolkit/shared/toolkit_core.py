@@ -1,22 +1,62 @@
 """Base class for all Stripe Agent Toolkit implementations."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Dict, Any
+from typing import (
+    TypeVar,
+    Generic,
+    List,
+    Optional,
+    Dict,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Iterable,
+    Set,
+    Tuple,
+)
+from typing_extensions import TypedDict
 import warnings
 
-from .mcp_client import StripeMcpClient, McpTool
+from .mcp_client import (
+    StripeMcpClient,
+    McpClientConfig,
+    McpTool,
+    BatchToolCall,
+    BatchToolResult,
+    DEFAULT_BATCH_CONCURRENCY,
+)
 from .async_initializer import AsyncInitializer
+from .client_registry import client_registry
+from .metrics import ToolRunMetrics
+from .pagination import MAX_PAGE_SIZE, has_more, next_page_args, page_items
+from .session_pool import WarmUpReport
+from .tool_result import ToolResult
+from .tool_rules import tool_allowed, tool_digest
 from ..configuration import Configuration
 
 T = TypeVar("T")
 
 
+class CatalogDiff(TypedDict):
+    """Names of the tools that changed in a catalog refresh."""
+
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+
+
+ToolsChangedHook = Callable[[CatalogDiff], None]
+
+
 class ToolkitCore(ABC, Generic[T]):
     """
     Base class for all Stripe Agent Toolkit implementations.
 
     Subclasses override _convert_tools() to transform MCP tools
-    into framework-specific formats.
+    into framework-specific formats, and may override _convert_tool() to
+    convert one tool at a time for get_tool(). Tools are converted on first access, and only those let
+    through the `tool_filter` configuration are exposed.
 
     Example:
         class MyToolkit(ToolkitCore[List[MyTool]]):
@@ -24,7 +64,10 @@ class ToolkitCore(ABC, Generic[T]):
                 return []
 
             def _convert_tools(self, mcp_tools: List[McpTool]) -> List[MyTool]:
-                return [MyTool(t) for t in mcp_tools]
+                return [self._tool(t) for t in mcp_tools]
+
+            def _convert_tool(self, mcp_tool: McpTool) -> MyTool:
+                return MyTool(mcp_tool)
 
         toolkit = MyToolkit('rk_test_...')
         await toolkit.initialize()
@@ -39,14 +82,52 @@ class ToolkitCore(ABC, Generic[T]):
     ):
         self._configuration = configuration or {}
         context = self._configuration.get("context") or {}
-        self._mcp_client = StripeMcpClient({
+        self._client_config: McpClientConfig = {
             "secret_key": secret_key,
             "account": context.get("account"),
             "customer": context.get("customer"),
             "mode": context.get("mode"),
-        })
+            "pool": self._configuration.get("pool"),
+            "max_concurrency": self._configuration.get("max_concurrency"),
+            "max_account_pools": self._configuration.get(
+                "max_account_pools"
+            ),
+            "catalog_cache": self._configuration.get("catalog_cache"),
+            "result_cache": self._configuration.get("result_cache"),
+            "coalesce_reads": self._configuration.get("coalesce_reads"),
+            "retry": self._configuration.get("retry"),
+            "rate_limit": self._configuration.get("rate_limit"),
+            "timeouts": self._configuration.get("timeouts"),
+            "circuit_breaker": self._configuration.get("circuit_breaker"),
+            "hedging": self._configuration.get("hedging"),
+            "warm_up": self._configuration.get("warm_up"),
+            "catalog_refresh_interval": self._configuration.get(
+                "catalog_refresh_interval"
+            ),
+            "server_url": self._configuration.get("mcp_server_url"),
+            "transport": self._configuration.get("transport"),
+            "instrumentation": self._configuration.get("instrumentation"),
+            "metrics": self._configuration.get("metrics"),
+        }
+        self._share_client = bool(self._configuration.get("share_client"))
+        self._mcp_client = self._acquire_client()
+        metrics = self._configuration.get("metrics")
+        self._run_metrics: Optional[ToolRunMetrics] = (
+            ToolRunMetrics(metrics) if metrics is not None else None
+        )
+        self._client_released = False
+        tool_filter = self._configuration.get("tool_filter") or {}
+        self._allow = tool_filter.get("allow")
+        self._deny = tool_filter.get("deny")
         self._initializer = AsyncInitializer()
-        self._tools: T = self._empty_tools()
+        # Allowed MCP tools by name, in catalog order, and their digests
+        self._mcp_tools: Dict[str, McpTool] = {}
+        self._digests: Dict[str, str] = {}
+        # Framework tools converted so far: name -> (digest, tool)
+        self._converted: Dict[str, Tuple[str, Any]] = {}
+        # Converted tool collection; None until first asked for
+        self._tools: Optional[T] = None
+        self._tools_changed_hooks: List[ToolsChangedHook] = []
 
     @abstractmethod
     def _empty_tools(self) -> T:
@@ -69,6 +150,41 @@ class ToolkitCore(ABC, Generic[T]):
         """
         pass
 
+    def _convert_tool(self, mcp_tool: McpTool) -> Any:
+        """
+        Convert a single MCP tool to a framework tool, for get_tool().
+
+        By default the tool is converted through _convert_tools() as a
+        collection of one, and its only item returned. Override to convert
+        tools one at a time, and build the collection in _convert_tools()
+        from _tool() so that both share tool objects.
+        """
+        converted: Any = self._convert_tools([mcp_tool])
+        if isinstance(converted, dict):
+            items = list(converted.values())
+        elif isinstance(converted, (list, tuple)):
+            items = list(converted)
+        else:
+            return converted
+        return items[0] if len(items) == 1 else converted
+
+    def _tool(self, mcp_tool: McpTool) -> Any:
+        """
+        Convert an MCP tool, or reuse the conversion of an identical
+        definition.
+        """
+        name = mcp_tool["name"]
+        if self._mcp_tools.get(name) is mcp_tool:
+            digest = self._digests[name]
+        else:
+            digest = tool_digest(mcp_tool)
+        converted = self._converted.get(name)
+        if converted is not None and converted[0] == digest:
+            return converted[1]
+        tool = self._convert_tool(mcp_tool)
+        self._converted[name] = (digest, tool)
+        return tool
+
     async def initialize(self) -> None:
         """
         Initialize the toolkit by connecting to MCP server and fetching tools.
@@ -77,11 +193,106 @@ class ToolkitCore(ABC, Generic[T]):
         """
         await self._initializer.initialize(self._do_initialize)
 
+    def _acquire_client(self) -> StripeMcpClient:
+        """
+        Create the MCP client, or take a reference to the process-wide
+        one for these settings when share_client is set.
+        """
+        if self._share_client:
+            client = client_registry.acquire(self._client_config)
+        else:
+            client = StripeMcpClient(self._client_config)
+        client.add_tools_listener(self._on_tools_changed)
+        return client
+
     async def _do_initialize(self) -> None:
         """Internal initialization logic."""
+        if self._client_released:
+            # Re-initialized after close(): the shared client may be gone
+            self._mcp_client = self._acquire_client()
+            self._client_released = False
         await self._mcp_client.connect()
-        mcp_tools = self._mcp_client.get_tools()
-        self._tools = self._convert_tools(mcp_tools)
+        self._set_catalog(self._mcp_client.get_tools())
+
+    def _allowed(
+        self, mcp_tools: List[McpTool]
+    ) -> Tuple[Dict[str, McpTool], Dict[str, str]]:
+        """The allowed tools by name, and their digests."""
+        allowed = {
+            t["name"]: t
+            for t in mcp_tools
+            if "name" in t
+            and tool_allowed(t["name"], self._allow, self._deny)
+        }
+        return allowed, {
+            name: tool_digest(t) for name, t in allowed.items()
+        }
+
+    def _set_catalog(self, mcp_tools: List[McpTool]) -> None:
+        """Keep the allowed tools, to be converted when first used."""
+        self._mcp_tools, self._digests = self._allowed(mcp_tools)
+        self._converted = {}
+        self._tools = None
+
+    def _on_tools_changed(self, mcp_tools: List[McpTool]) -> None:
+        """
+        Swap in a changed catalog, re-converting only the tools that were
+        added or changed, then tell the tools-changed hooks.
+        """
+        if not self._initializer.is_initialized:
+            return
+
+        allowed, digests = self._allowed(mcp_tools)
+        old = self._digests
+        diff = CatalogDiff(
+            added=[n for n in digests if n not in old],
+            changed=[n for n in digests if n in old and old[n] != digests[n]],
+            removed=[n for n in old if n not in digests],
+        )
+        if not (diff["added"] or diff["changed"] or diff["removed"]):
+            return
+
+        # Build the new collection before publishing anything, so readers
+        # see either the old tools or the new ones
+        tools = (
+            self._convert_tools(list(allowed.values()))
+            if self._tools is not None
+            else None
+        )
+        self._mcp_tools, self._digests = allowed, digests
+        self._tools = tools
+        self._converted = {
+            name: converted
+            for name, converted in self._converted.items()
+            if digests.get(name) == converted[0]
+        }
+
+        for hook in list(self._tools_changed_hooks):
+            hook(diff)
+
+    def add_tools_changed_hook(self, hook: ToolsChangedHook) -> None:
+        """
+        Register a callback told which tools changed whenever a refreshed
+        catalog changes the toolkit's tools, e.g. to rebuild an agent
+        with get_tools(). Hooks run inline and must not raise.
+        """
+        self._tools_changed_hooks.append(hook)
+
+    def remove_tools_changed_hook(self, hook: ToolsChangedHook) -> None:
+        """Unregister a callback added with add_tools_changed_hook()."""
+        if hook in self._tools_changed_hooks:
+            self._tools_changed_hooks.remove(hook)
+
+    async def refresh_tools(self) -> bool:
+        """
+        List the server's tools again now, swapping in any changes.
+        Returns whether the server's catalog changed.
+
+        Raises:
+            RuntimeError: If initialize() has not been called.
+        """
+        self._ensure_initialized()
+        return await self._mcp_client.refresh_catalog()
 
     @property
     def is_initialized(self) -> bool:
@@ -96,7 +307,28 @@ class ToolkitCore(ABC, Generic[T]):
             RuntimeError: If initialize() has not been called.
         """
         self._ensure_initialized()
-        return self._tools
+        return self._materialize()
+
+    def get_tool(self, name: str) -> Any:
+        """
+        Get one tool by name, converting only that tool.
+
+        Raises:
+            RuntimeError: If initialize() has not been called.
+            KeyError: If there is no such tool, or tool_filter hides it.
+        """
+        self._ensure_initialized()
+        mcp_tool = self._mcp_tools.get(name)
+        if mcp_tool is None:
+            raise KeyError(f"Unknown tool: {name}")
+        return self._tool(mcp_tool)
+
+    def _materialize(self) -> T:
+        tools = self._tools
+        if tools is None:
+            tools = self._convert_tools(list(self._mcp_tools.values()))
+            self._tools = tools
+        return tools
 
     def _get_tools_with_warning(self) -> T:
         """
@@ -104,19 +336,43 @@ class ToolkitCore(ABC, Generic[T]):
         Used for deprecated property access.
         """
         self._warn_if_not_initialized()
-        return self._tools
+        if not self._initializer.is_initialized:
+            return self._empty_tools()
+        return self._materialize()
+
+    async def warm_up(self, sessions: Optional[int] = None) -> WarmUpReport:
+        """
+        Open MCP sessions ahead of the first tool calls.
+
+        Set `warm_up: {"on_initialize": True}` in the configuration to do
+        this as part of initialize().
+
+        Raises:
+            RuntimeError: If initialize() has not been called.
+        """
+        self._ensure_initialized()
+        return await self._mcp_client.warm_up(sessions)
 
     async def close(self) -> None:
         """
         Close the MCP connection and clean up resources.
         Safe to call multiple times.
+
+        A shared client is only disconnected once every toolkit using it
+        has been closed.
         """
+        if self._share_client and not self._client_released:
+            self._mcp_client.remove_tools_listener(self._on_tools_changed)
+            self._client_released = True
+            await client_registry.release(self._mcp_client)
+
         if not self._initializer.is_initialized:
             return
 
-        await self._mcp_client.disconnect()
+        if not self._share_client:
+            await self._mcp_client.disconnect()
         self._initializer.reset()
-        self._tools = self._empty_tools()
+        self._set_catalog([])
 
     def _ensure_initialized(self) -> None:
         """Throw an error if not initialized."""
@@ -148,7 +404,10 @@ class ToolkitCore(ABC, Generic[T]):
         self,
         method: str,
         args: Dict[str, Any],
-        customer: Optional[str] = None
+        customer: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        account: Optional[str] = None,
     ) -> str:
         """
         Execute a tool via MCP.
@@ -157,9 +416,234 @@ class ToolkitCore(ABC, Generic[T]):
             method: Tool method name (e.g., 'create_customer')
             args: Tool arguments
             customer: Optional per-call customer override
+            timeout: Optional seconds the call may take, overriding the
+                configured call_timeout
+            deadline: Optional absolute time.monotonic() deadline
+            account: Optional connected account to act on, overriding
+                account_scope() and the configured context account
 
         Returns:
             JSON string result
+
+        Raises:
+            McpTimeoutError: If the call did not finish in time
+        """
+        result = await self.run_tool_result(
+            method,
+            args,
+            customer,
+            timeout=timeout,
+            deadline=deadline,
+            account=account,
+        )
+        return result.text
+
+    async def run_tool_result(
+        self,
+        method: str,
+        args: Dict[str, Any],
+        customer: Optional[str] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        account: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        Execute a tool via MCP, returning the result unparsed.
+
+        Takes the same arguments as run_tool(). Use the result's `data`
+        for the parsed payload instead of calling json.loads on the text.
+
+        Example:
+            result = await toolkit.run_tool_result("list_customers", {})
+            for customer in result.data["data"]:
+                print(customer["id"])
+        """
+        self._ensure_initialized()
+        if self._run_metrics is None:
+            return await self._mcp_client.call_tool_result(
+                method,
+                args,
+                customer,
+                timeout=timeout,
+                deadline=deadline,
+                account=account,
+            )
+        account = self._mcp_client.resolve_account(account)
+        with self._run_metrics.track(method, account):
+            return await self._mcp_client.call_tool_result(
+                method,
+                args,
+                customer,
+                timeout=timeout,
+                deadline=deadline,
+                account=account,
+            )
+
+    async def iter_tool(
+        self,
+        method: str,
+        args: Dict[str, Any],
+        customer: Optional[str] = None,
+        account: Optional[str] = None,
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Iterate over every object a list or search tool returns, following
+        pagination cursors.
+
+        The next page is fetched while the current one is consumed, and at
+        most one page beyond it is held in memory. A tool whose result is
+        not a page yields that result once. Only tools declaring the
+        cursor argument (`starting_after` for lists, `page` for searches)
+        are paged; for others, only the first page is yielded, with a
+        warning if the server reported more.
+
+        Example:
+            async for invoice in toolkit.iter_tool(
+                "list_invoices", {"customer": "cus_123"}, max_items=500
+            ):
+                print(invoice["id"])
+
+        Args:
+            method: Tool method name (e.g., 'list_customers')
+            args: Tool arguments for the first page
+            customer: Optional per-call customer override
+            account: Optional connected account to act on
+            max_items: Stop after this many objects
+            page_size: Objects per page, when the tool takes a `limit`
+                and args has none. Defaults to the maximum, 100.
+            prefetch: Fetch the next page while the current one is being
+                consumed
         """
         self._ensure_initialized()
-        return await self._mcp_client.call_tool(method, args, customer)
+        if max_items is not None and max_items <= 0:
+            return
+
+        account = self._mcp_client.resolve_account(account)
+        arguments = self._arguments(method)
+        # Size pages ourselves unless the caller chose a limit
+        limit: Optional[int] = None
+        page_args = dict(args)
+        if "limit" not in page_args and "limit" in arguments:
+            limit = min(page_size or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+            page_args["limit"] = _page_limit(limit, max_items)
+
+        async def fetch(fetch_args: Dict[str, Any]) -> Any:
+            result = await self.run_tool_result(
+                method, fetch_args, customer, account=account
+            )
+            return result.data
+
+        yielded = 0
+        pending: Optional["asyncio.Task[Any]"] = asyncio.create_task(
+            fetch(page_args)
+        )
+        try:
+            while pending is not None:
+                payload = await pending
+                pending = None
+
+                items = page_items(payload)
+                next_args = next_page_args(page_args, payload, arguments)
+                reached = False
+                if max_items is not None:
+                    items = items[:max_items - yielded]
+                    reached = yielded + len(items) >= max_items
+                if reached:
+                    next_args = None
+                elif next_args is None and has_more(payload):
+                    warnings.warn(
+                        f"[Stripe Agent Toolkit] '{method}' has more "
+                        f"results, but its cursor cannot be followed; "
+                        f"iteration stops after {yielded + len(items)} "
+                        f"objects."
+                    )
+                if next_args is not None and limit is not None:
+                    next_args["limit"] = _page_limit(
+                        limit,
+                        None if max_items is None
+                        else max_items - yielded - len(items),
+                    )
+                if next_args is not None and prefetch:
+                    pending = asyncio.create_task(fetch(next_args))
+
+                for item in items:
+                    yield item
+                    yielded += 1
+
+                if next_args is not None and not prefetch:
+                    pending = asyncio.create_task(fetch(next_args))
+                page_args = next_args or page_args
+        finally:
+            if pending is not None:
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    def _arguments(self, method: str) -> Set[str]:
+        """The arguments a tool's input schema declares."""
+        for tool in self._mcp_client.get_tools():
+            if tool.get("name") == method:
+                schema = tool.get("inputSchema") or {}
+                return set(schema.get("properties") or {})
+        return set()
+
+    async def run_tools_batch(
+        self,
+        calls: Iterable[BatchToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchToolResult]:
+        """
+        Execute many independent tools concurrently via MCP.
+
+        Example:
+            results = await toolkit.run_tools_batch([
+                ("retrieve_invoice", {"invoice": invoice_id})
+                for invoice_id in invoice_ids
+            ])
+            for item in results:
+                if item["error"] is None:
+                    print(item["result"])
+
+        Args:
+            calls: (method, args), (method, args, customer) or
+                (method, args, customer, account) tuples
+            max_concurrency: Maximum number of calls from this batch
+                running at once
+
+        Returns:
+            One result per call, in input order. A failed call sets
+            `error` on its own result instead of aborting the batch.
+        """
+        self._ensure_initialized()
+        return await self._mcp_client.call_tools_batch(
+            calls, max_concurrency
+        )
+
+    async def iter_tools_batch(
+        self,
+        calls: Iterable[BatchToolCall],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> AsyncGenerator[BatchToolResult, None]:
+        """
+        Execute many independent tools concurrently, yielding each result
+        as it completes.
+
+        Example:
+            async for item in toolkit.iter_tools_batch(calls):
+                handle(item["index"], item["result"], item["error"])
+        """
+        self._ensure_initialized()
+        async for item in self._mcp_client.iter_tools_batch(
+            calls, max_concurrency
+        ):
+            yield item
+
+
+def _page_limit(limit: int, remaining: Optional[int]) -> int:
+    """Page size for the next page, not fetching more than needed."""
+    return limit if remaining is None else max(1, min(limit, remaining))
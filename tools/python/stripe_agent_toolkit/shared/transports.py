@@ -0,0 +1,175 @@
+"""Transports that carry MCP sessions to a Stripe MCP server."""
+
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import anyio
+from anyio.streams.memory import (
+    MemoryObjectReceiveStream,
+    MemoryObjectSendStream,
+)
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.message import SessionMessage
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from mcp.server.lowlevel import Server
+
+# The client's ends of a connection: messages in, messages out
+Streams = Tuple[
+    MemoryObjectReceiveStream[Union[SessionMessage, Exception]],
+    MemoryObjectSendStream[SessionMessage],
+]
+
+STDIO_SECRET_KEY_ENV = "STRIPE_SECRET_KEY"
+STDIO_ACCOUNT_ENV = "STRIPE_ACCOUNT"
+
+
+class Transport(ABC):
+    """
+    Opens connections to an MCP server for StripeMcpClient.
+
+    Each pooled session gets its own connection, opened with the headers
+    of the account it acts on.
+    """
+
+    @property
+    @abstractmethod
+    def endpoint(self) -> str:
+        """Where the transport connects to, identifying cached catalogs."""
+        pass
+
+    @abstractmethod
+    def connect(self, headers: Dict[str, str]) -> AsyncContextManager[Streams]:
+        """Context manager yielding the streams of a new connection."""
+        pass
+
+
+class StreamableHttpTransport(Transport):
+    """Streamable HTTP, as served by mcp.stripe.com."""
+
+    def __init__(self, url: str):
+        self._url = url
+
+    @property
+    def endpoint(self) -> str:
+        return self._url
+
+    @asynccontextmanager
+    async def connect(
+        self, headers: Dict[str, str]
+    ) -> AsyncGenerator[Streams, None]:
+        async with streamablehttp_client(
+            self._url, headers=headers, terminate_on_close=False
+        ) as (read_stream, write_stream, _):
+            yield read_stream, write_stream
+
+
+class StdioTransport(Transport):
+    """
+    A local MCP server process, spoken to over its stdin and stdout.
+
+    Every session starts its own process, so size the pool accordingly.
+    The process gets the secret key as STRIPE_SECRET_KEY and the connected
+    account, if any, as STRIPE_ACCOUNT, on top of `env` and the variables
+    the MCP SDK considers safe to inherit.
+
+    Example:
+        StdioTransport("npx", ["-y", "@stripe/mcp", "--tools=all"])
+    """
+
+    def __init__(
+        self,
+        command: str,
+        args: Optional[List[str]] = None,
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+    ):
+        self._command = command
+        self._args = list(args or [])
+        self._env = dict(env or {})
+        self._cwd = cwd
+
+    @property
+    def endpoint(self) -> str:
+        return "stdio:" + " ".join([self._command, *self._args])
+
+    @asynccontextmanager
+    async def connect(
+        self, headers: Dict[str, str]
+    ) -> AsyncGenerator[Streams, None]:
+        from mcp.client.stdio import StdioServerParameters, stdio_client
+
+        env = {**self._env}
+        authorization = headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            env[STDIO_SECRET_KEY_ENV] = authorization[len("Bearer "):]
+        if "Stripe-Account" in headers:
+            env[STDIO_ACCOUNT_ENV] = headers["Stripe-Account"]
+
+        params = StdioServerParameters(
+            command=self._command, args=self._args, env=env, cwd=self._cwd
+        )
+        async with stdio_client(params) as (read_stream, write_stream):
+            yield read_stream, write_stream
+
+
+class InMemoryTransport(Transport):
+    """
+    An MCP server object running in this process, reached over memory
+    streams. Each connection runs its own server session on the server,
+    without sockets or serialization to bytes.
+
+    Headers are not sent; the server acts the same for every account.
+    """
+
+    def __init__(self, server: Union["Server[Any]", "FastMCP"]):
+        # FastMCP wraps a low-level server, which is what runs sessions
+        self._server: "Server[Any]" = getattr(server, "_mcp_server", server)
+
+    @property
+    def endpoint(self) -> str:
+        # Two server objects are two endpoints, even with the same name
+        return f"memory:{self._server.name}@{id(self._server):x}"
+
+    @asynccontextmanager
+    async def connect(
+        self, headers: Dict[str, str]
+    ) -> AsyncGenerator[Streams, None]:
+        server = self._server
+        to_client_send, to_client_receive = anyio.create_memory_object_stream[
+            Union[SessionMessage, Exception]
+        ](1)
+        to_server_send, to_server_receive = anyio.create_memory_object_stream[
+            Union[SessionMessage, Exception]
+        ](1)
+
+        async with (
+            to_client_send,
+            to_client_receive,
+            to_server_send,
+            to_server_receive,
+            anyio.create_task_group() as tg,
+        ):
+            tg.start_soon(
+                lambda: server.run(
+                    to_server_receive,
+                    to_client_send,
+                    server.create_initialization_options(),
+                )
+            )
+            try:
+                yield to_client_receive, to_server_send
+            finally:
+                tg.cancel_scope.cancel()
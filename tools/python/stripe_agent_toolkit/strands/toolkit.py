@@ -1,12 +1,13 @@
 """Stripe Agent Toolkit for Strands."""
 
-import asyncio
 import json
 from typing import List, Optional, Dict, Any, Callable, Awaitable
 
 from strands.tools.tools import PythonAgentTool as StrandTool
 
 from ..shared.toolkit_core import ToolkitCore
+from ..shared.errors import McpTimeoutError
+from ..shared.loop_bridge import run_sync
 from ..shared.mcp_client import McpTool
 from ..configuration import Configuration
 
@@ -57,20 +58,18 @@ def create_strand_tool(
         elif isinstance(tool_input, dict):
             actual_params = tool_input.copy()
 
-        # Call the MCP client (need to run async in sync context)
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(
-                    asyncio.run,
-                    run_tool(tool_name, actual_params)
-                )
-                result = future.result()
-        else:
-            result = loop.run_until_complete(
-                run_tool(tool_name, actual_params)
-            )
+        # Call the MCP client on the shared loop bridge
+        try:
+            result = run_sync(run_tool(tool_name, actual_params))
+        except McpTimeoutError as e:
+            # Report the timeout to the agent as a failed tool use
+            error_response: Dict[str, Any] = {
+                "status": "error",
+                "content": [{"text": str(e)}]
+            }
+            if tool_use_id:
+                error_response["toolUseId"] = tool_use_id
+            return error_response
 
         # Return in the format expected by strands
         response: Dict[str, Any] = {
@@ -123,10 +122,11 @@ class StripeAgentToolkit(ToolkitCore[List[StrandTool]]):
         mcp_tools: List[McpTool]
     ) -> List[StrandTool]:
         """Convert MCP tools to Strands StrandTool instances."""
-        return [
-            create_strand_tool(self.run_tool, t)
-            for t in mcp_tools
-        ]
+        return [self._tool(t) for t in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> StrandTool:
+        """Convert one MCP tool to a Strands StrandTool."""
+        return create_strand_tool(self.run_tool, mcp_tool)
 
     @property
     def tools(self) -> List[StrandTool]:
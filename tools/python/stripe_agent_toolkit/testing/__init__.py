@@ -0,0 +1,17 @@
+"""Testing utilities for Stripe Agent Toolkit."""
+
+from .catalog import (
+    canned_response,
+    paginated_tools,
+    stub_tools,
+    synthetic_tools,
+)
+from .stub_server import StubMcpServer
+
+__all__ = [
+    "StubMcpServer",
+    "canned_response",
+    "paginated_tools",
+    "stub_tools",
+    "synthetic_tools",
+]
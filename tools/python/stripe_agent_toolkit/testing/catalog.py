@@ -0,0 +1,347 @@
+"""Tool catalog and canned responses for the stub Stripe MCP server."""
+
+import copy
+import itertools
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..shared.mcp_client import McpTool, McpToolInputSchema
+from ..shared.tool_rules import is_read_only_tool, tool_resource
+
+_STRING = {"type": "string"}
+_INTEGER = {"type": "integer"}
+_LIMIT = {
+    "type": "integer",
+    "description": "Maximum number of objects to return (1-100).",
+    "minimum": 1,
+    "maximum": 100,
+}
+
+# (name, description, properties, required)
+_TOOL_SPECS: List[Tuple[str, str, Dict[str, Any], List[str]]] = [
+    (
+        "create_customer",
+        "Create a customer in Stripe.",
+        {"name": _STRING, "email": _STRING},
+        ["name"],
+    ),
+    (
+        "list_customers",
+        "Fetch a list of customers from Stripe.",
+        {"limit": _LIMIT, "email": _STRING},
+        [],
+    ),
+    (
+        "create_product",
+        "Create a product in Stripe.",
+        {"name": _STRING, "description": _STRING},
+        ["name"],
+    ),
+    (
+        "list_products",
+        "Fetch a list of products from Stripe.",
+        {"limit": _LIMIT},
+        [],
+    ),
+    (
+        "create_price",
+        "Create a price in Stripe.",
+        {"product": _STRING, "unit_amount": _INTEGER, "currency": _STRING},
+        ["product", "unit_amount", "currency"],
+    ),
+    (
+        "list_prices",
+        "Fetch a list of prices from Stripe.",
+        {"product": _STRING, "limit": _LIMIT},
+        [],
+    ),
+    (
+        "create_payment_link",
+        "Create a payment link in Stripe.",
+        {"price": _STRING, "quantity": _INTEGER},
+        ["price", "quantity"],
+    ),
+    (
+        "create_invoice",
+        "Create an invoice in Stripe.",
+        {"customer": _STRING, "days_until_due": _INTEGER},
+        ["customer"],
+    ),
+    (
+        "list_invoices",
+        "Fetch a list of invoices from Stripe.",
+        {"customer": _STRING, "limit": _LIMIT},
+        [],
+    ),
+    (
+        "create_invoice_item",
+        "Create an invoice item in Stripe.",
+        {"customer": _STRING, "price": _STRING, "invoice": _STRING},
+        ["customer", "price", "invoice"],
+    ),
+    (
+        "finalize_invoice",
+        "Finalize an invoice in Stripe.",
+        {"invoice": _STRING},
+        ["invoice"],
+    ),
+    (
+        "retrieve_balance",
+        "Retrieve the balance from Stripe.",
+        {},
+        [],
+    ),
+    (
+        "create_refund",
+        "Refund a payment intent in Stripe.",
+        {"payment_intent": _STRING, "amount": _INTEGER},
+        ["payment_intent"],
+    ),
+    (
+        "list_payment_intents",
+        "List payment intents in Stripe.",
+        {"customer": _STRING, "limit": _LIMIT},
+        [],
+    ),
+    (
+        "list_subscriptions",
+        "List all subscriptions in Stripe.",
+        {"customer": _STRING, "price": _STRING, "status": _STRING,
+         "limit": _LIMIT},
+        [],
+    ),
+    (
+        "cancel_subscription",
+        "Cancel a subscription in Stripe.",
+        {"subscription": _STRING},
+        ["subscription"],
+    ),
+    (
+        "update_subscription",
+        "Update an existing subscription in Stripe.",
+        {"subscription": _STRING, "proration_behavior": _STRING,
+         "items": {"type": "array", "items": {"type": "object"}}},
+        ["subscription"],
+    ),
+    (
+        "list_coupons",
+        "Fetch a list of coupons from Stripe.",
+        {"limit": _LIMIT},
+        [],
+    ),
+    (
+        "create_coupon",
+        "Create a coupon in Stripe.",
+        {"name": _STRING, "percent_off": {"type": "number"},
+         "amount_off": _INTEGER, "currency": _STRING, "duration": _STRING},
+        ["name"],
+    ),
+    (
+        "update_dispute",
+        "Update a dispute in Stripe.",
+        {"dispute": _STRING, "evidence": {"type": "object"},
+         "submit": {"type": "boolean"}},
+        ["dispute"],
+    ),
+    (
+        "list_disputes",
+        "Fetch a list of disputes in Stripe.",
+        {"charge": _STRING, "payment_intent": _STRING, "limit": _LIMIT},
+        [],
+    ),
+    (
+        "search_stripe_resources",
+        "Search Stripe resources using the Stripe Search API syntax.",
+        {"query": _STRING, "limit": _LIMIT},
+        ["query"],
+    ),
+    (
+        "fetch_stripe_resources",
+        "Retrieve a Stripe object by its ID.",
+        {"id": _STRING},
+        ["id"],
+    ),
+    (
+        "search_stripe_documentation",
+        "Search the Stripe documentation.",
+        {"question": _STRING, "language": _STRING},
+        ["question"],
+    ),
+    (
+        "get_stripe_account_info",
+        "Retrieve information about the connected Stripe account.",
+        {},
+        [],
+    ),
+]
+
+# Stripe object ID prefixes, by resource
+_ID_PREFIXES = {
+    "customer": "cus",
+    "product": "prod",
+    "price": "price",
+    "payment_link": "plink",
+    "invoice": "in",
+    "invoice_item": "ii",
+    "refund": "re",
+    "payment_intent": "pi",
+    "subscription": "sub",
+    "coupon": "co",
+    "dispute": "dp",
+}
+
+_ids = itertools.count(1)
+
+# Objects behind every list or search tool, and Stripe's default page size
+DEFAULT_LIST_SIZE = 100
+DEFAULT_PAGE_SIZE = 10
+
+
+def stub_tools() -> List[McpTool]:
+    """The stub server's tool catalog, modelled on the Stripe MCP server."""
+    tools: List[McpTool] = []
+    for name, description, properties, required in _TOOL_SPECS:
+        schema = McpToolInputSchema(type="object", properties=properties)
+        if required:
+            schema["required"] = required
+        tools.append(McpTool(
+            name=name,
+            description=description,
+            inputSchema=schema,
+            annotations={"readOnlyHint": is_read_only_tool(name)},
+        ))
+    return tools
+
+
+def paginated_tools() -> List[McpTool]:
+    """
+    The stub catalog with Stripe's pagination cursors declared: list tools
+    take `starting_after` and search tools take `page`. The Stripe MCP
+    server's tools do not declare them, so by default the stub ignores
+    cursors too.
+    """
+    tools = stub_tools()
+    for tool in tools:
+        name = tool["name"]
+        if name.startswith("list_"):
+            cursor = "starting_after"
+        elif name == "search_stripe_resources":
+            cursor = "page"
+        else:
+            continue
+        schema = tool["inputSchema"]
+        schema["properties"] = {**schema["properties"], cursor: _STRING}
+    return tools
+
+
+def synthetic_tools(count: int) -> List[McpTool]:
+    """
+    A catalog of `count` tools, cycling through the stub catalog with
+    numbered names, for measuring how code scales with catalog size.
+    """
+    base = stub_tools()
+    tools: List[McpTool] = []
+    for i in range(count):
+        tool = copy.copy(base[i % len(base)])
+        if i >= len(base):
+            tool["name"] = f"{tool['name']}_{i // len(base)}"
+        tools.append(tool)
+    return tools
+
+
+def _object_id(resource: str, number: int) -> str:
+    prefix = _ID_PREFIXES.get(resource, resource[:4])
+    return f"{prefix}_stub{number:014d}"
+
+
+def _stripe_object(
+    resource: str, args: Dict[str, Any], number: Optional[int] = None
+) -> Dict[str, Any]:
+    obj: Dict[str, Any] = {
+        "id": _object_id(
+            resource, number if number is not None else next(_ids)
+        ),
+        "object": resource,
+        "created": int(time.time()),
+        "livemode": False,
+    }
+    obj.update(
+        {k: v for k, v in args.items() if k != "limit" and v is not None}
+    )
+    return obj
+
+
+def _page(
+    name: str,
+    resource: str,
+    args: Dict[str, Any],
+    list_size: int,
+) -> Dict[str, Any]:
+    """
+    One page of a fixed collection of `list_size` objects, following
+    Stripe's `starting_after` (lists) and `page` (searches) cursors.
+    """
+    limit = min(args.get("limit") or DEFAULT_PAGE_SIZE, 100)
+    search = name.startswith("search_")
+    start = 0
+    if search and args.get("page"):
+        start = int(args["page"])
+    elif not search and args.get("starting_after"):
+        after = str(args["starting_after"]).rsplit("stub", 1)[-1]
+        start = int(after) if after.isdigit() else 0
+    end = min(start + limit, list_size)
+
+    page: Dict[str, Any] = {
+        "object": "search_result" if search else "list",
+        "data": [
+            _stripe_object(resource, {}, number)
+            for number in range(start + 1, end + 1)
+        ],
+        "has_more": end < list_size,
+    }
+    if search:
+        page["next_page"] = str(end) if end < list_size else None
+    return page
+
+
+def canned_response(
+    name: str, args: Dict[str, Any], list_size: int = DEFAULT_LIST_SIZE
+) -> str:
+    """
+    A plausible Stripe API response for a tool call, as JSON text.
+
+    List and search tools page through `list_size` objects.
+    """
+    resource = tool_resource(name)
+
+    if name == "retrieve_balance":
+        result: Any = {
+            "object": "balance",
+            "available": [{"amount": 100000, "currency": "usd"}],
+            "pending": [{"amount": 2500, "currency": "usd"}],
+            "livemode": False,
+        }
+    elif name == "get_stripe_account_info":
+        result = {
+            "id": "acct_stub",
+            "object": "account",
+            "display_name": "Stub Account",
+            "country": "US",
+        }
+    elif name == "search_stripe_documentation":
+        result = {
+            "results": [{
+                "title": "Stripe documentation",
+                "url": "https://docs.stripe.com",
+                "snippet": str(args.get("question", "")),
+            }]
+        }
+    elif name.startswith(("list_", "search_")):
+        result = _page(name, resource, args, list_size)
+    elif name.startswith("fetch_"):
+        result = {"id": args.get("id"), "object": "unknown"}
+    else:
+        result = _stripe_object(resource, args)
+
+    return json.dumps(result)
@@ -0,0 +1,362 @@
+"""
+Local stub of the Stripe MCP server, for load testing without the network.
+
+Run in-process:
+
+    with StubMcpServer(latency=0.05, error_rate=0.01) as stub:
+        toolkit = await create_stripe_agent_toolkit(
+            secret_key="rk_test_...",
+            configuration={"mcp_server_url": stub.url},
+        )
+
+or over memory streams, without HTTP:
+
+    toolkit = await create_stripe_agent_toolkit(
+        secret_key="rk_test_...",
+        configuration={"transport": stub.transport()},
+    )
+
+or as a subprocess, which prints its URL once it is listening:
+
+    python -m stripe_agent_toolkit.testing.stub_server --port 8765 \\
+        --latency 0.05 --rate-limit-rate 0.01
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import threading
+import time
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+)
+
+import mcp.types as types
+import uvicorn
+from mcp import ClientSession
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.shared.memory import create_connected_server_and_client_session
+from starlette.applications import Starlette
+from starlette.types import Receive, Scope, Send
+
+from ..shared.mcp_client import McpTool
+from ..shared.transports import InMemoryTransport
+from .catalog import DEFAULT_LIST_SIZE, canned_response, stub_tools
+
+Message = MutableMapping[str, Any]
+
+
+class StubMcpServer:
+    """
+    A stand-in for mcp.stripe.com serving a realistic tool catalog with
+    canned responses.
+
+    Every tool call waits `latency` seconds plus up to `latency_jitter`
+    more, then fails with probability:
+      - `error_rate`: the tool reports an error (isError result)
+      - `rate_limit_rate`: HTTP 429 with a `retry_after` Retry-After
+      - `server_error_rate`: HTTP 503
+
+    HTTP-level failures only apply when served over HTTP, not to
+    in-memory sessions. With `structured_content`, results also carry the
+    response as MCP structuredContent. List and search tools page through
+    `list_size` objects.
+    """
+
+    def __init__(
+        self,
+        tools: Optional[List[McpTool]] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        json_response: bool = False,
+        structured_content: bool = False,
+        list_size: int = DEFAULT_LIST_SIZE,
+        seed: Optional[int] = None,
+    ):
+        self.tools = tools if tools is not None else stub_tools()
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after = retry_after
+        self._host = host
+        self._port = port
+        self._json_response = json_response
+        self.structured_content = structured_content
+        self.list_size = list_size
+        self._random = random.Random(seed)
+
+        self.calls = 0
+        self.errors_injected = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+        self._uvicorn: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.mcp_server = self._build_server()
+
+    def _build_server(self) -> "Server[Any, Any]":
+        server: "Server[Any, Any]" = Server("stripe-stub")
+        tools = [
+            types.Tool(
+                name=t["name"],
+                description=t.get("description"),
+                inputSchema=dict(t.get("inputSchema") or {}),
+                annotations=types.ToolAnnotations(
+                    **(t.get("annotations") or {})
+                ),
+            )
+            for t in self.tools
+        ]
+        # Arguments each tool declares; like a real server, the stub
+        # ignores the rest (e.g. a pagination cursor a tool lacks)
+        declared = {
+            t.name: set(t.inputSchema.get("properties") or {})
+            for t in tools
+        }
+
+        @server.list_tools()
+        async def list_tools() -> List[types.Tool]:
+            return tools
+
+        @server.call_tool(validate_input=False)
+        async def call_tool(
+            name: str, arguments: Dict[str, Any]
+        ) -> types.CallToolResult:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                await self._delay()
+                if name not in declared:
+                    return _error_result(f"Unknown tool: {name}")
+                arguments = {
+                    k: v for k, v in arguments.items() if k in declared[name]
+                }
+                if self._roll(self.error_rate):
+                    return _error_result(
+                        "Simulated error from the stub MCP server"
+                    )
+                text = canned_response(name, arguments, self.list_size)
+                return types.CallToolResult(
+                    content=[types.TextContent(type="text", text=text)],
+                    structuredContent=(
+                        json.loads(text) if self.structured_content else None
+                    ),
+                )
+            finally:
+                self.in_flight -= 1
+
+        return server
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.latency_jitter:
+            delay += self._random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _roll(self, rate: float) -> bool:
+        if rate > 0 and self._random.random() < rate:
+            self.errors_injected += 1
+            return True
+        return False
+
+    def transport(self) -> InMemoryTransport:
+        """A transport connecting clients to this server in-process."""
+        return InMemoryTransport(self.mcp_server)
+
+    @contextlib.asynccontextmanager
+    async def memory_session(self) -> AsyncGenerator[ClientSession, None]:
+        """An initialized client session connected over memory streams."""
+        async with create_connected_server_and_client_session(
+            self.mcp_server
+        ) as session:
+            yield session
+
+    def asgi_app(self) -> Starlette:
+        """The streamable HTTP app, with HTTP-level error injection."""
+        manager = StreamableHTTPSessionManager(
+            app=self.mcp_server, json_response=self._json_response
+        )
+
+        async def handle(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] == "http" and scope["method"] == "POST":
+                body = await _read_body(receive)
+                if b'"tools/call"' in body:
+                    status = self._http_failure()
+                    if status is not None:
+                        await self._delay()
+                        await _send_error(send, status, self.retry_after)
+                        return
+                receive = _replay(body, receive)
+            await manager.handle_request(scope, receive, send)
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app: Starlette) -> AsyncIterator[None]:
+            async with manager.run():
+                yield
+
+        app = Starlette(lifespan=lifespan)
+        app.mount("/", app=handle)
+        return app
+
+    def _http_failure(self) -> Optional[int]:
+        if self._roll(self.rate_limit_rate):
+            return 429
+        if self._roll(self.server_error_rate):
+            return 503
+        return None
+
+    @property
+    def url(self) -> str:
+        """The MCP endpoint URL. Only valid once started."""
+        if self._uvicorn is None or not self._uvicorn.started:
+            raise RuntimeError("Stub MCP server is not running.")
+        socket = self._uvicorn.servers[0].sockets[0]
+        host, port = socket.getsockname()[:2]
+        return f"http://{host}:{port}/mcp"
+
+    def start(self, timeout: float = 10.0) -> str:
+        """Serve over HTTP on a background thread, returning the URL."""
+        if self._thread is not None:
+            return self.url
+        config = uvicorn.Config(
+            self.asgi_app(),
+            host=self._host,
+            port=self._port,
+            log_level="warning",
+            lifespan="on",
+        )
+        self._uvicorn = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._uvicorn.run, name="stripe-stub-mcp", daemon=True
+        )
+        self._thread.start()
+
+        deadline = time.monotonic() + timeout
+        while not self._uvicorn.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Stub MCP server failed to start.")
+            if time.monotonic() > deadline:
+                raise RuntimeError("Stub MCP server did not start in time.")
+            time.sleep(0.01)
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the HTTP server, if running."""
+        if self._uvicorn is None or self._thread is None:
+            return
+        self._uvicorn.should_exit = True
+        self._thread.join()
+        self._uvicorn = None
+        self._thread = None
+
+    def __enter__(self) -> "StubMcpServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _error_result(text: str) -> types.CallToolResult:
+    return types.CallToolResult(
+        isError=True, content=[types.TextContent(type="text", text=text)]
+    )
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Callable[[], Awaitable[Message]]:
+    """An ASGI receive callable that yields `body` again, then defers."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+async def _send_error(send: Send, status: int, retry_after: float) -> None:
+    body = json.dumps({"error": {"message": "Simulated failure"}}).encode()
+    headers = [(b"content-type", b"application/json")]
+    if status == 429:
+        headers.append((b"retry-after", f"{retry_after:g}".encode()))
+    await send({"type": "http.response.start", "status": status,
+                "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run a local stub of the Stripe MCP server."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--json-response", action="store_true")
+    parser.add_argument("--structured-content", action="store_true")
+    parser.add_argument("--list-size", type=int, default=DEFAULT_LIST_SIZE)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    stub = StubMcpServer(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        retry_after=args.retry_after,
+        host=args.host,
+        port=args.port,
+        json_response=args.json_response,
+        structured_content=args.structured_content,
+        list_size=args.list_size,
+        seed=args.seed,
+    )
+    print(stub.start(), flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
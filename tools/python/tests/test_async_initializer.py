@@ -1,6 +1,9 @@
 """Tests for AsyncInitializer utility."""
 
 import asyncio
+import threading
+import time
+
 import pytest
 from stripe_agent_toolkit.shared.async_initializer import AsyncInitializer
 
@@ -119,3 +122,104 @@ class TestAsyncInitializer:
 
         assert initializer.is_initialized
         assert attempt == 2
+
+    async def test_cancelled_initialize_lets_waiter_retry(self, initializer):
+        """A waiter should take over when the initializing call is cancelled."""
+        calls = 0
+        started = asyncio.Event()
+
+        async def init_fn():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.sleep(10)
+
+        first = asyncio.create_task(initializer.initialize(init_fn))
+        await started.wait()
+        second = asyncio.create_task(initializer.initialize(init_fn))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        await second
+
+        assert initializer.is_initialized
+        assert calls == 2
+
+    def test_initialize_across_threads(self, initializer):
+        """Loops on different threads should share one initialization."""
+        calls = 0
+        release = threading.Event()
+
+        async def init_fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.to_thread(release.wait)
+
+        threads = [
+            threading.Thread(
+                target=asyncio.run, args=(initializer.initialize(init_fn),)
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == 1
+        assert initializer.is_initialized
+
+    async def test_error_reaches_waiters_on_other_loops(self, initializer):
+        """A failed initialization should fail its waiters too."""
+        started = threading.Event()
+
+        async def failing_init():
+            started.set()
+            await asyncio.sleep(0.05)
+            raise ValueError("Init failed")
+
+        async def wait_for_it():
+            await asyncio.to_thread(started.wait)
+            await initializer.initialize(failing_init)
+
+        owner = asyncio.create_task(initializer.initialize(failing_init))
+        waiter = asyncio.to_thread(asyncio.run, wait_for_it())
+        results = await asyncio.gather(owner, waiter, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert not initializer.is_initialized
+
+    async def test_fork_keeps_completed_initialization(self, initializer):
+        """A forked child should keep the parent's initialized state."""
+        async def init_fn():
+            pass
+
+        await initializer.initialize(init_fn)
+        initializer._after_fork()
+
+        assert initializer.is_initialized
+
+    async def test_fork_forgets_initialization_in_progress(self, initializer):
+        """An attempt in flight at fork time should not block the child."""
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(initializer.initialize(hang))
+        await started.wait()
+        initializer._after_fork()
+
+        calls = 0
+
+        async def init_fn():
+            nonlocal calls
+            calls += 1
+
+        await asyncio.wait_for(initializer.initialize(init_fn), 1)
+        assert calls == 1
+        task.cancel()
@@ -0,0 +1,81 @@
+"""Tests for CatalogCache."""
+
+import json
+import os
+import time
+
+from stripe_agent_toolkit.shared.catalog_cache import CatalogCache
+
+TOOLS = [
+    {
+        "name": "list_customers",
+        "description": "List customers",
+        "inputSchema": {"type": "object", "properties": {}},
+    }
+]
+
+
+class TestCatalogCache:
+    """Tests for the CatalogCache class."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored catalogs should load back unchanged."""
+        cache = CatalogCache(directory=str(tmp_path))
+        key = cache.key("https://mcp.stripe.com", "rk_test_123")
+
+        cache.store(key, TOOLS)
+
+        assert cache.load(key) == TOOLS
+
+    def test_missing_entry(self, tmp_path):
+        """Loading an unknown key should return None."""
+        cache = CatalogCache(directory=str(tmp_path))
+
+        assert cache.load("missing") is None
+
+    def test_expired_entry(self, tmp_path):
+        """Entries older than the TTL should be ignored."""
+        cache = CatalogCache(directory=str(tmp_path), ttl=60)
+        key = cache.key("https://mcp.stripe.com", "rk_test_123")
+        cache.store(key, TOOLS)
+
+        path = os.path.join(str(tmp_path), f"catalog-{key}.json")
+        with open(path) as f:
+            entry = json.load(f)
+        entry["fetched_at"] = time.time() - 120
+        with open(path, "w") as f:
+            json.dump(entry, f)
+
+        assert cache.load(key) is None
+
+    def test_corrupt_entry(self, tmp_path):
+        """Unreadable entries should be treated as a miss."""
+        cache = CatalogCache(directory=str(tmp_path))
+        key = cache.key("https://mcp.stripe.com", "rk_test_123")
+        os.makedirs(str(tmp_path), exist_ok=True)
+        with open(os.path.join(str(tmp_path), f"catalog-{key}.json"), "w") as f:
+            f.write("{not json")
+
+        assert cache.load(key) is None
+
+    def test_key_varies_by_context(self, tmp_path):
+        """Keys should differ by URL, API key, account and mode."""
+        cache = CatalogCache(directory=str(tmp_path))
+        base = cache.key("https://mcp.stripe.com", "rk_test_123")
+
+        assert base != cache.key("http://localhost", "rk_test_123")
+        assert base != cache.key("https://mcp.stripe.com", "rk_test_456")
+        assert base != cache.key(
+            "https://mcp.stripe.com", "rk_test_123", account="acct_1"
+        )
+        assert base != cache.key(
+            "https://mcp.stripe.com", "rk_test_123", mode="toolkit"
+        )
+
+    def test_key_does_not_contain_secret(self, tmp_path):
+        """The API key should never appear in the cache key."""
+        cache = CatalogCache(directory=str(tmp_path))
+
+        assert "rk_test_123" not in cache.key(
+            "https://mcp.stripe.com", "rk_test_123"
+        )
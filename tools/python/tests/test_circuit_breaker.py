@@ -0,0 +1,113 @@
+"""Tests for the circuit breaker."""
+
+import time
+
+import pytest
+
+from stripe_agent_toolkit.shared.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    is_endpoint_failure,
+)
+from stripe_agent_toolkit.shared.errors import (
+    CircuitOpenError,
+    McpRateLimitError,
+    McpServerError,
+    McpToolError,
+    McpTransportError,
+)
+
+
+def fail_calls(breaker, count, duration=0.0):
+    for _ in range(count):
+        probe = breaker.acquire()
+        breaker.record(probe, failed=True, duration=duration)
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker class."""
+
+    def test_opens_on_failure_rate(self):
+        """The breaker should open once the failure rate is reached."""
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5, window_size=4, minimum_calls=4
+        )
+        for failed in (False, True, False):
+            breaker.record(breaker.acquire(), failed=failed, duration=0.0)
+        assert breaker.state is CircuitState.CLOSED
+
+        fail_calls(breaker, 1)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_open_breaker_fails_fast(self):
+        """Calls should be rejected while the breaker is open."""
+        breaker = CircuitBreaker(minimum_calls=1, probe_interval=60)
+        fail_calls(breaker, 1)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.acquire()
+        assert exc_info.value.retry_after > 50
+        assert breaker.stats()["rejected"] == 1
+
+    def test_opens_on_slow_calls(self):
+        """The breaker should open when too many calls are slow."""
+        breaker = CircuitBreaker(
+            slow_call_threshold=0.5,
+            slow_call_rate_threshold=0.5,
+            window_size=2,
+            minimum_calls=2,
+        )
+        for _ in range(2):
+            breaker.record(breaker.acquire(), failed=False, duration=1.0)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_minimum_calls_required(self):
+        """A few early failures should not trip the breaker."""
+        breaker = CircuitBreaker(minimum_calls=5)
+        fail_calls(breaker, 4)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_closes_on_success(self):
+        """A successful probe should close the breaker."""
+        breaker = CircuitBreaker(minimum_calls=1, probe_interval=0.01)
+        fail_calls(breaker, 1)
+        time.sleep(0.02)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        probe = breaker.acquire()
+        assert probe
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+        breaker.record(probe, failed=False, duration=0.0)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_probe_reopens_on_failure(self):
+        """A failed probe should open the breaker again."""
+        breaker = CircuitBreaker(minimum_calls=1, probe_interval=0.01)
+        fail_calls(breaker, 1)
+        time.sleep(0.02)
+
+        breaker.record(breaker.acquire(), failed=True, duration=0.0)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.stats()["times_opened"] == 2
+
+    def test_released_probe_frees_slot(self):
+        """A probe given up without an outcome should allow another."""
+        breaker = CircuitBreaker(minimum_calls=1, probe_interval=0.01)
+        fail_calls(breaker, 1)
+        time.sleep(0.02)
+
+        breaker.release(breaker.acquire())
+
+        assert breaker.acquire()
+
+    def test_endpoint_failures(self):
+        """Only errors about the endpoint's health should count."""
+        assert is_endpoint_failure(McpTransportError("x"))
+        assert is_endpoint_failure(McpServerError("x"))
+        assert not is_endpoint_failure(McpToolError("x"))
+        assert not is_endpoint_failure(McpRateLimitError("x"))
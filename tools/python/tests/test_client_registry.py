@@ -0,0 +1,141 @@
+"""Tests for sharing MCP clients between toolkits."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from stripe_agent_toolkit.shared.client_registry import (
+    ClientRegistry,
+    client_registry,
+)
+from stripe_agent_toolkit.testing import StubMcpServer
+from tests.test_toolkit_core import NameToolkit
+
+
+@pytest.fixture
+def stub():
+    return StubMcpServer(seed=0)
+
+
+def make_shared_toolkit(stub, catalog_refresh_interval=None, **context):
+    return NameToolkit("rk_test_123", {
+        "transport": stub.transport(),
+        "share_client": True,
+        "catalog_refresh_interval": catalog_refresh_interval,
+        "context": context,
+    })
+
+
+class TestClientRegistry:
+    """Tests for the ClientRegistry class."""
+
+    async def test_reference_counting(self, stub):
+        """A client should stay connected until its last release."""
+        registry = ClientRegistry()
+        config = {"secret_key": "rk_test_123", "transport": stub.transport()}
+
+        client = registry.acquire(config)
+        assert registry.acquire(dict(config)) is client
+        assert registry.refs(client) == 2
+        await client.connect()
+
+        await registry.release(client)
+        assert client.is_connected
+
+        await registry.release(client)
+        assert not client.is_connected
+        assert len(registry) == 0
+        assert registry.acquire(config) is not client
+
+    def test_settings_partition_clients(self, stub):
+        """Different keys, accounts or endpoints should not share."""
+        registry = ClientRegistry()
+        base = {"secret_key": "rk_test_123", "transport": stub.transport()}
+
+        clients = {
+            id(registry.acquire(config))
+            for config in (
+                base,
+                {**base, "secret_key": "rk_test_456"},
+                {**base, "account": "acct_123"},
+                {**base, "mode": "modelcontextprotocol"},
+                {"secret_key": "rk_test_123"},
+            )
+        }
+        assert len(clients) == 5
+
+
+class TestSharedToolkits:
+    """Tests for toolkits configured with share_client."""
+
+    async def test_toolkits_share_client_and_catalog(self, stub):
+        """Toolkits with the same settings should share one client."""
+        first = make_shared_toolkit(stub)
+        second = make_shared_toolkit(stub)
+        assert first.mcp_client is second.mcp_client
+
+        await first.initialize()
+        await second.initialize()
+        client = first.mcp_client
+        assert second.get_tools() == first.get_tools()
+
+        await first.close()
+        assert client.is_connected
+        assert second.is_initialized
+        assert await second.run_tool("retrieve_balance", {})
+
+        await second.close()
+        assert not client.is_connected
+        assert client_registry.refs(client) == 0
+
+    async def test_one_refresh_loop_per_client(self, stub):
+        """Toolkits sharing a client should share its catalog refresh."""
+        toolkits = [
+            make_shared_toolkit(stub, catalog_refresh_interval=0.05)
+            for _ in range(3)
+        ]
+        for toolkit in toolkits:
+            await toolkit.initialize()
+        client = toolkits[0].mcp_client
+        diffs = []
+        for toolkit in toolkits:
+            toolkit.add_tools_changed_hook(diffs.append)
+        client._list_tools = AsyncMock(return_value=[
+            *client.get_tools(), {"name": "create_payout"}
+        ])
+
+        await asyncio.sleep(0.12)
+
+        # One refresh loop: about two lists in 0.12s, not six
+        assert 1 <= client._list_tools.await_count <= 3
+        assert len(diffs) == 3
+        for toolkit in toolkits:
+            await toolkit.close()
+
+    async def test_reinitialize_after_close(self, stub):
+        """A closed toolkit should get a live client on initialize()."""
+        toolkit = make_shared_toolkit(stub)
+        await toolkit.initialize()
+        await toolkit.close()
+
+        await toolkit.initialize()
+        assert toolkit.mcp_client.is_connected
+        assert client_registry.refs(toolkit.mcp_client) == 1
+        await toolkit.close()
+
+    async def test_uninitialized_close_releases(self, stub):
+        """Closing a toolkit that never initialized should release it."""
+        toolkit = make_shared_toolkit(stub, account="acct_unused")
+        client = toolkit.mcp_client
+
+        await toolkit.close()
+
+        assert client_registry.refs(client) == 0
+
+    def test_unshared_by_default(self, stub):
+        """Without share_client, every toolkit has its own client."""
+        config = {"transport": stub.transport()}
+        first = NameToolkit("rk_test_123", config)
+        second = NameToolkit("rk_test_123", config)
+        assert first.mcp_client is not second.mcp_client
@@ -0,0 +1,86 @@
+"""Tests for ConcurrencyLimiter."""
+
+import asyncio
+import threading
+
+import pytest
+
+from stripe_agent_toolkit.shared.concurrency import ConcurrencyLimiter
+
+
+class TestConcurrencyLimiter:
+    """Tests for the ConcurrencyLimiter class."""
+
+    async def test_limits_concurrency(self):
+        """No more than `limit` operations should run at once."""
+        limiter = ConcurrencyLimiter(3)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(20)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+    async def test_fifo_order(self):
+        """Queued callers should be admitted in arrival order."""
+        limiter = ConcurrencyLimiter(1)
+        order = []
+
+        await limiter.acquire()
+
+        async def work(i):
+            async with limiter.slot():
+                order.append(i)
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(work(i)))
+            await asyncio.sleep(0)
+        assert limiter.queued == 5
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Cancelling a queued caller should leave the slot count intact."""
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire(), 1)
+
+    async def test_release_from_another_thread(self):
+        """A slot released on another thread should wake the waiter."""
+        limiter = ConcurrencyLimiter(1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        threading.Thread(target=limiter.release).start()
+
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.in_flight == 1
+
+    def test_invalid_limit_raises(self):
+        """A limit below one should be rejected."""
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(0)
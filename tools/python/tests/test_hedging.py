@@ -0,0 +1,178 @@
+"""Tests for hedged read requests."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, ErrorData
+
+from stripe_agent_toolkit.shared.hedging import HedgePolicy
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from tests.test_mcp_client import make_fake_sessions
+
+
+def make_hedged_client(hedging, delays):
+    """
+    Client whose n-th session answers after delays[n] seconds (or the
+    last delay), recording which sessions served calls.
+    """
+    client = StripeMcpClient({
+        "secret_key": "rk_test_123", "hedging": hedging
+    })
+    opened = make_fake_sessions(client)
+    served = []
+    cancelled = []
+
+    original = client._create_session
+
+    def create_session():
+        index = len(opened)
+        delay = delays[min(index, len(delays) - 1)]
+
+        async def call_tool(name, args, **kwargs):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+            served.append(index)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text=str(index))]
+            )
+
+        context = original()
+
+        class Session:
+            async def __aenter__(self):
+                session = await context.__aenter__()
+                session.call_tool = call_tool
+                return session
+
+            async def __aexit__(self, *exc_info):
+                return await context.__aexit__(*exc_info)
+
+        return Session()
+
+    client._create_session = create_session
+    return client, opened, served, cancelled
+
+
+class TestHedgePolicy:
+    """Tests for the HedgePolicy class."""
+
+    def test_fixed_delay(self):
+        """A fixed delay should be used from the first call."""
+        policy = HedgePolicy(delay=0.05)
+        assert policy.delay() == 0.05
+        policy.record(1.0)
+        assert policy.delay() == 0.05
+
+    def test_learns_percentile(self):
+        """An adaptive delay should track the configured percentile."""
+        policy = HedgePolicy(percentile=0.9, minimum_calls=10, min_delay=0)
+        for i in range(9):
+            policy.record(i / 100)
+        assert policy.delay() is None
+
+        policy.record(0.09)
+        assert policy.delay() == pytest.approx(0.08)
+
+    def test_budget_caps_hedges(self):
+        """Hedges should be limited to the budget earned by calls."""
+        policy = HedgePolicy(
+            delay=0, budget_ratio=0.25, min_hedge_tokens=1
+        )
+        assert policy.try_hedge()
+        assert not policy.try_hedge()
+
+        for _ in range(4):
+            policy.delay()
+        assert policy.try_hedge()
+
+        stats = policy.stats()
+        assert stats["hedged"] == 2
+        assert stats["budget_exhausted"] == 1
+        assert stats["calls"] == 4
+
+    def test_invalid_percentile_raises(self):
+        """A percentile outside (0, 1) should be rejected."""
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=95)
+
+
+class TestHedgedCalls:
+    """Tests for hedging in StripeMcpClient."""
+
+    async def test_hedge_wins_on_slow_session(self):
+        """A read stuck on a slow session should be answered by a hedge."""
+        client, opened, served, cancelled = make_hedged_client(
+            {"delay": 0.02}, delays=[1.0, 0.0]
+        )
+        await client.connect()
+
+        result = await asyncio.wait_for(
+            client.call_tool("list_customers", {}), timeout=0.5
+        )
+
+        assert result == "1"
+        assert served == [1]
+        assert cancelled == [0]
+        stats = client.hedge_stats
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        await client.disconnect()
+
+    async def test_fast_call_is_not_hedged(self):
+        """A call answered within the delay should not be hedged."""
+        client, opened, served, _ = make_hedged_client(
+            {"delay": 0.5}, delays=[0.0]
+        )
+        await client.connect()
+
+        assert await client.call_tool("list_customers", {}) == "0"
+        assert len(opened) == 1
+        assert client.hedge_stats["hedged"] == 0
+        await client.disconnect()
+
+    async def test_writes_are_not_hedged(self):
+        """Mutating tools must never be sent twice."""
+        client, opened, served, _ = make_hedged_client(
+            {"delay": 0.0}, delays=[0.05, 0.0]
+        )
+        await client.connect()
+
+        assert await client.call_tool("create_customer", {}) == "0"
+        assert served == [0]
+        assert client.hedge_stats["calls"] == 0
+        await client.disconnect()
+
+    async def test_failed_copy_defers_to_the_other(self):
+        """If the primary fails, an in-flight hedge should still answer."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "hedging": {"delay": 0.01},
+            "retry": {"max_attempts": 1},
+        })
+        calls = 0
+
+        async def call_tool(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.03)
+                raise McpError(ErrorData(code=INTERNAL_ERROR, message="x"))
+            await asyncio.sleep(0.06)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        make_fake_sessions(
+            client, call_tool=AsyncMock(side_effect=call_tool)
+        )
+        await client.connect()
+
+        assert await client.call_tool("list_customers", {}) == "ok"
+        assert calls == 2
+        await client.disconnect()
@@ -0,0 +1,240 @@
+"""Tests for tool call timing instrumentation."""
+
+import pytest
+
+from stripe_agent_toolkit.shared.errors import McpToolError
+from stripe_agent_toolkit.shared.instrumentation import (
+    Instrumentation,
+    Instrumenter,
+    OpenTelemetryInstrumentation,
+    Phase,
+    PhaseEvent,
+)
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.testing import StubMcpServer
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, event):
+        self.started.append(event.phase)
+
+    def on_end(self, event):
+        self.ended.append(event)
+
+    def phases(self):
+        return [e.phase for e in self.ended]
+
+
+def make_client(stub, **config):
+    client = StripeMcpClient({
+        "secret_key": "rk_test_123",
+        "account": "acct_123",
+        **config,
+    })
+    client._create_session = stub.memory_session
+    return client
+
+
+class TestInstrumenter:
+    """Tests for the Instrumenter class."""
+
+    def test_disabled_without_hooks(self):
+        """Phases should be no-ops yielding no event without hooks."""
+        instrumenter = Instrumenter()
+        assert not instrumenter.enabled
+        with instrumenter.phase(Phase.REQUEST) as event:
+            assert event is None
+        with instrumenter.call("list_customers", None) as event:
+            assert event is None
+
+    def test_phase_attributed_to_enclosing_call(self):
+        """Phases within a call should carry its tool and account."""
+        recorder = Recorder()
+        instrumenter = Instrumenter([recorder])
+        with instrumenter.call("list_customers", "acct_123"):
+            with instrumenter.phase(Phase.REQUEST):
+                pass
+        with instrumenter.phase(Phase.CONNECT):
+            pass
+
+        request, call, connect = recorder.ended
+        assert (request.phase, request.tool, request.account) == (
+            Phase.REQUEST, "list_customers", "acct_123"
+        )
+        assert call.phase == Phase.CALL
+        assert connect.tool is None
+        assert recorder.started == [Phase.CALL, Phase.REQUEST, Phase.CONNECT]
+
+    def test_records_error_class(self):
+        """A phase ending in an exception should record its class."""
+        recorder = Recorder()
+        instrumenter = Instrumenter([recorder])
+        with pytest.raises(ValueError):
+            with instrumenter.phase(Phase.EXTRACT):
+                raise ValueError("boom")
+        (event,) = recorder.ended
+        assert event.error == "ValueError"
+        assert event.duration is not None and event.duration >= 0
+
+    def test_remove(self):
+        """Removed hooks should stop receiving events."""
+        recorder = Recorder()
+        instrumenter = Instrumenter()
+        instrumenter.add(recorder)
+        assert instrumenter.enabled
+        instrumenter.remove(recorder)
+        assert not instrumenter.enabled
+
+
+class TestClientInstrumentation:
+    """Tests for StripeMcpClient phase events."""
+
+    async def test_call_phases(self):
+        """A tool call should report its phases with sizes and durations."""
+        recorder = Recorder()
+        client = make_client(
+            StubMcpServer(seed=0), instrumentation=[recorder]
+        )
+        await client.connect()
+        recorder.ended.clear()
+
+        result = await client.call_tool("list_customers", {"limit": 2})
+
+        assert recorder.phases() == [
+            Phase.QUEUE, Phase.REQUEST, Phase.EXTRACT, Phase.CALL
+        ]
+        for event in recorder.ended:
+            assert event.tool == "list_customers"
+            assert event.account == "acct_123"
+            assert event.duration is not None and event.error is None
+        extract, call = recorder.ended[2], recorder.ended[3]
+        assert extract.result_size == len(result)
+        assert call.result_size == len(result)
+        await client.disconnect()
+
+    async def test_tool_error(self):
+        """A failing tool should record its error class on each phase."""
+        recorder = Recorder()
+        client = make_client(
+            StubMcpServer(seed=0, error_rate=1.0),
+            instrumentation=[recorder],
+        )
+        await client.connect()
+        recorder.ended.clear()
+
+        with pytest.raises(McpToolError):
+            await client.call_tool("list_customers", {})
+
+        errors = {e.phase: e.error for e in recorder.ended}
+        assert errors[Phase.REQUEST] is None
+        assert errors[Phase.EXTRACT] == "McpToolError"
+        assert errors[Phase.CALL] == "McpToolError"
+        await client.disconnect()
+
+    async def test_add_instrumentation(self):
+        """Hooks registered after construction should see later calls."""
+        recorder = Recorder()
+        client = make_client(StubMcpServer(seed=0))
+        await client.connect()
+        client.add_instrumentation(recorder)
+
+        await client.call_tool("create_customer", {"name": "Jenny"})
+        assert Phase.CALL in recorder.phases()
+
+        client.remove_instrumentation(recorder)
+        recorder.ended.clear()
+        await client.call_tool("create_customer", {"name": "Jenny"})
+        assert recorder.ended == []
+        await client.disconnect()
+
+    async def test_connect_phases_over_http(self):
+        """Opening a session should report connect and initialize."""
+        recorder = Recorder()
+        with StubMcpServer(seed=0) as stub:
+            client = StripeMcpClient({
+                "secret_key": "rk_test_123",
+                "server_url": stub.url,
+                "instrumentation": [recorder],
+            })
+            await client.connect()
+            await client.disconnect()
+
+        phases = recorder.phases()
+        assert Phase.INITIALIZE in phases
+        assert Phase.CONNECT in phases
+        assert phases.index(Phase.INITIALIZE) < phases.index(Phase.CONNECT)
+
+
+def make_tracer(trace):
+    """A tracer recording spans, each noting the span current at start."""
+
+    class FakeSpan(trace.NonRecordingSpan):
+        def __init__(self, name, attributes, parent):
+            super().__init__(trace.INVALID_SPAN_CONTEXT)
+            self.name = name
+            self.attributes = dict(attributes)
+            self.parent = parent
+            self.status = None
+            self.ended = False
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+        def set_status(self, status, description=None):
+            self.status = status
+
+        def end(self, end_time=None):
+            self.ended = True
+
+    class FakeTracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, attributes=None):
+            parent = trace.get_current_span()
+            span = FakeSpan(name, attributes or {}, parent)
+            self.spans.append(span)
+            return span
+
+    return FakeTracer()
+
+
+class TestOpenTelemetryInstrumentation:
+    """Tests for the OpenTelemetry span adapter."""
+
+    def test_spans(self):
+        """Each phase should become an ended span nested under the call."""
+        trace = pytest.importorskip("opentelemetry.trace")
+        tracer = make_tracer(trace)
+        instrumenter = Instrumenter([OpenTelemetryInstrumentation(tracer)])
+
+        with instrumenter.call("list_customers", "acct_123"):
+            with instrumenter.phase(Phase.REQUEST):
+                pass
+            with pytest.raises(ValueError):
+                with instrumenter.phase(Phase.EXTRACT) as event:
+                    event.result_size = 12
+                    raise ValueError("bad")
+
+        call, request, extract = tracer.spans
+        assert [s.name for s in tracer.spans] == [
+            "stripe_mcp.call", "stripe_mcp.request", "stripe_mcp.extract"
+        ]
+        assert all(s.ended for s in tracer.spans)
+        assert request.parent is call and extract.parent is call
+        assert request.attributes["stripe_mcp.tool"] == "list_customers"
+        assert request.attributes["stripe_mcp.account"] == "acct_123"
+        assert extract.attributes["stripe_mcp.result_size"] == 12
+        assert extract.attributes["error.type"] == "ValueError"
+        assert extract.status.status_code == trace.StatusCode.ERROR
+        assert call.status is None
+        assert trace.get_current_span() is not call
+
+    def test_phase_event_repr(self):
+        """PhaseEvent should have a readable repr."""
+        event = PhaseEvent(Phase.CALL, "list_customers", None)
+        assert "list_customers" in repr(event)
@@ -0,0 +1,208 @@
+"""Tests for the loop bridge behind the sync tool adapters."""
+
+import asyncio
+import os
+import signal
+import threading
+
+import pytest
+
+from stripe_agent_toolkit.shared.client_registry import client_registry
+from stripe_agent_toolkit.shared.loop_bridge import LoopBridge
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.shared.result_cache import ResultCache
+from stripe_agent_toolkit.shared.retry import RetryPolicy
+from stripe_agent_toolkit.testing import StubMcpServer
+
+
+@pytest.fixture
+def bridge():
+    bridge = LoopBridge(name="test-loop-bridge")
+    yield bridge
+    bridge.close(timeout=5)
+
+
+async def running_loop():
+    return asyncio.get_running_loop(), threading.current_thread()
+
+
+class TestLoopBridge:
+    """Tests for the LoopBridge class."""
+
+    def test_reuses_one_loop(self, bridge):
+        """Every call should run on the same long-lived loop and thread."""
+        first = bridge.run(running_loop())
+        second = bridge.run(running_loop())
+
+        assert first == second
+        assert first[0] is bridge.loop
+        assert first[1] is not threading.current_thread()
+
+    async def test_run_inside_running_loop(self, bridge):
+        """Sync callers on a running loop should still be served."""
+        loop, _ = bridge.run(running_loop())
+
+        assert loop is not asyncio.get_running_loop()
+
+    def test_exceptions_propagate(self, bridge):
+        """An exception from the coroutine should reach the caller."""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            bridge.run(fail())
+
+    def test_timeout_cancels(self, bridge):
+        """A timed-out call should be cancelled on the bridge loop."""
+        cancelled = threading.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            bridge.run(hang(), timeout=0.05)
+        assert cancelled.wait(1)
+
+    def test_run_from_bridge_thread_raises(self, bridge):
+        """Blocking on the bridge from its own loop would deadlock."""
+        async def reenter():
+            return bridge.run(running_loop())
+
+        with pytest.raises(RuntimeError):
+            bridge.run(reenter())
+
+    def test_close_and_restart(self, bridge):
+        """After close(), the next call should start a new loop."""
+        first, _ = bridge.run(running_loop())
+        bridge.close(timeout=5)
+
+        assert first.is_closed()
+        second, _ = bridge.run(running_loop())
+        assert second is not first
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_fork_while_bridge_holds_locks(self, bridge):
+        """Locks the bridge thread held at fork time should be free."""
+        cache, policy = ResultCache(), RetryPolicy()
+        held, release = threading.Event(), threading.Event()
+
+        async def hold_locks():
+            with cache._lock, policy._lock, client_registry._lock:
+                held.set()
+                await asyncio.to_thread(release.wait, 10)
+
+        future = asyncio.run_coroutine_threadsafe(hold_locks(), bridge.loop)
+        try:
+            assert held.wait(5)
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    # Deadlocking here would otherwise hang the test run
+                    signal.alarm(5)
+                    cache.stats()
+                    policy.record_call()
+                    len(client_registry)
+                    bridge.run(running_loop(), timeout=5)
+                    status = 0
+                finally:
+                    os._exit(status)
+            _, status = os.waitpid(pid, 0)
+            assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        finally:
+            release.set()
+            future.result(5)
+
+
+class TestSyncClientCalls:
+    """Tests for client calls made through the bridge."""
+
+    def test_sessions_survive_between_calls(self, bridge):
+        """Repeated sync calls should reuse one pooled session."""
+        stub = StubMcpServer(seed=0)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "transport": stub.transport()
+        })
+        bridge.run(client.connect())
+        pool = client._pool
+
+        for i in range(3):
+            bridge.run(client.call_tool("list_customers", {"limit": i + 1}))
+
+        assert client._pool is pool
+        assert pool.size == 1
+        assert stub.calls == 3
+        bridge.run(client.disconnect())
+
+    async def test_pool_per_loop(self, bridge):
+        """A client used from two loops should keep a pool on each."""
+        stub = StubMcpServer(seed=0)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "transport": stub.transport()
+        })
+        await client.connect()
+
+        for _ in range(2):
+            await asyncio.to_thread(
+                bridge.run, client.call_tool("retrieve_balance", {})
+            )
+
+        bridge_pool = client._loop_pools[bridge.loop]
+        assert bridge_pool is not client._pool
+        assert bridge_pool.size == 1
+
+        await client.disconnect()
+        assert bridge_pool.is_closed
+
+    async def test_account_pool_per_loop(self, bridge):
+        """Sync calls for a connected account should reuse its session."""
+        stub = StubMcpServer(seed=0)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "transport": stub.transport()
+        })
+        opened = []
+        session_factory = client._session_factory
+
+        def counting_factory(account=None):
+            create = session_factory(account)
+
+            def create_session():
+                opened.append(account)
+                return create()
+            return create_session
+
+        client._session_factory = counting_factory
+        await client.connect()
+        await client.call_tool("retrieve_balance", {}, account="acct_1")
+
+        for _ in range(5):
+            await asyncio.to_thread(bridge.run, client.call_tool(
+                "retrieve_balance", {}, account="acct_1"
+            ))
+
+        # One session on this loop, one on the bridge's
+        assert opened.count("acct_1") == 2
+        await client.disconnect()
+
+    async def test_evicts_account_pool_of_other_loop(self, bridge):
+        """An account pool evicted from another loop should still close."""
+        stub = StubMcpServer(seed=0)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "transport": stub.transport(),
+            "max_account_pools": 1,
+        })
+        await client.connect()
+        await asyncio.to_thread(bridge.run, client.call_tool(
+            "retrieve_balance", {}, account="acct_1"
+        ))
+        evicted = client._account_pools[(bridge.loop, "acct_1")]
+
+        await client.call_tool("retrieve_balance", {}, account="acct_2")
+        await client.disconnect()
+
+        assert evicted.is_closed
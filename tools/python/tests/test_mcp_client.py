@@ -1,9 +1,60 @@
 """Tests for StripeMcpClient."""
 
+import asyncio
+import errno
+import time
+
+import httpx
 import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from mcp.shared.exceptions import McpError
+from mcp.types import INTERNAL_ERROR, ErrorData
+
+from stripe_agent_toolkit.shared.account import account_scope
+from stripe_agent_toolkit.shared.circuit_breaker import CircuitState
+from stripe_agent_toolkit.shared.constants import IDEMPOTENCY_META_KEY
+from stripe_agent_toolkit.shared.deadline import deadline_scope
+from stripe_agent_toolkit.shared.errors import (
+    CircuitOpenError,
+    McpRateLimitError,
+    McpServerError,
+    McpTimeoutError,
+    McpToolError,
+    McpTransportError,
+)
 from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.testing import StubMcpServer
+
+
+def make_fake_sessions(client, call_tool=None):
+    """Replace the client's session factory with fake MCP sessions."""
+    opened = []
+
+    @asynccontextmanager
+    async def create_session():
+        session = MagicMock()
+        session.list_tools = AsyncMock(return_value=SimpleNamespace(tools=[
+            SimpleNamespace(
+                name="list_customers",
+                description="List customers",
+                inputSchema={"type": "object", "properties": {}},
+            )
+        ]))
+        session.call_tool = call_tool or AsyncMock(
+            return_value=SimpleNamespace(
+                isError=False,
+                content=[SimpleNamespace(text='{"ok": true}')],
+            )
+        )
+        session.send_ping = AsyncMock()
+        opened.append(session)
+        yield session
+
+    client._create_session = create_session
+    return opened
 
 
 class TestStripeMcpClient:
@@ -64,6 +115,797 @@ class TestStripeMcpClient:
         pass
 
 
+class TestSessionPooling:
+    """Tests for pooled session reuse."""
+
+    async def test_connect_warms_pool(self):
+        """connect() should open the pool and fetch tools over it."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+
+        await client.connect()
+
+        assert len(opened) == 1
+        assert client.get_tools()[0]["name"] == "list_customers"
+        await client.disconnect()
+
+    async def test_call_tool_reuses_session(self):
+        """Tool calls should reuse the warmed session."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        for _ in range(3):
+            assert await client.call_tool("list_customers", {}) == (
+                '{"ok": true}'
+            )
+
+        assert len(opened) == 1
+        assert opened[0].call_tool.await_count == 3
+        await client.disconnect()
+
+    async def test_broken_session_reconnects_transparently(self):
+        """A stale pooled session should be replaced and the call retried."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+        await client.connect()
+        opened[0].call_tool = AsyncMock(side_effect=ConnectionError())
+
+        result = await client.call_tool("list_customers", {})
+
+        assert result == '{"ok": true}'
+        assert len(opened) == 2
+        await client.disconnect()
+
+    async def test_gather_fan_out_is_bounded(self):
+        """Parallel calls should share sessions within max_concurrency."""
+        running = 0
+        peak = 0
+
+        async def slow_call(name, args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "max_concurrency": 4,
+            "pool": {"max_requests_per_session": 2},
+        })
+        opened = make_fake_sessions(client, call_tool=slow_call)
+        await client.connect()
+
+        results = await asyncio.gather(*(
+            client.call_tool("list_customers", {"limit": i})
+            for i in range(20)
+        ))
+
+        assert results == ["ok"] * 20
+        assert peak == 4
+        assert len(opened) == 2
+        await client.disconnect()
+
+    async def test_disconnect_closes_pool(self):
+        """disconnect() should close the pool and allow reconnecting."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        await client.disconnect()
+        assert client._pool is None
+
+        await client.connect()
+        assert len(opened) == 2
+        await client.disconnect()
+
+    async def test_fork_reopens_sessions_not_catalog(self):
+        """A forked child should drop inherited sessions but keep tools."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+        await client.connect()
+        parent_pool = client._pool
+
+        client._after_fork()
+
+        assert client.is_connected
+        assert await client.call_tool("list_customers", {}) == (
+            '{"ok": true}'
+        )
+        assert client._pool is not parent_pool
+        assert len(opened) == 2
+        assert opened[0].call_tool.await_count == 0
+        assert opened[1].list_tools.await_count == 0
+        await client.disconnect()
+        await parent_pool.close()
+
+
+class TestCatalogCaching:
+    """Tests for the persistent tool catalog cache."""
+
+    async def test_cached_catalog_skips_list_tools(self, tmp_path):
+        """A second client should start from the cached catalog."""
+        config = {
+            "secret_key": "rk_test_123",
+            "catalog_cache": {"directory": str(tmp_path)},
+            "pool": {"min_size": 0},
+        }
+        first = StripeMcpClient(config)
+        make_fake_sessions(first)
+        await first.connect()
+        await first.disconnect()
+
+        second = StripeMcpClient(config)
+        opened = make_fake_sessions(second)
+        gate = asyncio.Event()
+        original = second._list_tools
+
+        async def gated_list_tools():
+            await gate.wait()
+            return await original()
+
+        second._list_tools = gated_list_tools
+        await second.connect()
+
+        assert second.get_tools()[0]["name"] == "list_customers"
+        assert opened == []
+        gate.set()
+        await second.disconnect()
+
+    async def test_revalidation_swaps_changed_catalog(self, tmp_path):
+        """Background revalidation should publish a changed catalog."""
+        config = {
+            "secret_key": "rk_test_123",
+            "catalog_cache": {"directory": str(tmp_path)},
+        }
+        first = StripeMcpClient(config)
+        make_fake_sessions(first)
+        await first.connect()
+        await first.disconnect()
+
+        second = StripeMcpClient(config)
+        make_fake_sessions(second)
+        new_tools = [{
+            "name": "create_refund",
+            "description": "Create refund",
+            "inputSchema": {"type": "object"},
+        }]
+        second._list_tools = AsyncMock(return_value=new_tools)
+        changes = []
+        second.add_tools_listener(changes.append)
+
+        await second.connect()
+        await second._revalidate_task
+
+        assert changes == [new_tools]
+        assert second.get_tools() == new_tools
+        await second.disconnect()
+
+
+class TestResultCaching:
+    """Tests for the read-through result cache in call_tool."""
+
+    async def test_read_results_are_cached(self):
+        """Repeated read calls should be served from the cache."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "result_cache": {"ttl": 60},
+        })
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        await client.call_tool("list_customers", {"limit": 3})
+        await client.call_tool("list_customers", {"limit": 3})
+
+        assert opened[0].call_tool.await_count == 1
+        assert client.result_cache_stats["hits"] == 1
+        assert client.result_cache_stats["misses"] == 1
+        await client.disconnect()
+
+    async def test_write_invalidates_cached_reads(self):
+        """A create call should invalidate related cached reads."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "result_cache": {},
+        })
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        await client.call_tool("list_customers", {})
+        await client.call_tool("create_customer", {"name": "Jenny"})
+        await client.call_tool("list_customers", {})
+
+        assert opened[0].call_tool.await_count == 3
+        await client.disconnect()
+
+    async def test_cache_disabled_by_default(self):
+        """Without configuration, every call should reach the server."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        await client.call_tool("list_customers", {})
+        await client.call_tool("list_customers", {})
+
+        assert opened[0].call_tool.await_count == 2
+        assert client.result_cache_stats is None
+        await client.disconnect()
+
+
+class TestCoalescing:
+    """Tests for single-flight coalescing of identical read calls."""
+
+    async def test_identical_reads_share_one_request(self):
+        """Concurrent identical reads should send one upstream request."""
+        calls = 0
+
+        async def slow_call(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=slow_call)
+        await client.connect()
+
+        results = await asyncio.gather(*(
+            client.call_tool("list_customers", {"limit": 3})
+            for _ in range(10)
+        ))
+
+        assert results == ["ok"] * 10
+        assert calls == 1
+        assert client.coalesced_calls == 9
+        await client.disconnect()
+
+    async def test_writes_are_not_coalesced(self):
+        """Identical concurrent writes should each be sent."""
+        calls = 0
+
+        async def slow_call(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=slow_call)
+        await client.connect()
+
+        await asyncio.gather(*(
+            client.call_tool("create_customer", {"name": "Jenny"})
+            for _ in range(3)
+        ))
+
+        assert calls == 3
+        await client.disconnect()
+
+
+class TestRetries:
+    """Tests for retrying transient failures."""
+
+    async def test_rate_limited_call_is_retried(self):
+        """A rate-limited call should be retried transparently."""
+        calls = 0
+
+        async def flaky_call(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return SimpleNamespace(
+                    isError=True,
+                    content=[SimpleNamespace(text="Rate limit exceeded")],
+                )
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"base_delay": 0.001},
+        })
+        make_fake_sessions(client, call_tool=flaky_call)
+        await client.connect()
+
+        assert await client.call_tool("list_customers", {}) == "ok"
+        assert calls == 2
+        assert client.retry_counts == {"list_customers": 1}
+        await client.disconnect()
+
+    async def test_tool_error_is_not_retried(self):
+        """Errors reported by the tool itself should surface immediately."""
+        call_tool = AsyncMock(return_value=SimpleNamespace(
+            isError=True, content=[SimpleNamespace(text="No such customer")]
+        ))
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpToolError, match="No such customer"):
+            await client.call_tool("retrieve_customer", {"id": "cus_123"})
+        assert call_tool.await_count == 1
+        await client.disconnect()
+
+    async def test_write_retries_reuse_idempotency_key(self):
+        """Retries of a write should carry the same idempotency key."""
+        keys = []
+
+        async def flaky_call(name, args, meta=None, **kwargs):
+            keys.append(meta[IDEMPOTENCY_META_KEY])
+            if len(keys) < 3:
+                raise httpx.ReadError("connection reset")
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"base_delay": 0.001, "retry_writes": True},
+        })
+        make_fake_sessions(client, call_tool=flaky_call)
+        await client.connect()
+
+        await client.call_tool("create_customer", {"name": "Jenny"})
+        await client.call_tool("create_customer", {"name": "Jenny"})
+
+        assert len(keys) == 4
+        assert keys[0] == keys[1] == keys[2]
+        assert keys[3] != keys[0]
+        await client.disconnect()
+
+    async def test_ambiguous_write_failure_not_retried(self):
+        """A write that may have reached the server should not be resent."""
+        call_tool = AsyncMock(side_effect=httpx.ReadError("connection reset"))
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"base_delay": 0.001},
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(Exception):
+            await client.call_tool("create_refund", {"charge": "ch_123"})
+
+        assert call_tool.await_count == 1
+        assert client.retry_counts == {}
+        await client.disconnect()
+
+    async def test_rate_limited_write_is_retried(self):
+        """A write rejected by rate limiting was not applied; retry it."""
+        calls = 0
+
+        async def limited_call(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return SimpleNamespace(
+                    isError=True,
+                    content=[SimpleNamespace(text="Rate limit exceeded")],
+                )
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"base_delay": 0.001},
+        })
+        make_fake_sessions(client, call_tool=limited_call)
+        await client.connect()
+
+        assert await client.call_tool("create_customer", {}) == "ok"
+        assert client.retry_counts == {"create_customer": 1}
+        await client.disconnect()
+
+    async def test_gives_up_after_max_attempts(self):
+        """Persistent failures should raise once attempts run out."""
+        call_tool = AsyncMock(return_value=SimpleNamespace(
+            isError=True, content=[SimpleNamespace(text="Rate limit exceeded")]
+        ))
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"max_attempts": 2, "base_delay": 0.001},
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpRateLimitError):
+            await client.call_tool("list_customers", {})
+        assert call_tool.await_count == 2
+        await client.disconnect()
+
+
+class TestRateLimiting:
+    """Tests for client-side rate limiting."""
+
+    async def test_rate_limit_disabled_by_default(self):
+        """Without configuration no limiter should be created."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+
+        assert client.rate_limit_stats is None
+
+    async def test_calls_are_paced(self):
+        """Calls over the configured rate should wait for a token."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "rate_limit": {"read_rate": 50, "read_burst": 1},
+        })
+        make_fake_sessions(client)
+        await client.connect()
+
+        for i in range(3):
+            await client.call_tool("list_customers", {"limit": i})
+
+        assert client.rate_limit_stats["delayed"] == 2
+        await client.disconnect()
+
+    async def test_server_rate_limit_penalizes_account(self):
+        """A rate-limited response should pause the account's budget."""
+        call_tool = AsyncMock(return_value=SimpleNamespace(
+            isError=True, content=[SimpleNamespace(text="Rate limit exceeded")]
+        ))
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "rate_limit": {},
+            "retry": {"max_attempts": 1},
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpRateLimitError):
+            await client.call_tool("list_customers", {})
+
+        assert client.rate_limit_stats["penalties"] == 1
+        await client.disconnect()
+
+
+class TestTimeouts:
+    """Tests for per-call timeouts and deadlines."""
+
+    async def test_call_timeout_raises_typed_error(self):
+        """A hung call should raise McpTimeoutError and drain its session."""
+        async def hung_call(name, args, **kwargs):
+            await asyncio.sleep(10)
+
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=hung_call)
+        await client.connect()
+
+        with pytest.raises(McpTimeoutError) as exc_info:
+            await client.call_tool("list_customers", {}, timeout=0.02)
+        assert isinstance(exc_info.value, TimeoutError)
+
+        await asyncio.sleep(0)
+        assert client._pool.size == 0
+        await client.disconnect()
+
+    async def test_configured_call_timeout(self):
+        """call_timeout from the configuration should apply by default."""
+        async def hung_call(name, args, **kwargs):
+            await asyncio.sleep(10)
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "timeouts": {"call_timeout": 0.02},
+        })
+        make_fake_sessions(client, call_tool=hung_call)
+        await client.connect()
+
+        with pytest.raises(McpTimeoutError):
+            await client.call_tool("list_customers", {})
+        await client.disconnect()
+
+    async def test_attempt_timeout_is_retried(self):
+        """A hung attempt should be retried within the call's time."""
+        calls = 0
+
+        async def hangs_once(name, args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "timeouts": {"call_timeout": 1.0, "attempt_timeout": 0.02},
+            "retry": {"base_delay": 0.001},
+        })
+        make_fake_sessions(client, call_tool=hangs_once)
+        await client.connect()
+
+        assert await client.call_tool("list_customers", {}) == "ok"
+        assert calls == 2
+        await client.disconnect()
+
+    async def test_transport_timeout_is_transport_error(self):
+        """A socket timeout should not be mistaken for an attempt timeout."""
+        call_tool = AsyncMock(
+            side_effect=TimeoutError(errno.ETIMEDOUT, "Connection timed out")
+        )
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "retry": {"max_attempts": 1}
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpTransportError):
+            await client.call_tool("list_customers", {})
+        await client.disconnect()
+
+    async def test_deadline_scope_bounds_calls(self):
+        """Calls inside a deadline_scope should share its deadline."""
+        async def slow_call(name, args, **kwargs):
+            await asyncio.sleep(0.03)
+            return SimpleNamespace(
+                isError=False, content=[SimpleNamespace(text="ok")]
+            )
+
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=slow_call)
+        await client.connect()
+
+        with deadline_scope(0.05):
+            await client.call_tool("list_customers", {"limit": 1})
+            with pytest.raises(McpTimeoutError):
+                await client.call_tool("list_customers", {"limit": 2})
+        await client.disconnect()
+
+    async def test_expired_deadline_fails_fast(self):
+        """A call whose deadline already passed should not be sent."""
+        call_tool = AsyncMock()
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpTimeoutError):
+            await client.call_tool(
+                "list_customers", {}, deadline=time.monotonic() - 1
+            )
+        call_tool.assert_not_awaited()
+        await client.disconnect()
+
+
+class TestCircuitBreaking:
+    """Tests for the circuit breaker around the MCP endpoint."""
+
+    async def test_open_circuit_fails_fast(self):
+        """Once tripped, calls should fail without reaching the server."""
+        call_tool = AsyncMock(
+            side_effect=McpError(ErrorData(code=INTERNAL_ERROR, message="x"))
+        )
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "retry": {"max_attempts": 1},
+            "circuit_breaker": {"minimum_calls": 2, "probe_interval": 60},
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        for _ in range(2):
+            with pytest.raises(McpServerError):
+                await client.call_tool("list_customers", {})
+        assert client.circuit_state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await client.call_tool("list_customers", {})
+        assert call_tool.await_count == 2
+        await client.disconnect()
+
+    async def test_queueing_is_not_slowness(self):
+        """Calls that wait for a slot but are served fast stay closed."""
+        stub = StubMcpServer(seed=0, latency=0.02)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "transport": stub.transport(),
+            "max_concurrency": 1,
+            "circuit_breaker": {
+                "minimum_calls": 4,
+                "slow_call_threshold": 0.05,
+                "slow_call_rate_threshold": 0.5,
+            },
+        })
+        await client.connect()
+
+        await asyncio.gather(*(
+            client.call_tool("list_customers", {"limit": i + 1})
+            for i in range(8)
+        ))
+
+        assert client.circuit_stats["calls"] == 8
+        assert client.circuit_state is CircuitState.CLOSED
+        await client.disconnect()
+
+    async def test_tool_errors_do_not_trip(self):
+        """Errors reported by tools should not open the circuit."""
+        call_tool = AsyncMock(return_value=SimpleNamespace(
+            isError=True, content=[SimpleNamespace(text="No such customer")]
+        ))
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "circuit_breaker": {"minimum_calls": 1},
+        })
+        make_fake_sessions(client, call_tool=call_tool)
+        await client.connect()
+
+        with pytest.raises(McpToolError):
+            await client.call_tool("retrieve_customer", {"id": "cus_1"})
+
+        assert client.circuit_state is CircuitState.CLOSED
+        await client.disconnect()
+
+    def test_breaker_disabled_by_default(self):
+        """Without configuration there should be no breaker."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+
+        assert client.circuit_state is None
+
+
+class TestConnectedAccounts:
+    """Tests for acting on many connected accounts from one client."""
+
+    @staticmethod
+    def make_account_sessions(client):
+        """Fake sessions whose tool calls return the session's account."""
+        opened = []
+        closed = []
+
+        @asynccontextmanager
+        async def create_session(account=None):
+            session = MagicMock()
+            session.list_tools = AsyncMock(
+                return_value=SimpleNamespace(tools=[])
+            )
+
+            async def call_tool(name, args, **kwargs):
+                return SimpleNamespace(
+                    isError=False,
+                    content=[SimpleNamespace(text=account or "platform")],
+                )
+
+            session.call_tool = call_tool
+            session.send_ping = AsyncMock()
+            opened.append(account)
+            try:
+                yield session
+            finally:
+                closed.append(account)
+
+        client._create_session = create_session
+        return opened, closed
+
+    async def test_per_call_account(self):
+        """Calls should run on sessions for the account they act on."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        opened, _ = self.make_account_sessions(client)
+        await client.connect()
+
+        assert await client.call_tool("list_customers", {}) == "platform"
+        assert await client.call_tool(
+            "list_customers", {}, account="acct_1"
+        ) == "acct_1"
+        with account_scope("acct_2"):
+            assert await client.call_tool("list_customers", {}) == "acct_2"
+            # An explicit account wins over the scope
+            assert await client.call_tool(
+                "list_customers", {}, account="acct_1"
+            ) == "acct_1"
+
+        # One catalog fetch, one pool per account
+        assert opened.count("acct_1") == 1
+        assert opened.count("acct_2") == 1
+        await client.disconnect()
+
+    async def test_configured_account_is_default(self):
+        """Without a per-call account, the configured one applies."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "account": "acct_main"
+        })
+        headers = client._get_headers()
+        assert headers["Stripe-Account"] == "acct_main"
+        assert client._get_headers("acct_1")["Stripe-Account"] == "acct_1"
+        assert client.resolve_account() == "acct_main"
+        with account_scope("acct_2"):
+            assert client.resolve_account() == "acct_2"
+
+    async def test_idle_account_pools_evicted(self):
+        """Least recently used idle account pools should be closed."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "max_account_pools": 2
+        })
+        _, closed = self.make_account_sessions(client)
+        await client.connect()
+
+        for account in ("acct_1", "acct_2", "acct_1", "acct_3"):
+            await client.call_tool("list_customers", {}, account=account)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert [a for _, a in client._account_pools] == ["acct_1", "acct_3"]
+        assert closed == ["acct_2"]
+        await client.disconnect()
+        assert sorted(c or "" for c in closed) == [
+            "", "acct_1", "acct_2", "acct_3"
+        ]
+
+    async def test_batch_with_accounts(self):
+        """Batch calls should accept a per-item account."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        self.make_account_sessions(client)
+        await client.connect()
+
+        results = await client.call_tools_batch([
+            ("list_customers", {}),
+            ("list_customers", {}, None, "acct_1"),
+        ])
+
+        assert [r["result"] for r in results] == ["platform", "acct_1"]
+        with pytest.raises(ValueError):
+            await client.call_tools_batch([("list_customers",)])
+        await client.disconnect()
+
+
+class TestWarmUp:
+    """Tests for pre-opening sessions."""
+
+    async def test_warm_up(self):
+        """warm_up() should open sessions and report on them."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "warm_up": {"sessions": 3}
+        })
+        opened = make_fake_sessions(client)
+        await client.connect()
+        assert len(opened) == 1
+        assert client.last_warm_up is None
+
+        report = await client.warm_up()
+
+        assert len(opened) == 3
+        assert report["opened"] == 2
+        assert report["pinged"] == 1
+        assert client.last_warm_up is report
+        await client.disconnect()
+
+    async def test_warm_up_on_initialize(self):
+        """connect() should warm up when configured to."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "warm_up": {"on_initialize": True, "sessions": 2},
+        })
+        opened = make_fake_sessions(client)
+
+        await client.connect()
+
+        assert len(opened) == 2
+        assert client.last_warm_up["sessions"] == 2
+        await client.disconnect()
+
+    async def test_periodic_rewarm(self):
+        """Idle sessions should be pinged every interval."""
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "warm_up": {"interval": 0.02}
+        })
+        opened = make_fake_sessions(client)
+        await client.connect()
+
+        await asyncio.sleep(0.1)
+
+        assert opened[0].send_ping.await_count >= 2
+        await client.disconnect()
+        assert client._rewarm_task is None
+
+
 class TestMcpClientConfig:
     """Tests for config storage."""
 
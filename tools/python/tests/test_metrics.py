@@ -0,0 +1,155 @@
+"""Tests for the metrics registry."""
+
+import threading
+
+import pytest
+
+from stripe_agent_toolkit.shared.errors import McpToolError
+from stripe_agent_toolkit.shared.metrics import MetricsRegistry
+from stripe_agent_toolkit.testing import StubMcpServer
+from tests.test_toolkit_core import NameToolkit
+
+
+def samples(registry, name):
+    """The samples of one metric, keyed by their label values."""
+    return {
+        tuple(s["labels"].values()): s
+        for s in registry.snapshot()[name]["samples"]
+    }
+
+
+class TestMetricsRegistry:
+    """Tests for the MetricsRegistry class."""
+
+    def test_counter_and_gauge(self):
+        """Counters and gauges should track values per label set."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls.", ("tool",))
+        calls.labels("a").inc()
+        calls.labels("a").inc(2)
+        calls.labels("b").inc()
+        in_flight = registry.gauge("in_flight", "In flight.")
+        in_flight.labels().inc()
+        in_flight.labels().dec()
+
+        assert samples(registry, "calls_total")[("a",)]["value"] == 3
+        assert samples(registry, "calls_total")[("b",)]["value"] == 1
+        assert samples(registry, "in_flight")[()]["value"] == 0
+        assert registry.snapshot()["calls_total"]["type"] == "counter"
+
+    def test_histogram(self):
+        """Histograms should report cumulative bucket counts."""
+        registry = MetricsRegistry()
+        latency = registry.histogram(
+            "latency_seconds", "Latency.", buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.labels().observe(value)
+
+        (sample,) = samples(registry, "latency_seconds").values()
+        assert sample["buckets"] == [
+            (0.1, 2), (1.0, 3), (float("inf"), 4)
+        ]
+        assert sample["count"] == 4
+        assert sample["sum"] == pytest.approx(3.65)
+
+    def test_get_or_create(self):
+        """Registering a name again should return the same metric."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls.")
+        assert registry.counter("calls_total", "Calls.") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls.")
+
+    def test_label_count_checked(self):
+        """Passing the wrong number of label values should raise."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls.", ("tool",))
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+
+    def test_concurrent_updates(self):
+        """Increments from many threads should not be lost."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls.", ("tool",))
+
+        def work():
+            for _ in range(1000):
+                counter.labels("a").inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert samples(registry, "calls_total")[("a",)]["value"] == 8000
+
+    def test_prometheus_text(self):
+        """The exporter should render the Prometheus text format."""
+        registry = MetricsRegistry()
+        registry.counter(
+            "calls_total", "Calls\nmade.", ("tool",)
+        ).labels('say "hi"').inc()
+        registry.histogram(
+            "latency_seconds", "Latency.", buckets=(0.5,)
+        ).labels().observe(0.25)
+
+        assert registry.to_prometheus() == (
+            "# HELP calls_total Calls\\nmade.\n"
+            "# TYPE calls_total counter\n"
+            'calls_total{tool="say \\"hi\\""} 1\n'
+            "# HELP latency_seconds Latency.\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{le="0.5"} 1\n'
+            'latency_seconds_bucket{le="+Inf"} 1\n'
+            "latency_seconds_sum 0.25\n"
+            "latency_seconds_count 1\n"
+        )
+
+    def test_empty_registry(self):
+        """An empty registry should export nothing."""
+        assert MetricsRegistry().to_prometheus() == ""
+
+
+class TestToolkitMetrics:
+    """Tests for metrics fed by StripeMcpClient and ToolkitCore."""
+
+    async def test_records_calls(self):
+        """Tool calls should update counters, gauges and histograms."""
+        registry = MetricsRegistry()
+        stub = StubMcpServer(seed=0)
+        toolkit = NameToolkit("rk_test_123", {
+            "context": {"account": "acct_123"},
+            "metrics": registry,
+        })
+        toolkit.mcp_client._create_session = stub.memory_session
+        await toolkit.initialize()
+
+        await toolkit.run_tool("list_customers", {})
+        await toolkit.run_tool("create_customer", {"name": "Jenny"})
+        stub.error_rate = 1.0
+        with pytest.raises(McpToolError):
+            await toolkit.run_tool("create_customer", {"name": "Jenny"})
+
+        key = ("create_customer", "acct_123")
+        assert samples(registry, "stripe_mcp_calls_total")[key]["value"] == 2
+        assert samples(registry, "stripe_mcp_requests_total")[key][
+            "value"
+        ] == 2
+        errors = samples(registry, "stripe_mcp_call_errors_total")
+        assert errors[(*key, "McpToolError")]["value"] == 1
+        assert samples(registry, "stripe_mcp_calls_in_flight")[key][
+            "value"
+        ] == 0
+        latency = samples(registry, "stripe_mcp_call_duration_seconds")
+        assert latency[key]["count"] == 2
+        phases = samples(registry, "stripe_mcp_phase_duration_seconds")
+        assert {"queue", "request", "extract"} <= {p for (p,) in phases}
+
+        runs = samples(registry, "stripe_toolkit_tool_runs_total")
+        assert runs[key]["value"] == 2
+        assert runs[("list_customers", "acct_123")]["value"] == 1
+        run_errors = samples(registry, "stripe_toolkit_tool_run_errors_total")
+        assert run_errors[(*key, "McpToolError")]["value"] == 1
+        assert "stripe_mcp_calls_total{" in registry.to_prometheus()
+        await toolkit.close()
@@ -0,0 +1,121 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from stripe_agent_toolkit.shared import rate_limit
+from stripe_agent_toolkit.shared.rate_limit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket class."""
+
+    def test_burst_is_free(self):
+        """Reservations within the burst should not wait."""
+        bucket = TokenBucket(rate=10, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_reservations_queue_in_order(self):
+        """Reservations past the burst should wait progressively longer."""
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+
+        first = bucket.reserve()
+        second = bucket.reserve()
+
+        assert first == pytest.approx(0.1, abs=0.01)
+        assert second == pytest.approx(0.2, abs=0.01)
+
+    def test_penalize_blocks_for_retry_after(self):
+        """A penalty should delay the next reservation by retry_after."""
+        bucket = TokenBucket(rate=1000, burst=100)
+        bucket.penalize(0.5)
+
+        assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+
+    def test_refund_returns_token(self):
+        """A refunded reservation should not count against the budget."""
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+        bucket.refund()
+
+        assert bucket.reserve() == 0.0
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter class."""
+
+    async def test_accounts_have_independent_budgets(self):
+        """One account exhausting its budget should not delay another."""
+        limiter = RateLimiter(read_rate=10, read_burst=1)
+
+        assert await limiter.acquire("acct_1", write=False) == 0.0
+        assert await limiter.acquire("acct_2", write=False) == 0.0
+        assert await limiter.acquire(None, write=False) == 0.0
+
+    async def test_reads_and_writes_have_separate_budgets(self):
+        """Writes should not consume the read budget."""
+        limiter = RateLimiter(
+            read_rate=10, read_burst=1, write_rate=10, write_burst=1
+        )
+
+        assert await limiter.acquire("acct_1", write=False) == 0.0
+        assert await limiter.acquire("acct_1", write=True) == 0.0
+
+    async def test_calls_over_budget_wait(self):
+        """Calls over the rate should be spread out and counted."""
+        limiter = RateLimiter(read_rate=50, read_burst=1)
+
+        start = time.monotonic()
+        await asyncio.gather(*(
+            limiter.acquire("acct_1", write=False) for _ in range(5)
+        ))
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.07
+        stats = limiter.stats()
+        assert stats["delayed"] == 4
+        assert stats["queued"] == 0
+        assert stats["max_wait"] == pytest.approx(0.08, abs=0.01)
+
+    async def test_queue_depth_is_reported(self):
+        """Waiting callers should show up in the queue depth."""
+        limiter = RateLimiter(read_rate=10, read_burst=1)
+        await limiter.acquire("acct_1", write=False)
+
+        waiter = asyncio.create_task(limiter.acquire("acct_1", write=False))
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.stats()["queued"] == 0
+
+    async def test_penalize_pauses_account(self):
+        """A 429 with Retry-After should pause only that account."""
+        limiter = RateLimiter(read_rate=1000, write_rate=1000)
+        limiter.penalize("acct_1", 0.05)
+
+        assert await limiter.acquire("acct_2", write=False) == 0.0
+        assert await limiter.acquire("acct_1", write=True) >= 0.04
+        assert limiter.stats()["penalties"] == 1
+
+    async def test_idle_buckets_dropped(self, monkeypatch):
+        """Refilled buckets should not pile up across many accounts."""
+        monkeypatch.setattr(rate_limit, "BUCKET_PRUNE_THRESHOLD", 4)
+        limiter = RateLimiter(read_rate=1000, read_burst=1)
+        limiter.penalize("acct_0", 10)
+        for account in ("acct_1", "acct_2"):
+            await limiter.acquire(account, write=False)
+        await asyncio.sleep(0.01)
+
+        await limiter.acquire("acct_new", write=False)
+
+        # Only the paused account and the new one keep their buckets
+        assert sorted(limiter._buckets) == [
+            ("acct_0", False), ("acct_0", True), ("acct_new", False)
+        ]
@@ -0,0 +1,167 @@
+"""Tests for ResultCache and tool classification."""
+
+import time
+
+import pytest
+
+from stripe_agent_toolkit.shared import result_cache
+from stripe_agent_toolkit.shared.result_cache import ResultCache
+from stripe_agent_toolkit.shared.tool_result import ToolResult
+from stripe_agent_toolkit.shared.tool_rules import (
+    call_key,
+    is_read_only_tool,
+    normalize_args,
+    tool_resource,
+)
+
+
+class TestToolRules:
+    """Tests for tool classification helpers."""
+
+    @pytest.mark.parametrize("name", [
+        "list_customers",
+        "retrieve_balance",
+        "search_stripe_resources",
+        "fetch_stripe_resources",
+        "get_stripe_account_info",
+    ])
+    def test_read_only_by_prefix(self, name):
+        """Read-style verbs should be classified read-only."""
+        assert is_read_only_tool(name)
+
+    @pytest.mark.parametrize("name", [
+        "create_customer",
+        "update_subscription",
+        "cancel_subscription",
+        "finalize_invoice",
+    ])
+    def test_writes_by_prefix(self, name):
+        """Mutating verbs should not be classified read-only."""
+        assert not is_read_only_tool(name)
+
+    def test_annotation_overrides_prefix(self):
+        """The server's readOnlyHint should win over the name."""
+        assert not is_read_only_tool("list_x", {"readOnlyHint": False})
+        assert is_read_only_tool("do_thing", {"readOnlyHint": True})
+
+    def test_tool_resource(self):
+        """Resources should be singularized from the tool name."""
+        assert tool_resource("list_invoices") == "invoice"
+        assert tool_resource("create_invoice_item") == "invoice_item"
+        assert tool_resource("list_payment_intents") == "payment_intent"
+        assert tool_resource("retrieve_balance") == "balance"
+
+    def test_normalize_args(self):
+        """Argument order and None values should not matter."""
+        assert normalize_args({"b": 1, "a": 2, "c": None}) == (
+            normalize_args({"a": 2, "b": 1})
+        )
+
+
+class TestResultCache:
+    """Tests for the ResultCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """get() should count hits and misses."""
+        cache = ResultCache()
+        key = call_key("list_customers", {"limit": 3}, None, None)
+
+        assert cache.get(key) is None
+        cache.put(key, ToolResult("[]"), cache.generation(None))
+        assert str(cache.get(key)) == "[]"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries should expire after the TTL."""
+        cache = ResultCache(ttl=0.01)
+        key = call_key("list_customers", {}, None, None)
+        cache.put(key, ToolResult("[]"), 0)
+
+        time.sleep(0.02)
+
+        assert cache.get(key) is None
+
+    def test_lru_eviction_by_count(self):
+        """The least recently used entry should be evicted first."""
+        cache = ResultCache(max_entries=2)
+        keys = [call_key(f"list_{i}", {}, None, None) for i in range(3)]
+        cache.put(keys[0], ToolResult("0"), 0)
+        cache.put(keys[1], ToolResult("1"), 0)
+        cache.get(keys[0])
+        cache.put(keys[2], ToolResult("2"), 0)
+
+        assert str(cache.get(keys[0])) == "0"
+        assert cache.get(keys[1]) is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_size(self):
+        """Entries should be evicted to stay within max_bytes."""
+        cache = ResultCache(max_bytes=10)
+        first = call_key("list_a", {}, None, None)
+        second = call_key("list_b", {}, None, None)
+        cache.put(first, ToolResult("x" * 6), 0)
+        cache.put(second, ToolResult("y" * 6), 0)
+
+        assert cache.get(first) is None
+        assert str(cache.get(second)) == "y" * 6
+        assert cache.stats()["bytes"] == 6
+
+    def test_write_invalidates_related_reads(self):
+        """A write should invalidate reads of related resources only."""
+        cache = ResultCache()
+        invoices = call_key("list_invoices", {}, "acct_1", None)
+        customers = call_key("list_customers", {}, "acct_1", None)
+        search = call_key(
+            "search_stripe_resources", {"query": "x"}, "acct_1", None
+        )
+        other_account = call_key("list_invoices", {}, "acct_2", None)
+        for key in (invoices, customers, search):
+            cache.put(key, ToolResult("v"), cache.generation("acct_1"))
+        cache.put(other_account, ToolResult("v"), cache.generation("acct_2"))
+
+        removed = cache.invalidate_for_write("create_invoice_item", "acct_1")
+
+        assert removed == 2
+        assert cache.get(invoices) is None
+        assert cache.get(search) is None
+        assert str(cache.get(customers)) == "v"
+        assert str(cache.get(other_account)) == "v"
+
+    def test_read_racing_a_write_is_not_cached(self):
+        """A read started before a write should not populate the cache."""
+        cache = ResultCache()
+        key = call_key("list_invoices", {}, None, None)
+        generation = cache.generation(None)
+
+        cache.invalidate_for_write("create_invoice", None)
+        cache.put(key, ToolResult("stale"), generation)
+
+        assert cache.get(key) is None
+
+    def test_generations_bounded(self, monkeypatch):
+        """Forgetting old accounts' generations must not cache stale reads."""
+        monkeypatch.setattr(result_cache, "MAX_TRACKED_ACCOUNTS", 2)
+        cache = ResultCache()
+        key = call_key("list_invoices", {}, "acct_1", None)
+        cache.invalidate_for_write("create_invoice", "acct_1")
+        generation = cache.generation("acct_1")
+
+        for account in ("acct_1", "acct_2", "acct_3"):
+            cache.invalidate_for_write("create_invoice", account)
+
+        assert len(cache._generations) <= 2
+        cache.put(key, ToolResult("stale"), generation)
+        assert cache.get(key) is None
+        cache.put(key, ToolResult("fresh"), cache.generation("acct_1"))
+        assert str(cache.get(key)) == "fresh"
+
+    def test_explicit_tool_patterns(self):
+        """Only tools matching configured patterns should be cacheable."""
+        cache = ResultCache(tools=["retrieve_*"])
+
+        assert cache.is_cacheable("retrieve_balance")
+        assert not cache.is_cacheable("list_customers")
@@ -0,0 +1,149 @@
+"""Tests for error classification and the retry policy."""
+
+import httpx
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ErrorData
+
+from stripe_agent_toolkit.shared.errors import (
+    McpRateLimitError,
+    McpServerError,
+    McpToolError,
+    McpTransportError,
+    StripeMcpError,
+    classify_error,
+    parse_retry_after,
+    tool_error,
+)
+from stripe_agent_toolkit.shared.retry import RetryPolicy
+
+
+def http_error(status, headers=None):
+    request = httpx.Request("POST", "https://mcp.stripe.com")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(
+        f"HTTP {status}", request=request, response=response
+    )
+
+
+class TestClassifyError:
+    """Tests for mapping exceptions onto toolkit errors."""
+
+    def test_rate_limit_with_retry_after(self):
+        """HTTP 429 should carry the server's Retry-After."""
+        error = classify_error(
+            http_error(429, {"Retry-After": "2"}), "list_customers"
+        )
+
+        assert isinstance(error, McpRateLimitError)
+        assert error.retry_after == 2.0
+        assert error.retryable
+
+    def test_server_error(self):
+        """HTTP 5xx should be a retryable server error."""
+        error = classify_error(http_error(503), "list_customers")
+
+        assert isinstance(error, McpServerError)
+        assert error.status_code == 503
+
+    def test_client_error_is_not_retryable(self):
+        """Other HTTP errors should not be retried."""
+        error = classify_error(http_error(401), "list_customers")
+
+        assert type(error) is StripeMcpError
+        assert not error.retryable
+
+    def test_connection_closed_is_transport_error(self):
+        """A closed MCP connection should be a transport error."""
+        error = McpError(ErrorData(code=CONNECTION_CLOSED, message="closed"))
+
+        assert isinstance(
+            classify_error(error, "list_customers"), McpTransportError
+        )
+
+    def test_exception_group_prefers_rate_limit(self):
+        """The most specific cause inside an exception group should win."""
+        group = BaseExceptionGroup("transport", [
+            httpx.ReadError("reset"),
+            http_error(429),
+        ])
+
+        assert isinstance(
+            classify_error(group, "list_customers"), McpRateLimitError
+        )
+
+    def test_errors_remain_runtime_errors(self):
+        """Classified errors should still be RuntimeErrors."""
+        error = classify_error(ValueError("boom"), "list_customers")
+
+        assert isinstance(error, RuntimeError)
+        assert "Failed to execute tool 'list_customers'" in str(error)
+
+    def test_tool_error_detects_rate_limit(self):
+        """Tool errors mentioning rate limits should be retryable."""
+        assert isinstance(
+            tool_error("Rate limit exceeded", "list_customers"),
+            McpRateLimitError,
+        )
+        assert isinstance(
+            tool_error("No such customer", "list_customers"), McpToolError
+        )
+
+    def test_parse_retry_after(self):
+        """Retry-After should parse seconds and ignore garbage."""
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy class."""
+
+    def test_only_retryable_errors_are_retried(self):
+        """Tool errors should never be retried."""
+        policy = RetryPolicy()
+
+        assert policy.should_retry(McpTransportError("x"), 1, "t")
+        assert not policy.should_retry(McpToolError("x"), 1, "t")
+        assert not policy.should_retry(ValueError("x"), 1, "t")
+
+    def test_respects_max_attempts(self):
+        """No retry should be allowed once max_attempts is reached."""
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.should_retry(McpTransportError("x"), 1, "t")
+        assert not policy.should_retry(McpTransportError("x"), 2, "t")
+
+    def test_writes_only_retried_when_not_applied(self):
+        """Writes should only retry failures that left them unapplied."""
+        policy = RetryPolicy()
+
+        assert policy.should_retry(McpRateLimitError("x"), 1, "t", False)
+        assert not policy.should_retry(McpTransportError("x"), 1, "t", False)
+        assert not policy.should_retry(McpServerError("x"), 1, "t", False)
+
+        opted_in = RetryPolicy(retry_writes=True)
+        assert opted_in.should_retry(McpTransportError("x"), 1, "t", False)
+
+    def test_budget_limits_retries(self):
+        """Retries should stop once the budget is spent."""
+        policy = RetryPolicy(budget_ratio=0.5, min_retry_tokens=2)
+        error = McpTransportError("x")
+
+        assert policy.should_retry(error, 1, "t")
+        assert policy.should_retry(error, 1, "t")
+        assert not policy.should_retry(error, 1, "t")
+
+        policy.record_call()
+        policy.record_call()
+        assert policy.should_retry(error, 1, "t")
+        assert policy.retry_counts() == {"t": 3}
+
+    def test_backoff_is_bounded_and_honors_retry_after(self):
+        """Backoff should stay within the window but wait for Retry-After."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+        for attempt in range(1, 6):
+            assert 0 <= policy.backoff(attempt) <= 0.3
+        assert policy.backoff(
+            1, McpRateLimitError("x", retry_after=2.0)
+        ) >= 2.0
@@ -0,0 +1,289 @@
+"""Tests for SessionPool."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from stripe_agent_toolkit.shared.session_pool import SessionPool
+
+
+class FakeSessionFactory:
+    """Session factory that records how many sessions were opened."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.sessions = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.opened += 1
+        session = MagicMock()
+        session.send_ping = AsyncMock()
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            self.closed += 1
+
+
+class TestSessionPool:
+    """Tests for the SessionPool class."""
+
+    async def test_start_warms_min_size(self):
+        """start() should open min_size sessions up front."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=2, max_size=4)
+
+        await pool.start()
+
+        assert factory.opened == 2
+        assert pool.size == 2
+        assert pool.idle_count == 2
+        await pool.close()
+
+    async def test_sessions_are_reused(self):
+        """Sequential checkouts should reuse the same session."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=4)
+        await pool.start()
+
+        for _ in range(5):
+            async with pool.session() as pooled:
+                assert pooled.session is factory.sessions[0]
+
+        assert factory.opened == 1
+        await pool.close()
+
+    async def test_max_size_bounds_open_sessions(self):
+        """Checkouts beyond the pool's capacity should wait for a release."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(
+            factory, min_size=0, max_size=2, max_requests_per_session=1
+        )
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.session():
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert factory.opened == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert factory.opened == 2
+        await pool.close()
+
+    async def test_concurrent_requests_share_a_session(self):
+        """Concurrent checkouts should multiplex onto one session."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(
+            factory, min_size=1, max_size=4, max_requests_per_session=4
+        )
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.session():
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        assert factory.opened == 1
+        assert pool.in_flight == 4
+
+        # A fifth request saturates the first session and opens another
+        tasks.append(asyncio.create_task(hold()))
+        await asyncio.sleep(0.01)
+        assert factory.opened == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert pool.in_flight == 0
+        await pool.close()
+
+    async def test_broken_session_is_replaced(self):
+        """A session marked broken should not be handed out again."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=2)
+        await pool.start()
+
+        async with pool.session() as pooled:
+            pooled.mark_broken()
+
+        async with pool.session() as pooled:
+            assert pooled.session is factory.sessions[1]
+
+        await pool.close()
+
+    async def test_draining_session_finishes_in_flight_requests(self):
+        """A draining session should take no new requests but stay open
+        until its in-flight requests finish."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=2)
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.session():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        async with pool.session() as pooled:
+            pooled.mark_draining()
+
+        async with pool.session() as pooled:
+            assert pooled.session is factory.sessions[1]
+        assert factory.closed == 0
+
+        release.set()
+        await holder
+        await asyncio.sleep(0)
+        assert factory.closed == 1
+        await pool.close()
+
+    async def test_requests_fail_when_session_dies(self):
+        """A request waiting on a session whose transport failed should
+        raise the transport's error instead of hanging."""
+        died = asyncio.Event()
+
+        @asynccontextmanager
+        async def factory():
+            async def fail():
+                await died.wait()
+                raise ConnectionResetError("reset")
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(fail)
+                yield MagicMock()
+
+        pool = SessionPool(factory, min_size=1, max_size=1)
+        await pool.start()
+
+        async def never_answered(session):
+            await asyncio.Event().wait()
+
+        async with pool.session() as pooled:
+            died.set()
+            with pytest.raises(ExceptionGroup) as exc_info:
+                await pooled.run(never_answered)
+
+        assert exc_info.group_contains(ConnectionResetError)
+        await pool.close()
+
+    async def test_idle_sessions_are_evicted(self):
+        """Sessions idle beyond idle_timeout should be closed to min_size."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(
+            factory,
+            min_size=1,
+            max_size=3,
+            idle_timeout=0.05,
+            max_requests_per_session=1,
+        )
+        await pool.start()
+        release = asyncio.Event()
+
+        async def hold():
+            async with pool.session():
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+        assert pool.size == 3
+
+        await asyncio.sleep(0.2)
+        assert pool.size == 1
+        await pool.close()
+
+    async def test_failed_health_check_reconnects(self):
+        """An idle session failing its ping should be replaced."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(
+            factory,
+            min_size=1,
+            max_size=1,
+            health_check_interval=0.05,
+        )
+        await pool.start()
+        factory.sessions[0].send_ping.side_effect = ConnectionError()
+
+        await asyncio.sleep(0.2)
+
+        assert factory.opened >= 2
+        async with pool.session() as pooled:
+            assert pooled.session is not factory.sessions[0]
+        await pool.close()
+
+    async def test_avoid_prefers_another_session(self):
+        """Avoided sessions should only be used when the pool is full."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=2)
+        await pool.start()
+
+        async with pool.session() as first:
+            async with pool.session(avoid={first}) as second:
+                assert second is not first
+                async with pool.session(avoid={first, second}) as third:
+                    assert third in (first, second)
+        assert factory.opened == 2
+        await pool.close()
+
+    async def test_warm_opens_and_pings(self):
+        """warm() should ping open sessions and open the missing ones."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=3)
+        await pool.start()
+
+        report = await pool.warm(5)
+
+        assert factory.opened == 3
+        assert factory.sessions[0].send_ping.await_count == 1
+        assert report["sessions"] == 3
+        assert report["opened"] == 2
+        assert report["pinged"] == 1
+        assert report["failed"] == 0
+        assert report["slowest_open"] is not None
+        await pool.close()
+
+    async def test_warm_replaces_dead_sessions(self):
+        """A session failing its warm-up ping should be replaced."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=1, max_size=2)
+        await pool.start()
+        factory.sessions[0].send_ping.side_effect = ConnectionError()
+
+        report = await pool.warm(1)
+
+        assert report["failed"] == 1
+        assert report["opened"] == 1
+        async with pool.session() as pooled:
+            assert pooled.session is factory.sessions[1]
+        await pool.close()
+
+    async def test_close_closes_all_sessions(self):
+        """close() should close every open session."""
+        factory = FakeSessionFactory()
+        pool = SessionPool(factory, min_size=3, max_size=3)
+        await pool.start()
+
+        await pool.close()
+
+        assert factory.closed == 3
+        with pytest.raises(RuntimeError, match="closed"):
+            async with pool.session():
+                pass
+
+    async def test_invalid_sizes_raise(self):
+        """min_size greater than max_size should be rejected."""
+        with pytest.raises(ValueError):
+            SessionPool(FakeSessionFactory(), min_size=3, max_size=2)
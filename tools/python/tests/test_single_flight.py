@@ -0,0 +1,130 @@
+"""Tests for SingleFlight."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stripe_agent_toolkit.shared.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight class."""
+
+    async def test_concurrent_callers_share_one_call(self):
+        """Callers with the same key should share one execution."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(
+            *(flight.do("key", fetch) for _ in range(5))
+        )
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert flight.coalesced == 4
+        assert flight.in_flight == 0
+
+    async def test_different_keys_run_separately(self):
+        """Different keys should not be coalesced."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return calls
+
+        await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+        assert calls == 2
+
+    async def test_errors_propagate_to_all_waiters(self):
+        """A failing call should raise in every waiter."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("key", fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Cancelling one waiter should leave the shared call running."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert await second == "result"
+
+    async def test_last_waiter_cancelling_cancels_call(self):
+        """The shared call should be cancelled once nobody waits on it."""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.in_flight == 0
+
+    def test_loops_on_threads_coalesce_separately(self):
+        """Each loop should share calls among its own callers only."""
+        flight = SingleFlight()
+        calls = 0
+        lock = threading.Lock()
+
+        async def fetch():
+            nonlocal calls
+            with lock:
+                calls += 1
+            await asyncio.sleep(0.02)
+            return threading.current_thread().name
+
+        async def burst():
+            return await asyncio.gather(
+                *(flight.do("key", fetch) for _ in range(10))
+            )
+
+        with ThreadPoolExecutor(4) as pool:
+            bursts = list(pool.map(lambda _: asyncio.run(burst()), range(4)))
+
+        assert calls == 4
+        assert all(len(set(results)) == 1 for results in bursts)
+        assert flight.coalesced == 36
+        assert flight.in_flight == 0
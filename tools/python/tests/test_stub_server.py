@@ -0,0 +1,100 @@
+"""Tests for the stub Stripe MCP server."""
+
+import json
+
+import pytest
+
+from stripe_agent_toolkit.shared.errors import (
+    McpRateLimitError,
+    McpToolError,
+)
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.testing import StubMcpServer, synthetic_tools
+
+
+@pytest.fixture
+def stub():
+    with StubMcpServer(seed=0) as server:
+        yield server
+
+
+def make_client(stub, **config):
+    return StripeMcpClient({
+        "secret_key": "rk_test_123",
+        "server_url": stub.url,
+        **config,
+    })
+
+
+class TestStubMcpServer:
+    """Tests for the StubMcpServer class."""
+
+    async def test_serves_catalog_over_http(self, stub):
+        """The client should list tools and call them against the stub."""
+        client = make_client(stub)
+        await client.connect()
+
+        names = {t["name"] for t in client.get_tools()}
+        assert {"create_customer", "list_customers"} <= names
+        assert client.is_read_only("list_customers")
+        assert not client.is_read_only("create_customer")
+
+        result = json.loads(
+            await client.call_tool("create_customer", {"name": "Jenny"})
+        )
+        assert result["object"] == "customer"
+        assert result["id"].startswith("cus_")
+        assert result["name"] == "Jenny"
+
+        listing = json.loads(
+            await client.call_tool("list_invoices", {"limit": 2})
+        )
+        assert len(listing["data"]) == 2
+        assert stub.calls == 2
+        await client.disconnect()
+
+    async def test_tool_error_injection(self, stub):
+        """error_rate should make tools report errors."""
+        stub.error_rate = 1.0
+        client = make_client(stub)
+        await client.connect()
+
+        with pytest.raises(McpToolError, match="Simulated error"):
+            await client.call_tool("list_customers", {})
+        await client.disconnect()
+
+    async def test_rate_limit_injection(self, stub):
+        """rate_limit_rate should answer with HTTP 429 and Retry-After."""
+        stub.rate_limit_rate = 1.0
+        stub.retry_after = 3
+        client = make_client(stub, retry={"max_attempts": 1})
+        await client.connect()
+
+        with pytest.raises(McpRateLimitError) as exc_info:
+            await client.call_tool("list_customers", {})
+        assert exc_info.value.retry_after == 3
+        await client.disconnect()
+
+    async def test_server_error_is_retried(self, stub):
+        """Injected 503s should be retried until one succeeds."""
+        stub.server_error_rate = 0.5
+        client = make_client(
+            stub, retry={"max_attempts": 10, "base_delay": 0.001}
+        )
+        await client.connect()
+
+        for i in range(5):
+            await client.call_tool("list_customers", {"limit": i + 1})
+        assert stub.errors_injected > 0
+        await client.disconnect()
+
+    async def test_memory_session(self):
+        """The stub should also serve in-memory sessions."""
+        stub = StubMcpServer(tools=synthetic_tools(60))
+        async with stub.memory_session() as session:
+            tools = await session.list_tools()
+            result = await session.call_tool("retrieve_balance", {})
+
+        assert len(tools.tools) == 60
+        assert len({t.name for t in tools.tools}) == 60
+        assert json.loads(result.content[0].text)["object"] == "balance"
@@ -0,0 +1,115 @@
+"""Tests for ToolResult and structured tool results."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.shared.tool_result import ToolResult
+from stripe_agent_toolkit.testing import StubMcpServer
+
+
+class TestToolResult:
+    """Tests for the ToolResult class."""
+
+    def test_parses_text_lazily(self):
+        """The text should be parsed once, on first access to data."""
+        result = ToolResult(text='{"id": "cus_123"}')
+        assert result.data == {"id": "cus_123"}
+        assert result.data is result.data
+        assert not result.is_structured
+        assert str(result) == '{"id": "cus_123"}'
+
+    def test_prefers_structured_content(self):
+        """Structured content should be returned without parsing text."""
+        result = ToolResult.from_mcp(CallToolResult(
+            content=[TextContent(type="text", text="not json")],
+            structuredContent={"id": "cus_123"},
+        ))
+        assert result.is_structured
+        assert result.data == {"id": "cus_123"}
+        assert result.text == "not json"
+
+    def test_non_json_text(self):
+        """Text that is not JSON should be returned as the payload."""
+        assert ToolResult(text="Done.").data == "Done."
+
+    def test_serializes_only_when_text_needed(self):
+        """A result without text content should be serialized on demand."""
+        mcp_result = CallToolResult(
+            content=[], structuredContent={"id": "cus_123"}
+        )
+        result = ToolResult.from_mcp(mcp_result)
+        assert result._text is None
+        assert result.data == {"id": "cus_123"}
+        assert result._text is None
+
+        # Matches what call_tool returned for such results before
+        assert json.loads(result.text) == mcp_result.model_dump()
+
+    def test_size_does_not_serialize(self):
+        """Measuring a structured-only result should not build its text."""
+        page = {
+            "object": "list",
+            "data": [
+                {"id": f"cus_{i}", "email": None, "balance": i * 100}
+                for i in range(50)
+            ],
+            "has_more": True,
+        }
+        result = ToolResult(structured=page)
+
+        size = result.size
+
+        assert result._text is None
+        assert 0.8 < size / len(json.dumps(page)) < 1.25
+
+    def test_from_fake_result(self):
+        """Results without structuredContent should be accepted."""
+        result = ToolResult.from_mcp(SimpleNamespace(
+            isError=False, content=[SimpleNamespace(text="[1, 2]")]
+        ))
+        assert result.data == [1, 2]
+        assert result.size == 6
+
+    def test_requires_content(self):
+        """A ToolResult needs something to hold."""
+        with pytest.raises(ValueError):
+            ToolResult()
+
+
+class TestStructuredCalls:
+    """Tests for call_tool_result against the stub server."""
+
+    async def test_call_tool_result(self):
+        """call_tool_result should expose the parsed payload."""
+        stub = StubMcpServer(seed=0, structured_content=True)
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        client._create_session = stub.memory_session
+        await client.connect()
+
+        result = await client.call_tool_result("list_customers", {"limit": 2})
+        assert result.is_structured
+        assert len(result.data["data"]) == 2
+
+        text = await client.call_tool("list_customers", {"limit": 1})
+        assert json.loads(text)["object"] == "list"
+        await client.disconnect()
+
+    async def test_cached_result_is_shared(self):
+        """Cached reads should reuse the already parsed payload."""
+        stub = StubMcpServer(seed=0)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "result_cache": {}
+        })
+        client._create_session = stub.memory_session
+        await client.connect()
+
+        first = await client.call_tool_result("list_customers", {})
+        second = await client.call_tool_result("list_customers", {})
+        assert second is first
+        assert second.data is first.data
+        assert stub.calls == 1
+        await client.disconnect()
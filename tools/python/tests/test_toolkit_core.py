@@ -0,0 +1,457 @@
+"""Tests for ToolkitCore."""
+
+import asyncio
+import warnings
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from typing import List
+
+import pytest
+
+from stripe_agent_toolkit.shared.mcp_client import McpTool
+from stripe_agent_toolkit.shared.pagination import next_page_args
+from stripe_agent_toolkit.shared.toolkit_core import ToolkitCore
+from stripe_agent_toolkit.testing import StubMcpServer, paginated_tools
+from tests.test_mcp_client import make_fake_sessions
+
+
+class NameToolkit(ToolkitCore[List[str]]):
+    """Minimal toolkit whose tools are just the MCP tool names."""
+
+    def _empty_tools(self) -> List[str]:
+        return []
+
+    def _convert_tools(self, mcp_tools: List[McpTool]) -> List[str]:
+        return [t["name"] for t in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> str:
+        return mcp_tool["name"]
+
+
+async def echo_call(name, args, **kwargs):
+    """Fake MCP call_tool that echoes its args, failing on request."""
+    await asyncio.sleep(args.get("delay", 0))
+    if args.get("fail"):
+        raise ValueError(f"failed {args['id']}")
+    return SimpleNamespace(
+        isError=False, content=[SimpleNamespace(text=str(args["id"]))]
+    )
+
+
+async def make_toolkit(call_tool=echo_call) -> NameToolkit:
+    toolkit = NameToolkit("rk_test_123")
+    make_fake_sessions(toolkit.mcp_client, call_tool=call_tool)
+    await toolkit.initialize()
+    return toolkit
+
+
+class TestRunToolsBatch:
+    """Tests for batch tool execution."""
+
+    async def test_results_in_input_order(self):
+        """Results should come back in input order."""
+        toolkit = await make_toolkit()
+        calls = [
+            ("retrieve_invoice", {"id": i, "delay": (10 - i) / 1000})
+            for i in range(10)
+        ]
+
+        results = await toolkit.run_tools_batch(calls)
+
+        assert [r["result"] for r in results] == [str(i) for i in range(10)]
+        assert [r["index"] for r in results] == list(range(10))
+        await toolkit.close()
+
+    async def test_failure_is_reported_per_item(self):
+        """A failed call should not abort the rest of the batch."""
+        toolkit = await make_toolkit()
+        calls = [
+            ("retrieve_invoice", {"id": 0}),
+            ("retrieve_invoice", {"id": 1, "fail": True}),
+            ("retrieve_invoice", {"id": 2}, "cus_123"),
+        ]
+
+        results = await toolkit.run_tools_batch(calls)
+
+        assert results[0]["result"] == "0"
+        assert results[1]["result"] is None
+        assert "failed 1" in str(results[1]["error"])
+        assert results[2]["error"] is None
+        await toolkit.close()
+
+    async def test_concurrency_is_capped(self):
+        """No more than max_concurrency calls should run at once."""
+        running = 0
+        peak = 0
+
+        async def tracking_call(name, args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+            return await echo_call(name, args)
+
+        toolkit = await make_toolkit(tracking_call)
+
+        await toolkit.run_tools_batch(
+            [("retrieve_invoice", {"id": i}) for i in range(30)],
+            max_concurrency=5,
+        )
+
+        assert peak == 5
+        await toolkit.close()
+
+    async def test_iterator_yields_as_completed(self):
+        """The async iterator should yield results in completion order."""
+        toolkit = await make_toolkit()
+        calls = [
+            ("retrieve_invoice", {"id": 0, "delay": 0.05}),
+            ("retrieve_invoice", {"id": 1}),
+        ]
+
+        order = [
+            item["index"] async for item in toolkit.iter_tools_batch(calls)
+        ]
+
+        assert order == [1, 0]
+        await toolkit.close()
+
+    async def test_batch_requires_initialize(self):
+        """Batch execution should require an initialized toolkit."""
+        toolkit = NameToolkit("rk_test_123")
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await toolkit.run_tools_batch([("list_customers", {})])
+
+
+class TestCatalogChanges:
+    """Tests for swapping tools when the catalog changes."""
+
+    async def test_tools_reconverted_on_catalog_change(self):
+        """A catalog change should swap in newly converted tools."""
+        toolkit = await make_toolkit()
+        assert toolkit.get_tools() == ["list_customers"]
+
+        toolkit._on_tools_changed([
+            {"name": "list_customers"},
+            {"name": "create_refund"},
+        ])
+
+        assert toolkit.get_tools() == ["list_customers", "create_refund"]
+        await toolkit.close()
+
+
+async def make_stub_toolkit(**stub_options):
+    stub_options.setdefault("tools", paginated_tools())
+    stub = StubMcpServer(seed=0, **stub_options)
+    toolkit = NameToolkit("rk_test_123")
+    toolkit.mcp_client._create_session = stub.memory_session
+    await toolkit.initialize()
+    return toolkit, stub
+
+
+class TestIterTool:
+    """Tests for auto-paginating tool iteration."""
+
+    async def test_follows_list_cursor(self):
+        """Every object should be yielded once, in order."""
+        toolkit, stub = await make_stub_toolkit(list_size=25)
+
+        ids = [
+            c["id"] async for c in toolkit.iter_tool(
+                "list_customers", {}, page_size=10
+            )
+        ]
+
+        assert len(ids) == 25 and len(set(ids)) == 25
+        assert ids == sorted(ids)
+        assert stub.calls == 3
+        await toolkit.close()
+
+    async def test_follows_search_cursor(self):
+        """Search tools should continue with next_page."""
+        toolkit, stub = await make_stub_toolkit(list_size=15)
+
+        items = [
+            item async for item in toolkit.iter_tool(
+                "search_stripe_resources", {"query": "email:'a'"},
+                page_size=10,
+            )
+        ]
+
+        assert len(items) == 15
+        assert stub.calls == 2
+        await toolkit.close()
+
+    async def test_max_items(self):
+        """max_items should bound what is yielded and fetched."""
+        toolkit, stub = await make_stub_toolkit(list_size=100)
+        requested = []
+        run_tool_result = toolkit.run_tool_result
+
+        async def recording(method, args, *rest, **kwargs):
+            requested.append(args.get("limit"))
+            return await run_tool_result(method, args, *rest, **kwargs)
+
+        toolkit.run_tool_result = recording
+
+        items = [
+            item async for item in toolkit.iter_tool(
+                "list_invoices", {}, max_items=12, page_size=10
+            )
+        ]
+
+        assert len(items) == 12
+        assert requested == [10, 2]
+        await toolkit.close()
+
+    async def test_prefetches_next_page(self):
+        """The next page should be requested before the consumer asks."""
+        toolkit, stub = await make_stub_toolkit(list_size=30)
+        iterator = toolkit.iter_tool("list_customers", {}, page_size=10)
+
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        assert stub.calls == 2
+
+        await iterator.aclose()
+        await asyncio.sleep(0.05)
+        assert stub.calls == 2
+        await toolkit.close()
+
+    async def test_without_prefetch(self):
+        """With prefetch off, pages should be fetched on demand."""
+        toolkit, stub = await make_stub_toolkit(list_size=30)
+        iterator = toolkit.iter_tool(
+            "list_customers", {}, page_size=10, prefetch=False
+        )
+
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        assert stub.calls == 1
+        await iterator.aclose()
+        await toolkit.close()
+
+    async def test_tool_without_cursor_yields_first_page(self):
+        """A list tool that cannot be paged should not refetch its page."""
+        toolkit, stub = await make_stub_toolkit(tools=None, list_size=25)
+
+        with pytest.warns(UserWarning, match="cannot be followed"):
+            ids = [
+                c["id"] async for c in toolkit.iter_tool(
+                    "list_customers", {}, page_size=10
+                )
+            ]
+
+        assert len(ids) == 10
+        assert stub.calls == 1
+        await toolkit.close()
+
+    async def test_max_items_on_first_page_does_not_warn(self):
+        """Stopping at max_items is not a cursor that was dropped."""
+        toolkit, _ = await make_stub_toolkit(tools=None, list_size=25)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            ids = [
+                c["id"] async for c in toolkit.iter_tool(
+                    "list_customers", {}, max_items=10
+                )
+            ]
+
+        assert len(ids) == 10
+        await toolkit.close()
+
+    def test_stalled_cursor_ends_iteration(self):
+        """A cursor the server did not advance should not be followed."""
+        page = {
+            "object": "list",
+            "data": [{"id": "cus_2"}],
+            "has_more": True,
+        }
+        arguments = {"limit", "starting_after"}
+
+        assert next_page_args({"limit": 1}, page, arguments) == {
+            "limit": 1, "starting_after": "cus_2"
+        }
+        assert next_page_args(
+            {"limit": 1, "starting_after": "cus_2"}, page, arguments
+        ) is None
+        assert next_page_args({"limit": 1}, page, {"limit"}) is None
+
+    async def test_non_list_tool(self):
+        """A tool that does not return a page should yield its result."""
+        toolkit, _ = await make_stub_toolkit()
+
+        items = [
+            item async for item in toolkit.iter_tool("retrieve_balance", {})
+        ]
+
+        assert len(items) == 1
+        assert items[0]["object"] == "balance"
+        await toolkit.close()
+
+
+class CountingToolkit(NameToolkit):
+    """Toolkit converting tools one at a time, counting conversions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.converted = []
+
+    def _convert_tools(self, mcp_tools: List[McpTool]) -> List[str]:
+        return [self._tool(t) for t in mcp_tools]
+
+    def _convert_tool(self, mcp_tool: McpTool) -> str:
+        self.converted.append(mcp_tool["name"])
+        return mcp_tool["name"].upper()
+
+
+class TestToolSelection:
+    """Tests for tool filtering and lazy conversion."""
+
+    async def make_toolkit(self, **tool_filter):
+        stub = StubMcpServer(seed=0)
+        toolkit = CountingToolkit("rk_test_123", {
+            "transport": stub.transport(),
+            "tool_filter": tool_filter,
+        })
+        await toolkit.initialize()
+        return toolkit
+
+    async def test_tools_converted_on_first_use(self):
+        """Only the tools asked for should be converted."""
+        toolkit = await self.make_toolkit()
+        assert toolkit.converted == []
+
+        assert toolkit.get_tool("list_customers") == "LIST_CUSTOMERS"
+        assert toolkit.get_tool("list_customers") == "LIST_CUSTOMERS"
+        assert toolkit.converted == ["list_customers"]
+
+        tools = toolkit.get_tools()
+        assert "LIST_CUSTOMERS" in tools
+        assert toolkit.converted.count("list_customers") == 1
+        assert toolkit.get_tools() is tools
+        await toolkit.close()
+
+    async def test_allow_and_deny_patterns(self):
+        """Tools should be filtered by glob patterns, deny winning."""
+        toolkit = await self.make_toolkit(
+            allow=["list_*", "retrieve_balance"], deny=["list_disputes"]
+        )
+
+        tools = toolkit.get_tools()
+
+        assert "RETRIEVE_BALANCE" in tools
+        assert "LIST_CUSTOMERS" in tools
+        assert "LIST_DISPUTES" not in tools
+        assert all(
+            t.startswith("LIST_") for t in tools if t != "RETRIEVE_BALANCE"
+        )
+        with pytest.raises(KeyError):
+            toolkit.get_tool("create_refund")
+        await toolkit.close()
+
+    async def test_catalog_change_drops_conversions(self):
+        """A new catalog should be converted afresh."""
+        toolkit = await self.make_toolkit(deny=["create_*"])
+        toolkit.get_tools()
+
+        toolkit._on_tools_changed([
+            {"name": "list_customers"},
+            {"name": "create_refund"},
+        ])
+
+        assert toolkit.get_tools() == ["LIST_CUSTOMERS"]
+        await toolkit.close()
+
+    async def test_get_tool_without_convert_tool(self):
+        """Toolkits without _convert_tool should convert via the batch."""
+        class BatchOnlyToolkit(ToolkitCore[List[str]]):
+            def _empty_tools(self) -> List[str]:
+                return []
+
+            def _convert_tools(self, mcp_tools):
+                return [t["name"].upper() for t in mcp_tools]
+
+        toolkit = BatchOnlyToolkit("rk_test_123")
+        make_fake_sessions(toolkit.mcp_client)
+        await toolkit.initialize()
+
+        assert toolkit.get_tool("list_customers") == "LIST_CUSTOMERS"
+        await toolkit.close()
+
+
+class TestCatalogRefresh:
+    """Tests for refreshing the catalog of a running toolkit."""
+
+    CATALOG = [
+        {"name": "list_customers", "description": "List customers"},
+        {"name": "list_invoices", "description": "List invoices"},
+        {"name": "create_refund", "description": "Create a refund"},
+    ]
+
+    async def make_toolkit(self, **configuration):
+        toolkit = CountingToolkit("rk_test_123", configuration)
+        make_fake_sessions(toolkit.mcp_client)
+        await toolkit.initialize()
+        toolkit._on_tools_changed(self.CATALOG)
+        return toolkit
+
+    async def test_only_changed_tools_reconverted(self):
+        """Unchanged tools should keep their conversions."""
+        toolkit = await self.make_toolkit()
+        toolkit.get_tools()
+        toolkit.converted.clear()
+        diffs = []
+        toolkit.add_tools_changed_hook(diffs.append)
+
+        toolkit._on_tools_changed([
+            {"name": "list_customers", "description": "List customers"},
+            {"name": "list_invoices", "description": "List all invoices"},
+            {"name": "create_payout", "description": "Create a payout"},
+        ])
+
+        assert toolkit.converted == ["list_invoices", "create_payout"]
+        assert toolkit.get_tools() == [
+            "LIST_CUSTOMERS", "LIST_INVOICES", "CREATE_PAYOUT"
+        ]
+        assert diffs == [{
+            "added": ["create_payout"],
+            "changed": ["list_invoices"],
+            "removed": ["create_refund"],
+        }]
+        await toolkit.close()
+
+    async def test_filtered_changes_are_ignored(self):
+        """Changes to hidden tools should not fire the hook."""
+        toolkit = await self.make_toolkit(tool_filter={"allow": ["list_*"]})
+        diffs = []
+        toolkit.add_tools_changed_hook(diffs.append)
+
+        toolkit._on_tools_changed(self.CATALOG[:2] + [
+            {"name": "create_refund", "description": "Refund a charge"},
+        ])
+
+        assert diffs == []
+        await toolkit.close()
+
+    async def test_periodic_refresh(self):
+        """The catalog should be re-listed every interval."""
+        toolkit = await self.make_toolkit(catalog_refresh_interval=0.02)
+        diffs = []
+        toolkit.add_tools_changed_hook(diffs.append)
+        toolkit.mcp_client._list_tools = AsyncMock(return_value=[
+            *self.CATALOG, {"name": "create_payout"}
+        ])
+
+        await asyncio.sleep(0.1)
+
+        assert toolkit.mcp_client._list_tools.await_count >= 2
+        assert diffs == [
+            {"added": ["create_payout"], "changed": [], "removed": []}
+        ]
+        assert "create_payout" in toolkit.mcp_client._tools_by_name
+        await toolkit.close()
+        assert toolkit.mcp_client._refresh_task is None
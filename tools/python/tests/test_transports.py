@@ -0,0 +1,103 @@
+"""Tests for the MCP transports."""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from stripe_agent_toolkit.shared.constants import MCP_SERVER_URL
+from stripe_agent_toolkit.shared.mcp_client import StripeMcpClient
+from stripe_agent_toolkit.shared.transports import (
+    InMemoryTransport,
+    Transport,
+    StdioTransport,
+    StreamableHttpTransport,
+)
+from stripe_agent_toolkit.testing import StubMcpServer
+
+# A stdio MCP server reporting the Stripe settings it was started with
+STDIO_SERVER = textwrap.dedent("""
+    import os
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("stdio-test")
+
+    @server.tool()
+    def retrieve_balance() -> str:
+        return os.environ["STRIPE_SECRET_KEY"] + "/" + os.environ.get(
+            "STRIPE_ACCOUNT", ""
+        )
+
+    server.run()
+""")
+
+
+class TestTransports:
+    """Tests for the built-in transports."""
+
+    def test_default_transport_is_http(self):
+        """Without a transport, the client should use the server URL."""
+        client = StripeMcpClient({"secret_key": "rk_test_123"})
+        assert isinstance(client._transport, StreamableHttpTransport)
+        assert client._transport.endpoint == MCP_SERVER_URL
+
+    def test_transport_is_abstract(self):
+        """Transports must provide an endpoint and connect()."""
+        with pytest.raises(TypeError):
+            Transport()
+
+    async def test_in_memory_transport(self):
+        """Pooled sessions should run over the in-memory transport."""
+        stub = StubMcpServer(seed=0, latency=0.01)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "transport": stub.transport(),
+            "pool": {"max_requests_per_session": 1},
+        })
+        await client.connect()
+
+        results = await asyncio.gather(*(
+            client.call_tool("list_customers", {"limit": i + 1})
+            for i in range(4)
+        ))
+
+        assert len(results) == 4
+        assert stub.calls == 4
+        assert client._pool.size > 1
+        await client.disconnect()
+
+    async def test_in_memory_fastmcp(self):
+        """FastMCP servers should be accepted directly."""
+        server = FastMCP("memory-test")
+
+        @server.tool()
+        def retrieve_balance() -> str:
+            return "ok"
+
+        transport = InMemoryTransport(server)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123", "transport": transport
+        })
+        await client.connect()
+
+        assert transport.endpoint.startswith("memory:memory-test@")
+        assert await client.call_tool("retrieve_balance", {}) == "ok"
+        await client.disconnect()
+
+    async def test_stdio_transport(self, tmp_path):
+        """A stdio server should get the key and account in its env."""
+        script = tmp_path / "server.py"
+        script.write_text(STDIO_SERVER)
+        client = StripeMcpClient({
+            "secret_key": "rk_test_123",
+            "account": "acct_123",
+            "transport": StdioTransport(sys.executable, [str(script)]),
+        })
+        await client.connect()
+
+        result = await client.call_tool("retrieve_balance", {})
+
+        assert result == "rk_test_123/acct_123"
+        await client.disconnect()